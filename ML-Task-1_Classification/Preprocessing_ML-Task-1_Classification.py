@@ -46,7 +46,12 @@ Every Dataset will be generated for electoral term 19, 20 and 19_20 combined.
     │   │   ├── data_set_<1-9>_20.xlsx
     │   │   ├── data_set_<1-9>_19_20.pkl
     │   │   ├── data_set_<1-9>_19.pkl
-    │   │   └── data_set_<1-9>_20.pkl
+    │   │   ├── data_set_<1-9>_20.pkl
+    │   │   ├── data_set_<1-9>_19_20.parquet
+    │   │   ├── data_set_<1-9>_19.parquet
+    │   │   ├── data_set_<1-9>_20.parquet
+    │   │   └── data_set_<1-9>_<19|20>_profile.csv
+    │   └── preprocessing_profile.csv
 
 columns (data_set_X_Y.pkl):
     | Column name                 | Description                                                      |
@@ -375,10 +380,29 @@ for term in terms:
 
     dataset_configs.update(dataset_configs_curr_term)
 
+# all configs share intermediate stage results (same input file, filters and stage parameters) via the stage cache
+# additional parquet export of every dataset (column-selective loading via preprocessing_pipeline.load_speech_data)
+for config in dataset_configs.values():
+    config.setdefault("stage_cache_dir", Path("dataPreprocessedStage/stageCache"))
+    config.setdefault("output_path_parquet", config["output_path_pickle"].with_suffix(".parquet"))
+
+# order the configs data set by data set with alternating terms: with two datasets in flight, the two running
+# configs read different input files, and a config mostly starts after the previous config of its term has
+# stored its stages in the stage cache (configs started at the same time can not share their prefixes)
+config_names_by_term = [[name for name in dataset_configs if name.endswith(f"term: {term}")] for term in terms]
+dataset_configs = {name: dataset_configs[name] for names in zip(*config_names_by_term) for name in names}
+
 # parallel execution
 if __name__ == "__main__":
     ensure_required_nlp_resources()
-    execute_parallel_preprocessing(dataset_configs)
+    # sharded mode: all cores work on the shards of at most two datasets at the same time, so the datasets run
+    # mostly one after the other and reuse the cached stages of the earlier ones
+    execute_parallel_preprocessing(
+        dataset_configs,
+        shard_size=2000,
+        n_datasets_in_flight=2,
+        profile_report_path=Path("dataPreprocessedStage/dataClassification/preprocessing_profile.csv"),
+    )
 
     # datasets
     data_set_numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, ]
@@ -394,5 +418,10 @@ if __name__ == "__main__":
 
         # combine datasets
         combine_two_datasets(input_path_a=input_path_19, input_path_b=input_path_20, output_path=output_path_19_20)
+        combine_two_datasets(
+            input_path_a=input_path_19.replace(".pkl", ".parquet"),
+            input_path_b=input_path_20.replace(".pkl", ".parquet"),
+            output_path=output_path_19_20.replace(".pkl", ".parquet")
+        )
 
 
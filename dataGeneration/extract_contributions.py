@@ -10,6 +10,9 @@ The goal is to isolate speaker contributions and normalize them for NLP tasks.
 import pandas as pd
 import regex
 import copy
+import json
+from array import array
+from collections import OrderedDict
 
 
 """
@@ -102,6 +105,21 @@ base_disturbance_Pattern = (
     r"(?P<delete>[Uu]nruhe" + prefix_Pattern + suffix_Pattern + r")"
 )
 
+# Trigger Patterns for the dispatch in extract:
+# Every match of an extractor contains at least one of its triggers. The triggers contain no whitespace,
+# so they can not be created by the " " replacements of preceding extractors.
+contribution_trigger_Patterns = {
+    "applause": r"Beifall",
+    "colon": r":",  # person interjections and faction shouts
+    "shout": r"[Rr]uf",
+    "cheerfulness": r"Heiterkeit",
+    "objection": r"Widerspruch",
+    "laughter": r"Lachen",
+    "approval": r"Sehr|Zustimmung|Bravo",
+    "interruption": r"Unterbrechung",
+    "disturbance": r"[Uu]nruhe",
+}
+
 # Modular Pattern Dictionary:
 # Two different versions based on session formatting changes
 name_Pattern = {
@@ -135,6 +153,450 @@ name_Pattern = {
 }
 
 
+"""
+Compiled Pattern Registry: every pattern is built and compiled once per name_Pattern_id and then reused
+"""
+
+
+# Extension of the opening bracket pattern for shouts (e.g. "Heiterkeit und Zurufe")
+shout_opening_bracket_extension_Pattern = r"|(?<=[Hh]eiterkeit\s)|(?<=[Ll]achen\s)|(?<=[Ww]eiterer\s)|(?<=[Ww]eitere\s)|(?<=[Ee]rneuter\s)|(?<=[Ee]rneute\s)|(?<=[Ff]ortgesetzte\s)|(?<=[Ll]ebhafte\s)|(?<=[Ww]eitere\s[Ll]ebhafte\s|(?<=Andauernde\s)|(?<=Fortdauernde\s))"
+
+
+def get_name_pattern_id(session):
+    """
+    Returns the id of the name pattern (row in name_Pattern) matching the formatting of a session.
+
+    :param session (int): Bundestag session number.
+    :return name_Pattern_id (int): 1 for sessions before 7115, else 0.
+    """
+    return 1 if session < 7115 else 0
+
+
+def build_contribution_pattern(base_Pattern, opening_extension="", closing_extension=""):
+    """
+    Surrounds a base pattern with the opening and closing bracket patterns of contributions.
+
+    :param base_Pattern (str): Pattern of the contribution itself.
+    :param opening_extension (str): Extension of start_contributions_opening_bracket_Pattern.
+    :param closing_extension (str): Extension of start_contributions_closing_bracket_Pattern.
+    :return (str): The complete pattern.
+    """
+    return (
+        start_contributions_opening_bracket_Pattern.format(opening_extension)
+        + base_Pattern
+        + start_contributions_closing_bracket_Pattern.format(closing_extension)
+    )
+
+
+def build_name_pattern(name_Pattern_id):
+    """
+    Returns the name pattern of a name_Pattern_id with the bracket patterns inserted.
+
+    :param name_Pattern_id (int): Row in name_Pattern.
+    :return (str): The name pattern.
+    """
+    return name_Pattern[name_Pattern_id].format(
+        opening_bracket_Pattern,
+        closing_bracket_Pattern,
+    )
+
+
+# Pattern builders: pattern name -> function building the pattern string for a name_Pattern_id
+pattern_builders = {
+    # extract
+    "bracket": lambda name_Pattern_id: r"\(([^(\)]*(\(([^(\)]*)\))*[^(\)]*)\)",
+    "parentheses": lambda name_Pattern_id: r"[()]",
+    "whitespace": lambda name_Pattern_id: r"\s+",
+    # clean_person_name
+    "name_newline": lambda name_Pattern_id: r"\n",
+    "name_shout_prefix": lambda name_Pattern_id: r"(Gegenrufe?\sdes\s|Gegenrufe?\sder\s|Zurufe?\sdes\s|Zurufe?\sder\s)(Abg\s?\.\s)*",
+    "name_abg": lambda name_Pattern_id: r"(Abg\s?\.\s?|Abgeordneten\s)",
+    "name_article": lambda name_Pattern_id: r"(^\s?der\s?|^\s?die\s?|^\s?das\s?|^\s?von\s?)",
+    # extract_initiators
+    "other_contributions": lambda name_Pattern_id: r"(?P<type>[Bb]eifall|[Zz]uruf|[Gg]egenruf|[Rr]uf|[Hh]eiterkeit|[Ww]iderspruch|[Ll]achen|[Zz]ustimmung|[Uu]nterbrechung|[Uu]nruhe)(?P<initiators>(?:(?!\s[-––]\s).)*)\s*",
+    "first_person_search": lambda name_Pattern_id: r"Abg\s?\.\s?{}(?:(?<=!:)|(?!:))".format(build_name_pattern(name_Pattern_id)),
+    "second_person_search": lambda name_Pattern_id: r"(?:\sund|sowie\sdes)\s+(?:des|der)?{}(?:(?<=!:)|(?!:))".format(build_name_pattern(name_Pattern_id)),
+    "zwischenfrage": lambda name_Pattern_id: "[Zz]wischenfrage",
+    "left_right": lambda name_Pattern_id: left_right_Pattern,
+    "government": lambda name_Pattern_id: r"[Rr]egierungspar[^\s]+",
+    # extractors
+    "applause": lambda name_Pattern_id: build_contribution_pattern(base_applause_Pattern),
+    "person_interjection": lambda name_Pattern_id: build_contribution_pattern(
+        base_person_interjection_Pattern.format(
+            (r"(?:Abg\s?\.\s?)" if name_Pattern_id == 1 else "") + build_name_pattern(name_Pattern_id)
+        )
+    ),
+    "shout": lambda name_Pattern_id: build_contribution_pattern(
+        base_shout_Pattern.format(
+            r"\s*Abg\s?\.\s?{}".format(build_name_pattern(name_Pattern_id)),
+            text_Pattern.format("").replace("{}", "{{}}"),
+        ),
+        opening_extension=shout_opening_bracket_extension_Pattern,
+    ),
+    "faction_shout": lambda name_Pattern_id: build_contribution_pattern(
+        r"(?P<delete>(?P<initiator>"
+        + text_Pattern.format("").replace("{}", "{{}}")
+        + r"+):\s*(?P<content>"
+        + text_Pattern
+        + r"+))",
+        opening_extension=shout_opening_bracket_extension_Pattern,
+    ),
+    "cheerfulness": lambda name_Pattern_id: build_contribution_pattern(base_cheerfulness_Pattern),
+    "objection": lambda name_Pattern_id: build_contribution_pattern(base_objection_Pattern),
+    "laughter": lambda name_Pattern_id: build_contribution_pattern(base_laughter_Pattern, closing_extension=r"|\sund\sZurufe\)"),
+    "approval": lambda name_Pattern_id: build_contribution_pattern(base_approval_Pattern),
+    "interruption": lambda name_Pattern_id: build_contribution_pattern(base_interruption_Pattern),
+    "disturbance": lambda name_Pattern_id: build_contribution_pattern(base_disturbance_Pattern),
+    # dispatch in extract
+    "contribution_triggers": lambda name_Pattern_id: "|".join(
+        "(?P<{}>{})".format(trigger, trigger_Pattern)
+        for trigger, trigger_Pattern in contribution_trigger_Patterns.items()
+    ),
+    # combined faction pattern (named group "faction<i>" for the i-th entry in parties, see match_factions)
+    "factions": lambda name_Pattern_id: "|".join(
+        r"(?<!\[)(?P<faction{}>".format(faction_index) + party_Pattern + r")(?![^[\s]*\])"
+        for faction_index, party_Pattern in enumerate(parties.values())
+    ),
+    # one faction search pattern per entry in parties
+    **{
+        "faction " + faction: (lambda name_Pattern_id, party_Pattern=party_Pattern: r"(?<!\[)(" + party_Pattern + r")(?![^[\s]*\])")
+        for faction, party_Pattern in parties.items()
+    },
+}
+
+# Compiled patterns: (pattern name, name_Pattern_id) -> compiled pattern
+compiled_Patterns = {}
+
+# Counters of the registry: (pattern name, name_Pattern_id) -> number of compilations / searches / matches / timeouts
+pattern_statistics = {"compiled": {}, "searches": {}, "matches": {}, "timeouts": {}}
+
+# Time limit of one search with a registry pattern in seconds (None: no limit), protects against catastrophic
+# backtracking on OCR-noisy brackets (see extract and quarantine_bracket)
+pattern_timeout = 2.0
+
+
+def get_compiled_pattern(name, name_Pattern_id=0):
+    """
+    Returns the compiled pattern of the registry and compiles it on first use.
+
+    :param name (str): Name of the pattern in pattern_builders.
+    :param name_Pattern_id (int): Row in name_Pattern (see get_name_pattern_id), only relevant for name based patterns.
+    :return (regex.Pattern): The compiled pattern.
+    """
+    key = (name, name_Pattern_id)
+    compiled = compiled_Patterns.get(key)
+    if compiled is None:
+        compiled = compiled_Patterns[key] = regex.compile(pattern_builders[name](name_Pattern_id))
+        pattern_statistics["compiled"][key] = pattern_statistics["compiled"].get(key, 0) + 1
+    return compiled
+
+
+def count_pattern_use(name, name_Pattern_id, matches):
+    """
+    Counts one search with a registry pattern and the number of matches it found.
+
+    :param name (str): Name of the pattern in pattern_builders.
+    :param name_Pattern_id (int): Row in name_Pattern.
+    :param matches (int): Number of matches of the search.
+    """
+    key = (name, name_Pattern_id)
+    pattern_statistics["searches"][key] = pattern_statistics["searches"].get(key, 0) + 1
+    pattern_statistics["matches"][key] = pattern_statistics["matches"].get(key, 0) + matches
+
+
+def pattern_timeout_error(name, name_Pattern_id=0):
+    """
+    Counts a timeout of a registry pattern and returns the error to raise.
+
+    :param name (str): Name of the pattern in pattern_builders.
+    :param name_Pattern_id (int): Row in name_Pattern.
+    :return (TimeoutError): Error naming the pattern.
+    """
+    key = (name, name_Pattern_id)
+    pattern_statistics["timeouts"][key] = pattern_statistics["timeouts"].get(key, 0) + 1
+    return TimeoutError("pattern '{}' timed out after {} s".format(name, pattern_timeout))
+
+
+def find_all(name, text, name_Pattern_id=0):
+    """
+    Returns all matches of a registry pattern (like list(regex.finditer(pattern, text))).
+
+    :param name (str): Name of the pattern in pattern_builders.
+    :param text (str): Text to search in.
+    :param name_Pattern_id (int): Row in name_Pattern.
+    :return (list): The matches.
+    """
+    try:
+        matches = list(get_compiled_pattern(name, name_Pattern_id).finditer(text, timeout=pattern_timeout))
+    except TimeoutError:
+        raise pattern_timeout_error(name, name_Pattern_id) from None
+    count_pattern_use(name, name_Pattern_id, len(matches))
+    return matches
+
+
+def search(name, text, name_Pattern_id=0):
+    """
+    Returns the first match of a registry pattern (like regex.search(pattern, text)).
+
+    :param name (str): Name of the pattern in pattern_builders.
+    :param text (str): Text to search in.
+    :param name_Pattern_id (int): Row in name_Pattern.
+    :return (regex.Match): The match or None.
+    """
+    try:
+        match = get_compiled_pattern(name, name_Pattern_id).search(text, timeout=pattern_timeout)
+    except TimeoutError:
+        raise pattern_timeout_error(name, name_Pattern_id) from None
+    count_pattern_use(name, name_Pattern_id, 1 if match else 0)
+    return match
+
+
+def substitute(name, replacement, text, name_Pattern_id=0):
+    """
+    Replaces all matches of a registry pattern (like regex.sub(pattern, replacement, text)).
+
+    :param name (str): Name of the pattern in pattern_builders.
+    :param replacement (str): Replacement string.
+    :param text (str): Text to search in.
+    :param name_Pattern_id (int): Row in name_Pattern.
+    :return (str): The text with all matches replaced.
+    """
+    try:
+        text, matches = get_compiled_pattern(name, name_Pattern_id).subn(replacement, text, timeout=pattern_timeout)
+    except TimeoutError:
+        raise pattern_timeout_error(name, name_Pattern_id) from None
+    count_pattern_use(name, name_Pattern_id, matches)
+    return text
+
+
+def find_contribution_types(text):
+    """
+    Returns the triggers (keys of contribution_trigger_Patterns) occurring in a text with one scan.
+
+    :param text (str): Text of the contribution bracket.
+    :return (set): Names of the found triggers.
+    """
+    try:
+        matches = list(
+            get_compiled_pattern("contribution_triggers").finditer(text, overlapped=True, timeout=pattern_timeout)
+        )
+    except TimeoutError:
+        raise pattern_timeout_error("contribution_triggers") from None
+    count_pattern_use("contribution_triggers", 0, len(matches))
+    return {match.lastgroup for match in matches}
+
+
+def find_brackets(text):
+    """
+    Returns the spans of the contribution brackets of a text: same matches as the "bracket" pattern
+    (a bracket with any number of directly consecutive brackets inside, no deeper nesting) but found with
+    one sweep over the parentheses of the text.
+
+    :param text (str): Speech text.
+    :return (list): Spans (start, end) of the brackets including the parentheses, in text order.
+    """
+    parentheses = find_all("parentheses", text)
+    positions = [match.start() for match in parentheses]
+    characters = "".join(match.group() for match in parentheses)
+    count = len(characters)
+
+    spans = []
+    start_index = 0
+    while start_index < count:
+        if characters[start_index] != "(":
+            start_index += 1
+            continue
+        # Skip the brackets inside (only the first one may follow text), the next parenthesis has to close the bracket
+        index = start_index + 1
+        while (
+            index + 1 < count
+            and characters[index] == "("
+            and characters[index + 1] == ")"
+            and (index == start_index + 1 or positions[index] == positions[index - 1] + 1)
+        ):
+            index += 2
+        if index < count and characters[index] == ")":
+            spans.append((positions[start_index], positions[index] + 1))
+            start_index = index + 1
+        else:
+            # No match starting here, try the next opening parenthesis
+            start_index += 1
+    return spans
+
+
+def search_factions(initiators, position=0):
+    """
+    Searches the leftmost faction mention of an initiator string with the combined faction pattern.
+
+    :param initiators (str): Initiator string.
+    :param position (int): Position to start the search at.
+    :return (regex.Match, int): The match (or None) and the index in parties of the first faction
+        matching at its position (or None).
+    """
+    try:
+        match = get_compiled_pattern("factions").search(initiators, position, timeout=pattern_timeout)
+    except TimeoutError:
+        raise pattern_timeout_error("factions") from None
+    count_pattern_use("factions", 0, 1 if match else 0)
+    if match is None:
+        return None, None
+    return match, int(match.lastgroup[len("faction"):])
+
+
+def match_factions(initiators):
+    """
+    Finds the factions mentioned in an initiator string. Same result as searching the pattern of every
+    faction in parties (in this order) and removing its first match from the string (see
+    match_factions_sequential), but the combined faction pattern finds the leftmost mention first:
+    without a mention no faction is searched, the searches start at the leftmost mention and the
+    faction matching there is not searched again.
+
+    :param initiators (str): Initiator string.
+    :return (list, str): Found factions (in the order of parties) and the initiators with the matches removed.
+    """
+    factions = []
+    leftmost_match, leftmost_faction_index = search_factions(initiators)
+
+    for faction_index, faction in enumerate(parties):
+        # No faction mentioned (anymore)
+        if leftmost_match is None:
+            break
+        if faction_index == leftmost_faction_index:
+            faction_match = leftmost_match.group("faction{}".format(faction_index))
+        else:
+            # No faction matches before the leftmost mention
+            try:
+                position_match = get_compiled_pattern("faction " + faction).search(
+                    initiators, leftmost_match.start(), timeout=pattern_timeout
+                )
+            except TimeoutError:
+                raise pattern_timeout_error("faction " + faction) from None
+            faction_match = position_match.group() if position_match else None
+        if faction_match is not None:
+            # Remove the faction from the search text and search the leftmost mention again
+            initiators = initiators.replace(faction_match, "")
+            factions.append(faction)
+            leftmost_match, leftmost_faction_index = search_factions(initiators)
+
+    return factions, initiators
+
+
+def match_factions_sequential(initiators):
+    """
+    Reference implementation of match_factions: searches every faction in parties separately.
+
+    :param initiators (str): Initiator string.
+    :return (list, str): Found factions (in the order of parties) and the initiators with the matches removed.
+    """
+    factions = []
+    for faction in parties:
+        faction_match = get_compiled_pattern("faction " + faction).search(initiators)
+        if faction_match:
+            initiators = initiators.replace(faction_match.group(), "")
+            factions.append(faction)
+    return factions, initiators
+
+
+# Fixture corpus for check_faction_matcher: faction mentions (also OCR noise, brackets and old factions)
+faction_fixture_mentions = [
+    "der AfD", "der Alternative für Deutschland", "der CDU/CSU", "der C D U / C S U", "der CDU/ CSU-Hosp.",
+    "der SPD", "der SPD-Gast", "der FDP", "der F.D.P.", "dem BÜNDNIS 90/DIE GRÜNEN", "des BÜNDNISSES 90/DIE GRÜNEN",
+    "den Grünen", "der GRÜNEN", "der DIE LINKE", "der LINKEN", "der LIN KEN", "der PDS/Linke Liste", "der Gruppe der PDS",
+    "fraktionslos", "Parteilos", "des GB/BHE", "der BHE-DG", "der DP", "der KPD", "dem Zentrum", "der BP",
+    "der Bayernpartei", "der FU", "der WAV", "der DRP-Hosp.", "der FVP", "des SSW", "der SRP", "der DA", "Gast",
+    "der DBP", "der NR", "des Abg. Müller [SPD]", "[CDU/CSU]", "Abg. Dr. Schmidt [FDP]",
+]
+faction_fixture_connectors = [" und ", " sowie bei Abgeordneten ", ", ", " – ", "", " und bei ", "/"]
+
+
+def check_faction_matcher(initiators_list=None, size=5000, seed=0):
+    """
+    Regression check of match_factions against the loop over all parties (match_factions_sequential).
+
+    :param initiators_list (list): Initiator strings to compare, if None a fixture corpus of random
+        combinations of faction_fixture_mentions and faction_fixture_connectors is generated.
+    :param size (int): Number of initiator strings of the generated fixture corpus.
+    :param seed (int): Seed of the generated fixture corpus.
+    :return (list): Mismatches as (initiators, result of match_factions, result of match_factions_sequential).
+    """
+    if initiators_list is None:
+        import random
+
+        rng = random.Random(seed)
+        initiators_list = []
+        for _ in range(size):
+            mentions = rng.sample(faction_fixture_mentions, rng.randint(1, 4))
+            initiators = mentions[0]
+            for mention in mentions[1:]:
+                initiators += rng.choice(faction_fixture_connectors) + mention
+            initiators_list.append(" bei " + initiators if rng.random() < 0.5 else initiators)
+
+    mismatches = []
+    for initiators in initiators_list:
+        combined = match_factions(initiators)
+        sequential = match_factions_sequential(initiators)
+        if combined != sequential:
+            mismatches.append((initiators, combined, sequential))
+    return mismatches
+
+
+def check_bracket_scanner(texts=None, size=20000, seed=0):
+    """
+    Regression check of find_brackets against the "bracket" pattern.
+
+    :param texts (list): Texts to compare, if None random texts of parentheses, letters and whitespace are generated.
+    :param size (int): Number of generated texts.
+    :param seed (int): Seed of the generated texts.
+    :return (list): Mismatches as (text, spans of find_brackets, spans of the "bracket" pattern).
+    """
+    if texts is None:
+        import random
+
+        rng = random.Random(seed)
+        texts = ["".join(rng.choice("(()) ab\n") for _ in range(rng.randint(0, 40))) for _ in range(size)]
+
+    mismatches = []
+    for text in texts:
+        scanned = find_brackets(text)
+        matched = [bracket.span() for bracket in get_compiled_pattern("bracket").finditer(text)]
+        if scanned != matched:
+            mismatches.append((text, scanned, matched))
+    return mismatches
+
+
+def get_pattern_statistics():
+    """
+    Returns the counters of the pattern registry.
+
+    :return (pd.DataFrame): One row per pattern and name_Pattern_id with the columns
+        pattern, name_Pattern_id, compiled, searches, matches, timeouts (sorted by searches).
+    """
+    keys = sorted(
+        set(pattern_statistics["compiled"]) | set(pattern_statistics["searches"]) | set(pattern_statistics["timeouts"])
+    )
+    statistics = pd.DataFrame(
+        {
+            "pattern": [key[0] for key in keys],
+            "name_Pattern_id": [key[1] for key in keys],
+            "compiled": [pattern_statistics["compiled"].get(key, 0) for key in keys],
+            "searches": [pattern_statistics["searches"].get(key, 0) for key in keys],
+            "matches": [pattern_statistics["matches"].get(key, 0) for key in keys],
+            "timeouts": [pattern_statistics["timeouts"].get(key, 0) for key in keys],
+        }
+    )
+    return statistics.sort_values("searches", ascending=False, ignore_index=True)
+
+
+def reset_pattern_statistics():
+    """
+    Resets the search, match and timeout counters of the pattern registry (compiled patterns are kept).
+    """
+    pattern_statistics["searches"].clear()
+    pattern_statistics["matches"].clear()
+    pattern_statistics["timeouts"].clear()
+
+
+
 def get_government_factions(electoral_term):
     """
     Returns the government factions for a given legislative period electoral_term.
@@ -185,17 +647,13 @@ def clean_person_name(name_raw):
     :return name_raw (str): Cleaned version of the name.
     """
     # Remove any newlines from the name_raw
-    name_raw = regex.sub(r"\n", " ", convert_to_string(name_raw))
+    name_raw = substitute("name_newline", " ", convert_to_string(name_raw))
     # Remove any Additional stuff
-    name_raw = regex.sub(
-        r"(Gegenrufe?\sdes\s|Gegenrufe?\sder\s|Zurufe?\sdes\s|Zurufe?\sder\s)(Abg\s?\.\s)*",
-        "",
-        name_raw,
-    )
+    name_raw = substitute("name_shout_prefix", "", name_raw)
     # Remove 'Abg.', 'Abgeordneten'
-    name_raw = regex.sub(r"(Abg\s?\.\s?|Abgeordneten\s)", "", name_raw)
+    name_raw = substitute("name_abg", "", name_raw)
     # Remove definite articles or 'von'
-    name_raw = regex.sub(r"(^\s?der\s?|^\s?die\s?|^\s?das\s?|^\s?von\s?)", "", name_raw)
+    name_raw = substitute("name_article", "", name_raw)
     # Remove whitespaces at the beginning and at the end
     name_raw = name_raw.lstrip(" ").rstrip(" ")
 
@@ -203,35 +661,262 @@ def clean_person_name(name_raw):
     return name_raw
 
 
+class ContributionBuffer:
+    """
+    Columnar buffer for extracted contributions (replaces the dict of lists frame).
+
+    Speech ids and text positions are stored in integer arrays, type and faction as integer codes into
+    their categories. The raw names are only cleaned (clean_person_name) when the buffer is materialized,
+    once per distinct name. Filling one buffer for a whole session (or batch) creates a single DataFrame
+    instead of one per speech.
+    """
+
+    columns = ["id", "type", "name_raw", "faction", "constituency", "content", "text_position"]
+
+    def __init__(self):
+        # Cleaned names: name_raw -> clean_person_name(name_raw), kept over flushes
+        self.cleaned_names = {}
+        # Categories of the type and faction codes
+        self.types = []
+        self.type_codes = {}
+        self.factions = []
+        self.faction_codes = {}
+        self.clear()
+
+    def clear(self):
+        """
+        Removes all rows (the categories and cleaned names are kept).
+        """
+        self.ids = array("q")
+        self.type_column = array("l")
+        self.name_raw_column = []
+        self.faction_column = array("l")
+        self.constituency_column = []
+        self.content_column = []
+        self.text_position_column = array("q")
+
+    def __len__(self):
+        return len(self.ids)
+
+    def get_code(self, value, categories, codes):
+        """
+        Returns the code of a category value and adds unknown values to the categories.
+
+        :param value (str): Category value.
+        :param categories (list): Categories (code -> value).
+        :param codes (dict): Codes (value -> code).
+        :return (int): The code.
+        """
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(categories)
+            categories.append(value)
+        return code
+
+    def append(self, id, type, name_raw, faction, constituency, content, text_position):
+        """
+        Appends a contribution (see add_entry).
+        """
+        self.ids.append(int(id))
+        self.type_column.append(self.get_code(type, self.types, self.type_codes))
+        self.name_raw_column.append(name_raw)
+        self.faction_column.append(self.get_code(convert_to_string(faction), self.factions, self.faction_codes))
+        self.constituency_column.append(convert_to_string(constituency))
+        self.content_column.append(convert_to_string(content))
+        self.text_position_column.append(int(text_position))
+
+    def get_entries(self, start):
+        """
+        Returns the rows from start on without speech id and text position (see extend_entries).
+
+        :param start (int): First row.
+        :return (list): Rows as (type, name_raw, faction, constituency, content).
+        """
+        return [
+            (
+                self.types[self.type_column[row]],
+                self.name_raw_column[row],
+                self.factions[self.faction_column[row]],
+                self.constituency_column[row],
+                self.content_column[row],
+            )
+            for row in range(start, len(self.ids))
+        ]
+
+    def extend_entries(self, id, entries, text_position):
+        """
+        Appends rows of get_entries with a speech id and text position.
+
+        :param id (int): ID of the speech.
+        :param entries (list): Rows as (type, name_raw, faction, constituency, content).
+        :param text_position (int): Position index within the speech content.
+        """
+        for type, name_raw, faction, constituency, content in entries:
+            self.append(id, type, name_raw, faction, constituency, content, text_position)
+
+    def truncate(self, length):
+        """
+        Removes all rows after the first length rows (e.g. of a speech whose extraction failed).
+
+        :param length (int): Number of rows to keep.
+        """
+        for column in (
+            self.ids,
+            self.type_column,
+            self.name_raw_column,
+            self.faction_column,
+            self.constituency_column,
+            self.content_column,
+            self.text_position_column,
+        ):
+            del column[length:]
+
+    def to_frame(self, categorical=False):
+        """
+        Materializes the buffer as DataFrame with the columns of the former frame dictionary. The frame has
+        a RangeIndex over all buffered rows (0..n-1 for a whole session), while concatenating one frame per
+        speech gave every speech its own 0..k index, i.e. duplicate labels within a session.
+
+        :param categorical (bool): Return type and faction as pandas categoricals instead of strings.
+        :return (pd.DataFrame): The contributions.
+        """
+        # Clean every distinct name only once
+        for name_raw in set(self.name_raw_column):
+            if name_raw not in self.cleaned_names:
+                self.cleaned_names[name_raw] = clean_person_name(name_raw)
+
+        if categorical:
+            type_column = pd.Categorical.from_codes(self.type_column, categories=self.types)
+            faction_column = pd.Categorical.from_codes(self.faction_column, categories=self.factions)
+        else:
+            type_column = [self.types[code] for code in self.type_column]
+            faction_column = [self.factions[code] for code in self.faction_column]
+
+        return pd.DataFrame(
+            {
+                "id": self.ids.tolist(),
+                "type": type_column,
+                "name_raw": [self.cleaned_names[name_raw] for name_raw in self.name_raw_column],
+                "faction": faction_column,
+                "constituency": self.constituency_column.copy(),
+                "content": self.content_column.copy(),
+                "text_position": self.text_position_column.tolist(),
+            },
+            columns=self.columns,
+        )
+
+    def flush(self, categorical=False):
+        """
+        Materializes the buffer (see to_frame) and removes all rows.
+
+        :param categorical (bool): Return type and faction as pandas categoricals instead of strings.
+        :return (pd.DataFrame): The contributions.
+        """
+        frame = self.to_frame(categorical)
+        self.clear()
+        return frame
+
+
 def add_entry(frame, id, type, name_raw, faction, constituency, content, text_position):
     """
     Appends a new contribution entry (shout, interjection, etc.) to the frame.
 
-    :param frame (dict): Dictionary of lists representing the dataframe to be built.
+    :param frame (ContributionBuffer): Buffer of the contributions to be built.
     :param id (int): ID of the speech to which this contribution belongs.
     :param type (str): Type of contribution (e.g., 'Zuruf', 'Beifall').
-    :param name_raw (str): Raw name of the speaker or interjector.
+    :param name_raw (str): Raw name of the speaker or interjector (cleaned when the buffer is materialized).
     :param faction (str): Affiliated political party or group.
     :param constituency (str): Additional location/mandate information.
     :param content (str): Spoken content of the contribution.
     :param text_position (int): Position index within the speech content.
-    :return frame (dict): Updated contribution dictionary.
+    :return frame (ContributionBuffer): Updated contribution buffer.
     """
-    # Append the corresponding variables to the dictionary
-    frame["id"].append(id)
-    frame["type"].append(type)
-    frame["name_raw"].append(clean_person_name(name_raw))
-    frame["faction"].append(convert_to_string(faction))
-    frame["constituency"].append(convert_to_string(constituency))
-    frame["content"].append(convert_to_string(content))
-    frame["text_position"].append(int(text_position))
+    # Append the corresponding variables to the buffer
+    frame.append(id, type, name_raw, faction, constituency, content, text_position)
 
     # Return the frame
     return frame
 
 
+# Cache of extract_initiators: (initiators, name_Pattern_id, electoral_term, type) -> (entries, remaining initiators)
+initiators_cache = OrderedDict()
+# Maximum number of cached initiator strings (least recently used ones are removed, 0 disables the cache)
+initiators_cache_size = 100000
+# Counters of the cache
+initiators_cache_statistics = {"hits": 0, "misses": 0, "evictions": 0}
+
+
 def extract_initiators(
     initiators, electoral_term, session, identity, text_position, frame, type
+):
+    """
+    Extracts and classifies initiators (speakers or parties) of a speech contribution (see
+    parse_initiators). The entries of an initiator string only depend on the string, the name pattern,
+    the electoral term and the type, so they are cached and replayed with the id and text position.
+
+    :param initiators (str): The raw initiator string extracted from a contribution.
+    :param electoral_term (int): The electoral term number (used to resolve government factions).
+    :param session (int): Bundestag session number (used to distinguish formatting).
+    :param identity (int): Unique speech or contribution ID.
+    :param text_position (int): Position of contribution in speech.
+    :param frame (ContributionBuffer): Buffer to append new contribution entries to.
+    :param type (str): Type of contribution (e.g., 'Beifall', 'Zuruf').
+    :return: tuple: (Updated frame, remaining unmatched initiator string)
+    """
+    if not initiators_cache_size:
+        return parse_initiators(initiators, electoral_term, session, identity, text_position, frame, type)
+
+    key = (initiators, get_name_pattern_id(session), electoral_term, type)
+    cached = initiators_cache.get(key)
+    if cached is not None:
+        initiators_cache_statistics["hits"] += 1
+        initiators_cache.move_to_end(key)
+        entries, initiators = cached
+        frame.extend_entries(identity, entries, text_position)
+        return frame, initiators
+
+    initiators_cache_statistics["misses"] += 1
+    frame_length = len(frame)
+    frame, remaining_initiators = parse_initiators(
+        initiators, electoral_term, session, identity, text_position, frame, type
+    )
+    initiators_cache[key] = (frame.get_entries(frame_length), remaining_initiators)
+    if len(initiators_cache) > initiators_cache_size:
+        initiators_cache.popitem(last=False)
+        initiators_cache_statistics["evictions"] += 1
+    return frame, remaining_initiators
+
+
+def get_initiators_cache_statistics():
+    """
+    Returns the counters of the extract_initiators cache.
+
+    :return (dict): hits, misses, evictions, hit_rate and size (number of cached initiator strings).
+    """
+    lookups = initiators_cache_statistics["hits"] + initiators_cache_statistics["misses"]
+    return {
+        **initiators_cache_statistics,
+        "hit_rate": initiators_cache_statistics["hits"] / lookups if lookups else 0.0,
+        "size": len(initiators_cache),
+    }
+
+
+def clear_initiators_cache(size=None):
+    """
+    Removes all entries and resets the counters of the extract_initiators cache.
+
+    :param size (int): New maximum number of cached initiator strings (default: keep the current one).
+    """
+    global initiators_cache_size
+    if size is not None:
+        initiators_cache_size = size
+    initiators_cache.clear()
+    for counter in initiators_cache_statistics:
+        initiators_cache_statistics[counter] = 0
+
+
+def parse_initiators(
+    initiators, electoral_term, session, identity, text_position, frame, type
 ):
     """
     Extracts and classifies initiators (speakers or parties) of a speech contribution.
@@ -253,10 +938,7 @@ def extract_initiators(
     """
     initiators_not_removed = copy.copy(initiators)
     # Remove wrongly placed contributions (e.g. "Beifall" inside a shout) from initiators and pass them recursively
-    other_contributions = regex.search(
-        r"(?P<type>[Bb]eifall|[Zz]uruf|[Gg]egenruf|[Rr]uf|[Hh]eiterkeit|[Ww]iderspruch|[Ll]achen|[Zz]ustimmung|[Uu]nterbrechung|[Uu]nruhe)(?P<initiators>(?:(?!\s[-––]\s).)*)\s*",
-        initiators,
-    )
+    other_contributions = search("other_contributions", initiators)
     if other_contributions:
         frame, _ = methods[other_contributions.group("type").lower()](
             "(" + other_contributions.group() + ")",
@@ -268,30 +950,16 @@ def extract_initiators(
         )
         initiators = initiators.replace(other_contributions.group(), "")
 
-    if session < 7115:
-        # Set name pattern to the second name pattern (second row in name_Pattern)
-        name_Pattern_id = 1
-    else:
-        # Set name pattern to the first name pattern (first row in name_Pattern)
-        name_Pattern_id = 0
-
-    # Create the first_person_search_Pattern (looking for key Abg.)
-    first_person_search_Pattern = r"Abg\s?\.\s?{}(?:(?<=!:)|(?!:))".format(
-        name_Pattern[name_Pattern_id].format(
-            opening_bracket_Pattern,
-            closing_bracket_Pattern,
-        )
-    )
-    # Find match
-    first_person_match = regex.search(
-        first_person_search_Pattern,
-        initiators,
-    )
+    # Set name pattern to the row in name_Pattern matching the session formatting
+    name_Pattern_id = get_name_pattern_id(session)
+
+    # Find match for the first_person_search pattern (looking for key Abg.)
+    first_person_match = search("first_person_search", initiators, name_Pattern_id)
     if first_person_match:
         # Remove name_raw from the search text
         initiators = initiators.replace(first_person_match.group(), "")
         # Check if the person was just asking a "Zwischenfrage"
-        if not regex.search("[Zz]wischenfrage", initiators):
+        if not search("zwischenfrage", initiators):
             # Get the persons name_raw
             name_raw = first_person_match.group("name_raw")
             # Try to get the persons faction
@@ -316,26 +984,13 @@ def extract_initiators(
                 text_position,
             )
 
-    # Create the second_person_search_Pattern (looking for key und)
-    second_person_search_Pattern = (
-        r"(?:\sund|sowie\sdes)\s+(?:des|der)?{}(?:(?<=!:)|(?!:))".format(
-            name_Pattern[name_Pattern_id].format(
-                opening_bracket_Pattern,
-                closing_bracket_Pattern,
-            )
-        )
-    )
-
-    # Find match
-    second_person_match = regex.search(
-        second_person_search_Pattern,
-        initiators,
-    )
+    # Find match for the second_person_search pattern (looking for key und)
+    second_person_match = search("second_person_search", initiators, name_Pattern_id)
     if second_person_match:
         # Remove the person name_raw from the search text
         initiators = initiators.replace(second_person_match.group(), "")
         # Check if the person was just asking a "Zwischenfrage"
-        if not regex.search("[Zz]wischenfrage", initiators):
+        if not search("zwischenfrage", initiators):
             # Get the persons name_raw
             name_raw = second_person_match.group("name_raw")
             # Try to get the persons faction
@@ -360,23 +1015,14 @@ def extract_initiators(
                 text_position,
             )
 
-    # Iterate over all Political Factions
-    for faction in parties:
-        # Create the faction_search_Pattern
-        faction_search_Pattern = r"(?<!\[)(" + parties[faction] + r")(?![^[\s]*\])"
-        # Find match for faction
-        faction_match = regex.search(faction_search_Pattern, initiators)
-        # Check if there is a match
-        if faction_match:
-            # Remove the faction from the search text
-            initiators = initiators.replace(faction_match.group(), "")
-            # Add an entry to the frame
-            frame = add_entry(frame, identity, type, "", faction, "", "", text_position)
+    # Find all Political Factions and remove them from the search text
+    factions, initiators = match_factions(initiators)
+    for faction in factions:
+        # Add an entry to the frame
+        frame = add_entry(frame, identity, type, "", faction, "", "", text_position)
 
-    # Create the left_right_search_Pattern
-    left_right_search_Pattern = left_right_Pattern
-    # Find matches
-    left_right_matches = list(regex.finditer(left_right_search_Pattern, initiators))
+    # Find matches of the left_right pattern
+    left_right_matches = find_all("left_right", initiators)
     for direction in left_right_matches:
         # Remove the direction from the search text
         initiators = initiators.replace(direction.group(), "")
@@ -386,7 +1032,7 @@ def extract_initiators(
         )
 
     # Search for Government Parties in the initiators
-    government_matches = regex.search(r"[Rr]egierungspar[^\s]+", initiators)
+    government_matches = search("government", initiators)
     if government_matches:
         initiators = initiators.replace(government_matches.group(), "")
         # iterate over every faction get_government_factions returns
@@ -409,7 +1055,7 @@ def extract_initiators(
             print(
                 initiators_not_removed,
                 session,
-                first_person_search_Pattern,
+                get_compiled_pattern("first_person_search", name_Pattern_id).pattern,
             )
     # Return the frame
     return frame, initiators
@@ -427,23 +1073,8 @@ def extract_applause(text, electoral_term, session, identity, text_position, fra
     :param frame (dict): Data collection frame to append found contributions to.
     :return (Updated frame, cleaned text)
     """
-    # creates the Pattern modularly
-    applause_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_applause_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            applause_Pattern,
-            text,
-        )
-    )
+    # Match applause with the compiled pattern of the registry
+    matches = find_all("applause", text)
 
     for match in matches:
         # replace everything except the delimeters
@@ -477,31 +1108,12 @@ def extract_person_interjection(
     :param frame (dict): Frame for storing extracted entries.
     :return: (Updated frame, cleaned text)
     """
-    # Check if session is under 7115
-    if session < 7115:
-        # Set name pattern to the second name pattern (second row in name_Pattern)
-        name_Pattern_id = 1
-        extra_Pattern = r"(?:Abg\s?\.\s?)"
-    else:
-        # Set name pattern to the first name pattern (first row in name_Pattern)
-        name_Pattern_id = 0
-        extra_Pattern = ""
-
-    # creates the Pattern "very" modularly
-    person_interjection_Pattern = (
-        start_contributions_opening_bracket_Pattern.format("")
-        + base_person_interjection_Pattern.format(
-            extra_Pattern
-            + name_Pattern[name_Pattern_id].format(
-                opening_bracket_Pattern,
-                closing_bracket_Pattern,
-            )
-        )
-        + start_contributions_closing_bracket_Pattern.format("")
-    )
+    # Set name pattern to the row in name_Pattern matching the session formatting
+    # (sessions before 7115 additionally require "Abg.")
+    name_Pattern_id = get_name_pattern_id(session)
 
     # Match person interjections
-    matches = list(regex.finditer(person_interjection_Pattern, text))
+    matches = find_all("person_interjection", text, name_Pattern_id)
 
     # Iterate over matches
     for match in matches:
@@ -547,39 +1159,11 @@ def extract_shout(text, electoral_term, session, identity, text_position, frame)
     :param frame (dict): Frame to store contributions.
     :return (Updated frame, cleaned text)
     """
-    # Check if session is under 7115
-    if session < 7115:
-        # Set name pattern to the second name pattern (second row in name_Pattern)
-        name_Pattern_id = 1
-    else:
-        # Set name pattern to the first name pattern (first row in name_Pattern)
-        name_Pattern_id = 0
-
-    # creates the Pattern modularly
-    shout_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            r"|(?<=[Hh]eiterkeit\s)|(?<=[Ll]achen\s)|(?<=[Ww]eiterer\s)|(?<=[Ww]eitere\s)|(?<=[Ee]rneuter\s)|(?<=[Ee]rneute\s)|(?<=[Ff]ortgesetzte\s)|(?<=[Ll]ebhafte\s)|(?<=[Ww]eitere\s[Ll]ebhafte\s|(?<=Andauernde\s)|(?<=Fortdauernde\s))"  # Extending the opening_bracket_Pattern
-        )
-        + base_shout_Pattern.format(
-            r"\s*Abg\s?\.\s?{}".format(
-                name_Pattern[name_Pattern_id].format(
-                    opening_bracket_Pattern,
-                    closing_bracket_Pattern,
-                )
-            ),
-            text_Pattern.format("").replace("{}", "{{}}"),
-        )
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
+    # Set name pattern to the row in name_Pattern matching the session formatting
+    name_Pattern_id = get_name_pattern_id(session)
 
-    matches = list(
-        regex.finditer(
-            shout_Pattern,
-            text,
-        )
-    )
+    # Match shouts with the compiled pattern of the registry
+    matches = find_all("shout", text, name_Pattern_id)
     for match in matches:
         if match.group("initiator"):
             # replace everything except the delimeters
@@ -627,47 +1211,20 @@ def extract_shout(text, electoral_term, session, identity, text_position, frame)
             )
 
     # Extract faction shouts
-    # creates the Pattern modularly
-    faction_shout_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            r"|(?<=[Hh]eiterkeit\s)|(?<=[Ll]achen\s)|(?<=[Ww]eiterer\s)|(?<=[Ww]eitere\s)|(?<=[Ee]rneuter\s)|(?<=[Ee]rneute\s)|(?<=[Ff]ortgesetzte\s)|(?<=[Ll]ebhafte\s)|(?<=[Ww]eitere\s[Ll]ebhafte\s|(?<=Andauernde\s)|(?<=Fortdauernde\s))"  # Extending the opening_bracket_Pattern
-        )
-        + r"(?P<delete>(?P<initiator>"
-        + text_Pattern.format("").replace("{}", "{{}}")
-        + r"+):\s*(?P<content>"
-        + text_Pattern
-        + r"+))"
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            faction_shout_Pattern,
-            text,
-        )
-    )
+    matches = find_all("faction_shout", text)
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
         content = match.group("content")
         initiators = match.group("initiator")
 
-        # Iterate over all parties
-        for faction in parties:
-            # Create the faction_search_Pattern
-            faction_search_Pattern = r"(?<!\[)(" + parties[faction] + r")(?![^[\s]*\])"
-            # Find match for faction
-            faction_match = regex.search(faction_search_Pattern, initiators)
-            # Check if there is a match
-            if faction_match:
-                # Remove the faction from the search text
-                initiators = initiators.replace(faction_match.group(), "")
-                # Add an entry to the frame
-                frame = add_entry(
-                    frame, identity, "Zuruf", "", faction, "", content, text_position
-                )
+        # Find all parties
+        factions, initiators = match_factions(initiators)
+        for faction in factions:
+            # Add an entry to the frame
+            frame = add_entry(
+                frame, identity, "Zuruf", "", faction, "", content, text_position
+            )
 
     # Return the frame
     return frame, text
@@ -685,23 +1242,9 @@ def extract_cheerfulness(text, electoral_term, session, identity, text_position,
     :param frame (dict): Frame to store contributions.
     :return (Updated frame, cleaned text)
     """
-    # creates the Pattern modularly
-    cheerfulness_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_cheerfulness_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
+    # Match cheerfulness with the compiled pattern of the registry
+    matches = find_all("cheerfulness", text)
 
-    matches = list(
-        regex.finditer(
-            cheerfulness_Pattern,
-            text,
-        )
-    )
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -732,23 +1275,9 @@ def extract_objection(text, electoral_term, session, identity, text_position, fr
     :param frame (dict): Output data dictionary.
     :return (Updated frame, cleaned text)
     """
-    # creates the Pattern modularly
-    objection_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_objection_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
+    # Match objection with the compiled pattern of the registry
+    matches = find_all("objection", text)
 
-    matches = list(
-        regex.finditer(
-            objection_Pattern,
-            text,
-        )
-    )
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -779,23 +1308,9 @@ def extract_laughter(text, electoral_term, session, identity, text_position, fra
     :param frame (dict): Output collection dictionary.
     :return (Updated frame, cleaned speech text)
     """
-    # creates the Pattern modularly
-    laughter_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_laughter_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            r"|\sund\sZurufe\)"  # Extending the closing_bracket_Pattern
-        )
-    )
+    # Match laughter with the compiled pattern of the registry
+    matches = find_all("laughter", text)
 
-    matches = list(
-        regex.finditer(
-            laughter_Pattern,
-            text,
-        )
-    )
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -826,23 +1341,9 @@ def extract_approval(text, electoral_term, session, identity, text_position, fra
     :param frame (dict): Result data structure.
     :return (Updated result frame, cleaned text)
     """
-    # creates the Pattern modularly
-    approval_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_approval_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
+    # Match approval with the compiled pattern of the registry
+    matches = find_all("approval", text)
 
-    matches = list(
-        regex.finditer(
-            approval_Pattern,
-            text,
-        )
-    )
     for match in matches:
         # replace everything except the delimeters
         text = text.replace(match.group("delete"), " ")
@@ -873,19 +1374,8 @@ def extract_interruption(text, electoral_term, session, identity, text_position,
     :param frame (dict): Dictionary to append contributions to.
     :return (Updated frame, cleaned speech text)
     """
-    # Creates the Pattern modularly
-    interruption_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_interruption_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    # Find matches
-    matches = list(regex.finditer(interruption_Pattern, text))
+    # Find matches with the compiled pattern of the registry
+    matches = find_all("interruption", text)
 
     # Iterate over matches
     for match in matches:
@@ -918,23 +1408,8 @@ def extract_disturbance(text, electoral_term, session, identity, text_position,
     :param frame (dict): Output dictionary for results.
     :return (Updated result frame, cleaned speech text)
     """
-    # creates the Pattern modularly
-    disturbance_Pattern = (
-        start_contributions_opening_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-        + base_disturbance_Pattern
-        + start_contributions_closing_bracket_Pattern.format(
-            ""  # Nothing to extend, so .format("")
-        )
-    )
-
-    matches = list(
-        regex.finditer(
-            disturbance_Pattern,
-            text,
-        )
-    )
+    # Match disturbance with the compiled pattern of the registry
+    matches = find_all("disturbance", text)
 
     for match in matches:
         # replace everything except the delimeters
@@ -954,8 +1429,79 @@ def extract_disturbance(text, electoral_term, session, identity, text_position,
     return frame, text
 
 
+# List of extractor methods to apply per contribution (in this order) with their triggers
+# (keys of contribution_trigger_Patterns)
+contribution_methods = [
+    (extract_applause, ("applause",)),
+    (extract_person_interjection, ("colon",)),
+    (extract_shout, ("shout", "colon")),
+    (extract_cheerfulness, ("cheerfulness",)),
+    (extract_objection, ("objection",)),
+    (extract_laughter, ("laughter",)),
+    (extract_approval, ("approval",)),
+    (extract_interruption, ("interruption",)),
+    (extract_disturbance, ("disturbance",)),
+]
+
+# Brackets whose extraction timed out (see quarantine_bracket), also appended to quarantine_path if set (.jsonl)
+quarantined_brackets = []
+quarantine_path = None
+
+# Counters of timed out brackets: extractor -> number of timeouts
+extractor_timeout_statistics = {}
+
+
+def quarantine_bracket(bracket_text, session, identity, text_position, extractor, error):
+    """
+    Records a bracket whose extraction timed out and counts the timeout for the extractor.
+
+    :param bracket_text (str): Text of the bracket.
+    :param session (int): Bundestag session number.
+    :param identity (int): ID of the speech.
+    :param text_position (int): Position of the bracket within the speech.
+    :param extractor (str): Name of the extractor (or step) that timed out.
+    :param error (TimeoutError): The timeout of the pattern.
+    """
+    record = {
+        "session": session,
+        "speech_id": int(identity),
+        "text_position": int(text_position),
+        "extractor": extractor,
+        "error": str(error),
+        "bracket": bracket_text,
+    }
+    quarantined_brackets.append(record)
+    extractor_timeout_statistics[extractor] = extractor_timeout_statistics.get(extractor, 0) + 1
+    if quarantine_path is not None:
+        with open(quarantine_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def get_extractor_timeout_statistics():
+    """
+    Returns the number of timed out brackets per extractor.
+
+    :return (dict): Extractor -> number of timeouts.
+    """
+    return dict(extractor_timeout_statistics)
+
+
+def reset_quarantine():
+    """
+    Removes the quarantined brackets and resets the timeout counters of the extractors.
+    """
+    quarantined_brackets.clear()
+    extractor_timeout_statistics.clear()
+
+
+
 def extract(
-    speech_text, session, identity, text_position=0, text_position_reversed=True
+    speech_text,
+    session,
+    identity,
+    text_position=0,
+    text_position_reversed=True,
+    contributions_buffer=None,
 ):
     """
     Main extraction function that identifies all parenthesized contributions
@@ -966,8 +1512,10 @@ def extract(
     :param identity (int): Unique ID assigned to the current speech.
     :param text_position (int, optional): Start index for contribution counter (default: 0).
     :param text_position_reversed (bool, optional): Whether text position is reversed (default: True).
+    :param contributions_buffer (ContributionBuffer, optional): Buffer to append the structured contributions to,
+        e.g. one buffer for all speeches of a session (default: None, a DataFrame is returned for this speech).
     :return:
-        - frame (pd.DataFrame): Extracted structured contributions.
+        - frame (pd.DataFrame): Extracted structured contributions (the contributions_buffer if one is given).
         - speech_text (str): Cleaned speech text with contributions removed.
         - contributions_simplified (pd.DataFrame): Simplified contributions with original markers.
         - text_position (int): Final value of the position counter.
@@ -976,79 +1524,98 @@ def extract(
     electoral_term = session // 1000
 
     # Find all nested or flat bracketed expressions
-    brackets = list(
-        regex.finditer(r"\(([^(\)]*(\(([^(\)]*)\))*[^(\)]*)\)", speech_text)
-    )
+    brackets = find_brackets(speech_text)
 
-    # Initialize frame for structured contribution extraction
-    frame = {
-        "id": [],
-        "type": [],
-        "name_raw": [],
-        "faction": [],
-        "constituency": [],
-        "content": [],
-        "text_position": [],
-    }
+    # Initialize frame for structured contribution extraction (or append to the given buffer)
+    frame = ContributionBuffer() if contributions_buffer is None else contributions_buffer
+    frame_length = len(frame)
 
     # Initialize list for simplified contribution segments
     contributions_simplified = {"text_position": [], "content": [], "speech_id": []}
 
-    # Iterate over contributions in reverse order to prevent text offset issues
-    for bracket in reversed(brackets):
-        # calculate reversed text_position
-        reversed_text_position = len(brackets) - 1 - text_position
-        # Make sure to remove all newlines
-        speech_text_no_newline = regex.sub(r"\n+", " ", bracket.group())
-        speech_text_no_newline = regex.sub(r"\s+", " ", speech_text_no_newline)
-        # Save the bracket text
-        bracket_text = bracket.group()
-        # Save deleted text to DataFrame
-        contributions_simplified["text_position"].append(
-            reversed_text_position if text_position_reversed else text_position
-        )
-        contributions_simplified["content"].append(bracket_text)
-        contributions_simplified["speech_id"].append(identity)
-
-        deletion_span = bracket.span(1)
-
-        # Remove the bracket text from the speech_text and replace it with the text_position
-        speech_text = (
-            speech_text[: deletion_span[0]]
-            + "{"
-            + str(reversed_text_position if text_position_reversed else text_position)
-            + "}"
-            + speech_text[deletion_span[1] :]
-        )
-
-        # List of extractor methods to apply per contribution
-        contribution_methods = [
-            extract_applause,
-            extract_person_interjection,
-            extract_shout,
-            extract_cheerfulness,
-            extract_objection,
-            extract_laughter,
-            extract_approval,
-            extract_interruption,
-            extract_disturbance,
-        ]
+    # Placeholders of the brackets (in text order), the speech text is assembled once at the end
+    placeholders = [None] * len(brackets)
+
+    try:
+        # Iterate over contributions in reverse order (the text positions count from the last bracket)
+        for bracket_index in range(len(brackets) - 1, -1, -1):
+            start, end = brackets[bracket_index]
+            # calculate reversed text_position
+            reversed_text_position = len(brackets) - 1 - text_position
+            # Save the bracket text
+            bracket_text = speech_text[start:end]
+            # Save deleted text to DataFrame
+            contributions_simplified["text_position"].append(
+                reversed_text_position if text_position_reversed else text_position
+            )
+            contributions_simplified["content"].append(bracket_text)
+            contributions_simplified["speech_id"].append(identity)
 
-        for method in contribution_methods:
-            frame, speech_text_no_newline = method(
-                speech_text_no_newline,
-                electoral_term,
-                session,
-                identity,
-                reversed_text_position if text_position_reversed else text_position,
-                frame,
+            # The bracket text is replaced with the text_position
+            placeholders[bracket_index] = (
+                "({" + str(reversed_text_position if text_position_reversed else text_position) + "})"
             )
 
-        text_position += 1
+            bracket_frame_length = len(frame)
+            extractor = "find_contribution_types"
+            try:
+                # Make sure to remove all newlines and repeated whitespace
+                speech_text_no_newline = substitute("whitespace", " ", bracket_text)
+
+                # Identify the contribution types of the bracket with one scan
+                contribution_types = find_contribution_types(speech_text_no_newline)
+
+                for method, triggers in contribution_methods:
+                    # No text left, no extractor can match anymore
+                    if not speech_text_no_newline:
+                        break
+                    # Only run extractors whose triggers occur in the bracket (they can not match otherwise)
+                    if contribution_types.isdisjoint(triggers):
+                        # extract_approval returns an empty text even without matches, keep that behaviour
+                        if method is extract_approval:
+                            speech_text_no_newline = ""
+                        continue
+                    extractor = method.__name__
+                    frame, speech_text_no_newline = method(
+                        speech_text_no_newline,
+                        electoral_term,
+                        session,
+                        identity,
+                        reversed_text_position if text_position_reversed else text_position,
+                        frame,
+                    )
+            except TimeoutError as error:
+                # Skip the bracket (without partial contributions) instead of blocking the extraction
+                frame.truncate(bracket_frame_length)
+                quarantine_bracket(
+                    bracket_text,
+                    session,
+                    identity,
+                    reversed_text_position if text_position_reversed else text_position,
+                    extractor,
+                    error,
+                )
+
+            text_position += 1
+    except Exception:
+        # Remove the rows of this speech from the buffer
+        frame.truncate(frame_length)
+        raise
+
+    # Replace the brackets in the speech_text with their placeholders
+    if brackets:
+        speech_text_parts = []
+        previous_end = 0
+        for (start, end), placeholder in zip(brackets, placeholders):
+            speech_text_parts.append(speech_text[previous_end:start])
+            speech_text_parts.append(placeholder)
+            previous_end = end
+        speech_text_parts.append(speech_text[previous_end:])
+        speech_text = "".join(speech_text_parts)
 
     # Return all outputs
     return (
-        pd.DataFrame(frame),
+        frame.to_frame() if contributions_buffer is None else frame,
         speech_text,
         pd.DataFrame(contributions_simplified),
         text_position,
@@ -0,0 +1,294 @@
+"""
+This script contains a fixture corpus of speeches with contribution brackets, the golden outputs of extract(…)
+for it and an offline benchmark of extract_contributions.py.
+
+The fixture corpus covers applause, shouts and interjections with "Abg." names in the formats before and after
+session 7115, Regierungsparteien, left/right directions, the other contribution types, nested brackets and
+a long budget debate speech. The golden outputs (frame, speech_text, contributions_simplified and text_position
+of every fixture speech, or the raised error) are stored in EXTRACT_GOLDEN_PATH.
+
+Usage (from the repository root):
+    python -m dataGeneration.extract_contributions_benchmark --check
+    python -m dataGeneration.extract_contributions_benchmark --speeches 500 --repeat 3
+    python -m dataGeneration.extract_contributions_benchmark --update-golden
+"""
+
+
+# imports
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+from dataGeneration.extract_contributions import extract, ContributionBuffer
+
+
+# Golden outputs of the fixture corpus
+EXTRACT_GOLDEN_PATH = Path(__file__).resolve().parent / "fixtures" / "extract_contributions_golden.json"
+
+# Sentences between the brackets of the fixture and benchmark speeches
+fixture_sentences = [
+    "Sehr geehrte Frau Präsidentin! Liebe Kolleginnen und Kollegen!",
+    "Die Bundesregierung legt heute einen Haushalt vor, der keine Antworten gibt.",
+    "Wir investieren 12 Milliarden Euro in Schulen, Straßen und Netze.",
+    "Das ist eine Frage der Gerechtigkeit, meine Damen und Herren.",
+    "Der Einzelplan 09 zeigt, dass die Koalition spart, wo es weh tut.",
+    "Ich sage Ihnen: So wird das nichts.",
+    "Vielen Dank.",
+]
+
+# Fixture corpus: name, session, brackets of the speech (the speech alternates sentences and brackets)
+fixture_cases = [
+    # Applause
+    ("applause faction", 19001, ["(Beifall bei der AfD)"]),
+    ("applause two factions", 19150, ["(Beifall bei der CDU/CSU und der SPD)"]),
+    ("applause members of faction", 20012, ["(Beifall bei Abgeordneten der SPD sowie bei Abgeordneten der FDP)"]),
+    ("applause factions and members", 20200, ["(Beifall beim BÜNDNIS 90/DIE GRÜNEN sowie bei Abgeordneten der SPD und der FDP)"]),
+    ("applause whole house", 19001, ["(Beifall im ganzen Hause)"]),
+    ("applause lively", 19150, ["(Lebhafter Beifall bei der FDP)", "(Anhaltender Beifall bei der CDU/CSU)"]),
+    ("applause faction and person", 20012, ["(Beifall bei der LINKEN sowie des Abg. Dr. Gregor Gysi [DIE LINKE])"]),
+    # Government factions and directions
+    ("applause government factions term 19", 19150, ["(Beifall bei den Regierungsparteien)"]),
+    ("applause government factions term 20", 20012, ["(Beifall bei den Regierungsparteien)"]),
+    ("shout government factions", 20200, ["(Zuruf von den Regierungsparteien: Das stimmt doch nicht!)"]),
+    ("applause government factions term 5", 5012, ["(Beifall bei den Regierungsparteien)"]),
+    ("applause left", 6100, ["(Beifall links)"]),
+    ("applause right and center", 5012, ["(Beifall rechts und in der Mitte)"]),
+    ("applause center", 7001, ["(Beifall in der Mitte)"]),
+    # Shouts and interjections after session 7115
+    ("shout person", 19001, ["(Zuruf des Abg. Jürgen Trittin [BÜNDNIS 90/DIE GRÜNEN])"]),
+    ("shout person content", 19150, ["(Zuruf des Abg. Dr. Alice Weidel [AfD]: Das ist doch Unsinn!)"]),
+    ("shout faction", 20012, ["(Zuruf von der SPD)"]),
+    ("shout faction content", 20200, ["(Zuruf von der CDU/CSU: Wo denn?)"]),
+    ("shouts two factions", 19001, ["(Zurufe von der AfD und der FDP)"]),
+    ("shouts two persons", 19150, ["(Zurufe des Abg. Friedrich Merz [CDU/CSU] und des Abg. Christian Lindner [FDP])"]),
+    ("shout without initiator", 20012, ["(Zuruf: Hört! Hört!)", "(Zurufe)"]),
+    ("counter shout", 20200, ["(Gegenruf von der SPD: Falsch!)"]),
+    ("interjection person", 19001, ["(Beatrix von Storch [AfD]: Das ist eine Frechheit!)"]),
+    ("interjection with counter shout", 19150, ["(Kai Gehring [BÜNDNIS 90/DIE GRÜNEN]: Hört! Hört! – Gegenruf des Abg. Karl Lauterbach [SPD]: Richtig!)"]),
+    ("interjection constituency", 20012, ["(Abg. Gregor Gysi [DIE LINKE] (Berlin): Wo ist das Geld?)"]),
+    ("applause and shout", 20200, ["(Beifall bei der SPD – Zuruf von der AfD: Ihre Partei – die Union!)"]),
+    ("applause and interjection", 19001, ["(Beifall bei der FDP – Dr. Alice Weidel [AfD]: Wo denn?)"]),
+    ("intermediate question", 19150, ["(Beifall bei der CDU/CSU – Abg. Karl Lauterbach [SPD] meldet sich zu einer Zwischenfrage)"]),
+    # Shouts and interjections before session 7115
+    ("old interjection", 5012, ["(Abg. Wehner: Das ist doch Quatsch!)"]),
+    ("old interjection title", 6100, ["(Abg. Dr. Barzel: Sehr gut!)"]),
+    ("old interjection constituency", 7001, ["(Abg. Schmidt (Hamburg): Hört! Hört!)"]),
+    ("old shout person", 5012, ["(Zurufe des Abg. Erler)"]),
+    ("old shout faction", 6100, ["(Zuruf von der SPD: Richtig!)"]),
+    ("old applause", 7001, ["(Beifall bei der CDU/CSU)", "(Beifall bei Abgeordneten der FDP)"]),
+    ("old cheerfulness", 5012, ["(Heiterkeit bei der SPD)"]),
+    # Other contribution types
+    ("cheerfulness", 19001, ["(Heiterkeit)", "(Heiterkeit bei der FDP)"]),
+    ("laughter", 19150, ["(Lachen bei der AfD)"]),
+    ("laughter and shout", 20012, ["(Lachen bei der SPD – Zuruf des Abg. Christian Lindner [FDP])"]),
+    ("objection", 20200, ["(Widerspruch bei der LINKEN)"]),
+    ("laughter and objection", 19001, ["(Lachen und Widerspruch bei der CDU/CSU)"]),
+    ("approval", 19150, ["(Sehr richtig! bei der SPD)", "(Zustimmung bei der FDP)", "(Bravo-Rufe bei der AfD)"]),
+    ("interruption", 20012, ["(Unterbrechung der Sitzung: 13.02 Uhr)"]),
+    ("disturbance", 20200, ["(Unruhe)", "(Unruhe bei der AfD)"]),
+    ("no contribution", 19001, ["(Glocke des Präsidenten)"]),
+    ("cheerfulness and applause", 19150, ["(Heiterkeit und Beifall bei der SPD)"]),
+    # Formatting
+    ("newlines", 20012, ["(Beifall bei der\nSPD)", "(Zuruf von der AfD:\n\nWo   denn?)"]),
+    ("nested brackets", 20200, ["(Beifall bei der SPD (Berlin) (Hamburg))", "(Zuruf (leise))"]),
+    ("no brackets", 19001, []),
+]
+
+
+def build_fixture_speech(brackets, seed=0):
+    """
+    Builds a speech text of fixture sentences with the given brackets in between.
+
+    :param brackets (list): Contribution brackets.
+    :param seed (int): Seed of the sentence choice.
+    :return (str): The speech text.
+    """
+    rng = random.Random(seed)
+    parts = [fixture_sentences[0]]
+    for bracket in brackets:
+        parts.append(bracket)
+        parts.append(rng.choice(fixture_sentences[1:]))
+    return "\n\n".join(parts)
+
+
+def get_fixture_corpus():
+    """
+    Returns the fixture corpus including a long budget debate speech with all brackets of the corpus.
+
+    :return (list): Cases as dicts with name, session, identity and speech_text.
+    """
+    corpus = [
+        {"name": name, "session": session, "identity": 1000000 + index, "speech_text": build_fixture_speech(brackets, index)}
+        for index, (name, session, brackets) in enumerate(fixture_cases)
+    ]
+    # Budget debate speech with many interjections (only brackets without errors, see run_extract)
+    budget_brackets = [
+        bracket
+        for name, session, brackets in fixture_cases
+        if session >= 19000 and name != "cheerfulness and applause"
+        for bracket in brackets
+    ]
+    corpus.append(
+        {
+            "name": "budget debate",
+            "session": 19150,
+            "identity": 1000000 + len(corpus),
+            "speech_text": build_fixture_speech(budget_brackets * 3, len(corpus)),
+        }
+    )
+    return corpus
+
+
+def frame_to_records(frame):
+    """
+    Converts a DataFrame into JSON compatible records (NaN as None).
+
+    :param frame (pd.DataFrame): The DataFrame.
+    :return (list): One dict per row.
+    """
+    return json.loads(frame.to_json(orient="records", force_ascii=False))
+
+
+def run_extract(case):
+    """
+    Runs extract(…) for one fixture case.
+
+    :param case (dict): Case of get_fixture_corpus.
+    :return (dict): frame, speech_text, contributions_simplified and text_position (or the raised error).
+    """
+    try:
+        frame, speech_text, contributions_simplified, text_position = extract(
+            case["speech_text"], case["session"], case["identity"]
+        )
+    except Exception as error:
+        return {"error": "{}: {}".format(type(error).__name__, error)}
+    return {
+        "frame": frame_to_records(frame),
+        "speech_text": speech_text,
+        "contributions_simplified": frame_to_records(contributions_simplified),
+        "text_position": text_position,
+    }
+
+
+def update_golden_outputs(golden_path=EXTRACT_GOLDEN_PATH):
+    """
+    Writes the outputs of extract(…) for the fixture corpus as new golden outputs.
+    Only to be used after a deliberate change of the extraction results.
+
+    :param golden_path (Path): Path of the golden outputs (.json).
+    :return (int): Number of cases.
+    """
+    golden = [{**case, "expected": run_extract(case)} for case in get_fixture_corpus()]
+    golden_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(golden_path, "w", encoding="utf-8") as f:
+        json.dump(golden, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    return len(golden)
+
+
+def check_golden_outputs(golden_path=EXTRACT_GOLDEN_PATH):
+    """
+    Compares the outputs of extract(…) with the golden outputs.
+
+    :param golden_path (Path): Path of the golden outputs (.json).
+    :return (list): Mismatches as (case name, part, expected, actual).
+    """
+    with open(golden_path, encoding="utf-8") as f:
+        golden = json.load(f)
+
+    mismatches = []
+    for case in golden:
+        actual = run_extract(case)
+        for part in sorted(set(case["expected"]) | set(actual)):
+            if case["expected"].get(part) != actual.get(part):
+                mismatches.append((case["name"], part, case["expected"].get(part), actual.get(part)))
+    return mismatches
+
+
+def get_benchmark_corpus(speeches=200, brackets_per_speech=(5, 150), seed=0):
+    """
+    Generates a benchmark corpus of speeches with random fixture brackets (only brackets without errors).
+
+    :param speeches (int): Number of speeches.
+    :param brackets_per_speech (tuple): Minimum and maximum number of brackets per speech.
+    :param seed (int): Seed of the corpus.
+    :return (list): Speeches as (speech_text, session, identity).
+    """
+    rng = random.Random(seed)
+    brackets_by_format = {False: [], True: []}
+    for name, session, brackets in fixture_cases:
+        for bracket in brackets:
+            if "error" not in run_extract({"speech_text": bracket, "session": session, "identity": 0}):
+                brackets_by_format[session < 7115].append(bracket)
+
+    corpus = []
+    for index in range(speeches):
+        old_format = index % 5 == 0
+        session = rng.choice([5012, 6100, 7001] if old_format else [19001, 19150, 20012, 20200])
+        brackets = [rng.choice(brackets_by_format[old_format]) for _ in range(rng.randint(*brackets_per_speech))]
+        corpus.append((build_fixture_speech(brackets, index), session, 1000000 + index))
+    return corpus
+
+
+def run_benchmark(speeches=200, repeat=3, seed=0):
+    """
+    Measures extract(…) on the benchmark corpus, once with one DataFrame per speech and once with one
+    ContributionBuffer for all speeches (as in stage 04). The best of repeat runs is reported.
+
+    :param speeches (int): Number of speeches of the benchmark corpus.
+    :param repeat (int): Number of runs per mode.
+    :param seed (int): Seed of the benchmark corpus.
+    :return (dict): Mode -> seconds, speeches_per_second, brackets_per_second.
+    """
+    corpus = get_benchmark_corpus(speeches, seed=seed)
+    brackets = sum(len(extract(speech_text, session, identity)[2]) for speech_text, session, identity in corpus)
+    print(f"[benchmark] {len(corpus)} speeches, {brackets} brackets (seed {seed})")
+
+    results = {}
+    for mode in ["per speech", "buffer"]:
+        seconds = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            if mode == "buffer":
+                contributions_buffer = ContributionBuffer()
+                for speech_text, session, identity in corpus:
+                    extract(speech_text, session, identity, contributions_buffer=contributions_buffer)
+                contributions_buffer.flush()
+            else:
+                for speech_text, session, identity in corpus:
+                    extract(speech_text, session, identity)
+            seconds.append(time.perf_counter() - start)
+        best = min(seconds)
+        results[mode] = {
+            "seconds": round(best, 3),
+            "speeches_per_second": round(len(corpus) / best, 1),
+            "brackets_per_second": round(brackets / best, 1),
+        }
+        print(
+            f"[benchmark] {mode}: {best:.2f}s, {results[mode]['speeches_per_second']} speeches/s, "
+            f"{results[mode]['brackets_per_second']} brackets/s"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Golden outputs and offline benchmark of extract_contributions.py.")
+    parser.add_argument("--check", action="store_true", help="Compare extract(…) with the golden outputs.")
+    parser.add_argument("--update-golden", action="store_true", help="Write the current outputs as golden outputs.")
+    parser.add_argument("--speeches", type=int, default=200, help="Number of speeches of the benchmark corpus.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the benchmark corpus.")
+    args = parser.parse_args()
+
+    if args.update_golden:
+        print(f"[golden] {update_golden_outputs()} cases written to <{EXTRACT_GOLDEN_PATH}>")
+    elif args.check:
+        mismatches = check_golden_outputs()
+        for name, part, expected, actual in mismatches:
+            print(f"[golden] {name} ({part}):\n  expected: {expected}\n  actual:   {actual}")
+        print(f"[golden] {len(mismatches)} mismatches")
+        raise SystemExit(1 if mismatches else 0)
+    else:
+        run_benchmark(args.speeches, args.repeat, args.seed)
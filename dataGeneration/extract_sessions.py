@@ -0,0 +1,856 @@
+"""
+This script runs the extraction of stage 04 (speeches and contributions of the split session XML files of the
+electoral terms 19 and 20) session by session on a process pool. It writes the same files as the stage 04
+notebook (dateGenerationPipeline_4.ipynb):
+- contributions extended per session (CONTRIB_EXT_19/20/<session>.pkl)
+- speech content per term (SPEECH_CONTENT_04_19/20/speech_content.pkl)
+- contributions simplified per term and combined (CONTRIB_SIMPLIFIED, FINAL_CONTRIB_SIM)
+
+Speech ids are global counters over all sessions (in sorted order, term 19 before term 20) starting at 1000000.
+The workers number the speeches of a session from 0 and the ids are shifted while the results are collected in
+session order, so the output does not depend on the number of workers.
+
+Reruns are incremental: the manifest (MANIFEST_PATH) records a content hash of every session and of the extractor
+code and tables, only new or changed sessions are extracted and the output files are rebuilt from the cached
+results of the sessions (SESSION_CACHE_DIR). A run of some terms only (--terms) keeps the sessions of the other
+terms and counts their speeches from the manifest.
+
+Usage:
+    python -m dataGeneration.extract_sessions --workers 8
+    python -m dataGeneration.extract_sessions --full
+"""
+
+
+# imports
+import argparse
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as et
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import regex
+from tqdm import tqdm
+
+from dataGeneration import paths as PATHS
+from dataGeneration import extract_contributions
+from dataGeneration.extract_contributions import extract, ContributionBuffer, quarantined_brackets
+
+
+# First speech id of the stage 04 output
+FIRST_SPEECH_ID = 1000000
+
+# Input directories
+ELECTORAL_TERM_19_20_INPUT = {
+    19: PATHS.XML_SPLIT_19,
+    20: PATHS.XML_SPLIT_20,
+}
+
+# Columns of the contributions simplified (see extract)
+CONTRIBUTIONS_SIMPLIFIED_COLUMNS = ["text_position", "content", "speech_id"]
+
+faction_patterns = {
+    "Bündnis 90/Die Grünen": r"(?:BÜNDNIS\s*(?:90)?/?(?:\s*D[1I]E)?|Bündnis\s*90/(?:\s*D[1I]E)?)?\s*[GC]R[UÜ].?\s*[ÑN]EN?(?:/Bündnis 90)?",  # noqa: E501
+    "CDU/CSU": r"(?:Gast|-)?(?:\s*C\s*[DSMU]\s*S?[DU]\s*(?:\s*[/,':!.-]?)*\s*(?:\s*C+\s*[DSs]?\s*[UÙ]?\s*)?)(?:-?Hosp\.|-Gast|1)?",  # noqa: E501
+    "BP": r"^BP",
+    "DA": r"^DA",
+    "DP": r"^DP",
+    "DIE LINKE.": r"DIE LINKE",
+    "DPB": r"^DPB",
+    "DRP": r"DRP(\-Hosp\.)?|^SRP|^DBP",
+    "FDP": r"\s*F\.?\s*[PDO][.']?[DP]\.?",
+    "Fraktionslos": r"(?:fraktionslos|Parteilos)",
+    "FU": r"^FU",
+    "FVP": r"^FVP",
+    "Gast": r"Gast",
+    "GB/BHE": r"(?:GB[/-]\s*)?BHE(?:-DG)?",
+    "KPD": r"^KPD",
+    "NR": r"^NR$",
+    "PDS": r"(?:Gruppe\s*der\s*)?PDS(?:/(?:LL|Linke Liste))?",
+    "SPD": r"\s*'?S(?:PD|DP)(?:\.|-Gast)?",
+    "SSW": r"^SSW",
+    "SRP": r"^SRP",
+    "WAV": r"^WAV",
+    "Z": r"^Z$",
+    "AfD": r"^AfD$",
+    "DBP": r"^DBP$",
+}
+
+
+def get_position_short_and_long(position_raw):
+    """
+    Matches the given position_raw and returns the short and long version.
+
+    :param position_raw (str): Raw position (faction or role) of the speaker.
+    :return (str, str): position_short, position_long
+    """
+    if position_raw in faction_patterns.keys() or regex.match(
+        r"^[Bb]erichterstatter(in)?(\s|$|,|.)", position_raw
+    ):
+        return (
+            "Member of Parliament",
+            None if position_raw in faction_patterns.keys() else position_raw,
+        )
+    elif (
+        regex.match(r"^[Bb]undestagspräsident(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Aa]lterspräsident(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Vv]izebundestagspräsident(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Ss]chriftführer(in)?(\s|$|,|.)", position_raw)
+        or position_raw.lower()
+        in [
+            "präsidentin",
+            "präsident",
+            "präsident des deutschen bundestages",
+            "präsidentin des deutschen bundestages",
+            "vizepräsidentin",
+            "vizepräsident",
+        ]
+    ):
+        return "Presidium of Parliament", position_raw
+    elif (
+        regex.match(r"^[Bb]undespräsident(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Mm]inisterpräsident(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Ss]taatsminister(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Ss]enator(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Pp]räsident(in)?(\s|$|,|.)", position_raw)
+        or regex.match(r"^[Gg]ast", position_raw)
+    ):
+        return "Guest", position_raw
+    elif regex.match(r"^[Bb]undeskanzler(in)?(\s|$|,|.)", position_raw):
+        return "Chancellor", None
+    elif regex.match(r"^(Bundes)?[Mm]inister(in)?(\s|$|,|.)", position_raw):
+        return "Minister", position_raw
+    elif regex.match(
+        r"^([Pp]arl\s*\.\s+)?[Ss]taatssekretär(in)?(\s|$|,|.)", position_raw
+    ):
+        return "Secretary of State", position_raw
+    else:
+        return "Not found", None
+
+
+def get_first_last(name):
+    """
+    Splits a name into first name(s) and last name.
+
+    :param name (str): Full name.
+    :return (str, str): first_name, last_name
+    """
+    first_last = name.split()
+    if len(first_last) == 1:
+        first_name = ""
+        last_name = first_last[0]
+    elif len(first_last) >= 2:
+        first_name = first_last[:-1]
+        last_name = first_last[-1]
+    else:
+        first_name = "ERROR"
+        last_name = "ERROR"
+    return " ".join(first_name), last_name
+
+
+def find_with_default(node, key, default):
+    """
+    Returns the text of the child key of an XML node or default if it does not exist.
+    """
+    result = node.find(key)
+    return default if result is None else result.text
+
+
+def get_faction_abbrev(faction, faction_patterns):
+    """
+    Matches the given faction and returns its abbreviation (key in faction_patterns) or None.
+    """
+    for faction_abbrev, faction_pattern in faction_patterns.items():
+        if regex.search(faction_pattern, faction):
+            return faction_abbrev
+    return None
+
+
+def read_table(path):
+    """
+    Reads a table from a .pkl or .csv file.
+
+    :param path (Path): Path to the table.
+    :return (pd.DataFrame): The table.
+    """
+    if path.suffix == ".pkl":
+        return pd.read_pickle(path)
+    return pd.read_csv(path)
+
+
+def load_tables(
+    factions_path=PATHS.FACTIONS_ABBR_STAGE03,
+    politicians_path=PATHS.MPS_FACTIONS_STAGE03,
+    lookup_path=PATHS.SPEAKER_LOOKUP_STAGE03,
+    terms=(19, 20),
+):
+    """
+    Loads and prepares the stage 03 tables used by the extraction of the sessions.
+
+    :param factions_path (Path): Factions with abbreviations (factionsAbbreviations.pkl).
+    :param politicians_path (Path): Politicians with ui, electoral_term, first_name and last_name (.pkl or .csv).
+    :param lookup_path (Path): Speaker faction lookup (speaker_faction_lookup.csv).
+    :param terms (tuple): Electoral terms to prepare the politicians for.
+    :return (dict): factions, lookup and politicians_by_term (politicians of every term).
+    """
+    factions = pd.read_pickle(factions_path)
+    lookup = pd.read_csv(lookup_path)
+
+    politicians = read_table(politicians_path)
+    politicians["last_name"] = politicians["last_name"].str.lower()
+    politicians["last_name"] = politicians["last_name"].str.replace("ß", "ss", regex=False)
+    politicians["first_name"] = politicians["first_name"].str.lower()
+    politicians["first_name"] = politicians["first_name"].str.replace("ß", "ss", regex=False)
+    politicians["first_name"] = politicians["first_name"].apply(str.split)
+
+    return {
+        "factions": factions,
+        "lookup": lookup,
+        "politicians_by_term": {
+            term_number: politicians.loc[politicians["electoral_term"] == term_number]
+            for term_number in terms
+        },
+    }
+
+
+def get_faction_id(factions, faction_abbrev):
+    """
+    Returns the id of a faction abbreviation.
+    .iloc[0] is important right now, as some faction entries in factions df share same faction_id,
+    so always the first one is chosen right now.
+    """
+    return int(factions.loc[factions["abbreviation"] == faction_abbrev, "id"].iloc[0])
+
+
+def extract_session(session_path, term_number, tables):
+    """
+    Extracts the speeches and contributions of one split session folder. The speech ids start at 0
+    (see shift_speech_ids).
+
+    :param session_path (Path): Session folder with session_content.xml and meta_data.xml.
+    :param term_number (int): Electoral term of the session.
+    :param tables (dict): Tables returned by load_tables.
+    :return (list, pd.DataFrame, pd.DataFrame, list): speech records, contributions extended, contributions simplified,
+        quarantined brackets (see extract_contributions.quarantine_bracket)
+    """
+    quarantine_start = len(quarantined_brackets)
+    factions = tables["factions"]
+    lookup = tables["lookup"]
+    politicians_electoral_term = tables["politicians_by_term"][term_number]
+
+    speech_records = []
+    contributions_simplified = []
+    contributions_extended = ContributionBuffer()
+    speech_content_id = 0
+
+    def append_speech_record(first_name, last_name, faction_id, position_short, position_long, speaker_id, speech_text):
+        speech_records.append(
+            {
+                "id": speech_content_id,
+                "session": session_path.stem,
+                "first_name": first_name,
+                "last_name": last_name,
+                "faction_id": faction_id,
+                "position_short": position_short,
+                "position_long": position_long,
+                "politician_id": speaker_id,
+                "speech_content": speech_text,
+                "date": date,
+            }
+        )
+
+    session_content = et.parse(session_path / "session_content.xml")
+    meta_data = et.parse(session_path / "meta_data.xml")
+
+    date = meta_data.getroot().get("sitzung-datum")
+    # Wrong date in xml file. Fixing manually
+    if session_path.stem == "19158":
+        date = "07.05.2020"
+    date = (
+        datetime.strptime(date, "%d.%m.%Y") - datetime(1970, 1, 1)
+    ).total_seconds()
+
+    root = session_content.getroot()
+
+    for top in root.findall("tagesordnungspunkt"):
+        for speech in top.findall("rede"):
+            speaker = speech[0].find("redner")
+            if speaker is None:
+                continue
+            try:
+                speaker_id = int(speaker.get("id"))
+            except (ValueError, AttributeError):
+                speaker_id = -1
+            name = speaker.find("name")
+            first_name = find_with_default(name, "vorname", "")
+            last_name = find_with_default(name, "nachname", "")
+
+            position_raw_element = name.find("fraktion")
+            if position_raw_element is not None and position_raw_element.text:
+                position_raw = position_raw_element.text
+            else:
+                role_element = name.find("rolle")
+                if role_element is not None:
+                    position_raw = find_with_default(role_element, "rolle_lang", "")
+                else:
+                    position_raw = ""
+
+            faction_abbrev = get_faction_abbrev(
+                str(position_raw), faction_patterns=faction_patterns
+            )
+            position_short, position_long = get_position_short_and_long(
+                faction_abbrev
+                if faction_abbrev
+                else regex.sub("\n+", " ", position_raw)
+            )
+            faction_id = -1
+
+            if faction_abbrev:
+                faction_id = get_faction_id(factions, faction_abbrev)
+
+            if faction_id == -1:
+                row = lookup[(lookup["speaker_id"] == speaker_id) & (lookup["electoral_term"] == term_number)]
+                if not row.empty:
+                    faction_id = int(row["faction_id"].iloc[0])
+                else:
+                    faction_id = -1
+
+            speech_text = ""
+            text_position = 0
+            for content in speech[1:]:
+                tag = content.tag
+                if tag == "name":
+                    append_speech_record(first_name, last_name, faction_id, position_short, position_long, speaker_id, speech_text)
+                    speech_content_id += 1
+                    faction_id = -1
+                    speaker_id = -1
+                    name = regex.sub(":", "", content.text).split()
+                    first_name, last_name = get_first_last(" ".join(name[1:]))
+                    position_short, position_long = get_position_short_and_long(
+                        name[0]
+                    )
+                    possible_matches = politicians_electoral_term.loc[
+                        politicians_electoral_term["last_name"] == last_name.lower()
+                    ]
+                    length = len(np.unique(possible_matches["ui"]))
+                    if length == 1:
+                        speaker_id = int(possible_matches["ui"].iloc[0])
+                    elif length > 1:
+                        first_name_set = set(
+                            [x.lower() for x in first_name.split()]
+                        )
+                        possible_matches = possible_matches.loc[
+                            ~possible_matches["first_name"].apply(
+                                lambda x: set(x).isdisjoint(first_name_set)
+                            )
+                        ]
+                        length = len(np.unique(possible_matches["ui"]))
+                        if length == 1:
+                            speaker_id = int(possible_matches["ui"].iloc[0])
+                    speech_text = ""
+                    text_position = 0
+                elif tag == "p" and content.get("klasse") == "redner":
+                    append_speech_record(first_name, last_name, faction_id, position_short, position_long, speaker_id, speech_text)
+                    speech_content_id += 1
+                    speech_text = ""
+                    text_position = 0
+                    speaker = content.find("redner")
+                    speaker_id = int(speaker.get("id"))
+                    possible_matches = politicians_electoral_term.loc[
+                        politicians_electoral_term["ui"] == speaker_id
+                    ]
+                    if len(possible_matches) == 0:
+                        speaker_id = -1
+                    name = speaker.find("name")
+                    try:
+                        first_name = name.find("vorname").text
+                        last_name = name.find("nachname").text
+                    except AttributeError:
+                        try:
+                            first_name, last_name = get_first_last(speech[0].text)
+                        except AttributeError:
+                            first_name = "ERROR"
+                            last_name = "ERROR"
+                    try:
+                        position_raw = name.find("fraktion").text
+                    except (ValueError, AttributeError):
+                        position_raw = name.find("rolle").find("rolle_lang").text
+                    faction_abbrev = get_faction_abbrev(
+                        str(position_raw), faction_patterns=faction_patterns
+                    )
+
+                    faction_id = -1
+                    position_short, position_long = get_position_short_and_long(
+                        faction_abbrev
+                        if faction_abbrev
+                        else regex.sub("\n+", " ", position_raw)
+                    )
+                    if faction_abbrev:
+                        faction_id = get_faction_id(factions, faction_abbrev)
+                elif tag == "p":
+                    try:
+                        speech_text += "\n\n" + content.text
+                    except TypeError:
+                        pass
+                elif tag == "kommentar":
+                    (
+                        _,
+                        speech_replaced,
+                        contributions_simplified_frame,
+                        text_position,
+                    ) = extract(
+                        content.text,
+                        int(session_path.stem),
+                        speech_content_id,
+                        text_position,
+                        False,
+                        contributions_extended,
+                    )
+                    speech_text += "\n\n" + speech_replaced
+                    contributions_simplified.append(contributions_simplified_frame)
+
+            append_speech_record(first_name, last_name, faction_id, position_short, position_long, speaker_id, speech_text)
+            speech_content_id += 1
+
+    if contributions_simplified:
+        contributions_simplified = pd.concat(contributions_simplified, sort=False)
+    else:
+        contributions_simplified = pd.DataFrame(columns=CONTRIBUTIONS_SIMPLIFIED_COLUMNS)
+
+    # Take the quarantined brackets of this session out of the module list
+    session_quarantine = quarantined_brackets[quarantine_start:]
+    del quarantined_brackets[quarantine_start:]
+
+    return speech_records, contributions_extended.flush(), contributions_simplified, session_quarantine
+
+
+def shift_speech_ids(session_result, first_speech_id):
+    """
+    Shifts the speech ids of a session result of extract_session by first_speech_id.
+
+    :param session_result (tuple): Result of extract_session.
+    :param first_speech_id (int): Global id of the first speech of the session.
+    :return (tuple): The session result with global speech ids.
+    """
+    speech_records, contributions_extended, contributions_simplified, session_quarantine = session_result
+    for record in speech_records:
+        record["id"] += first_speech_id
+    contributions_extended["id"] += first_speech_id
+    contributions_simplified["speech_id"] += first_speech_id
+    for record in session_quarantine:
+        record["speech_id"] += first_speech_id
+    return speech_records, contributions_extended, contributions_simplified, session_quarantine
+
+
+# Tables of the worker processes (set by init_worker)
+worker_tables = None
+
+
+def init_worker(tables, pattern_timeout=extract_contributions.pattern_timeout):
+    """
+    Initializer of the worker processes: stores the stage 03 tables once per worker and sets the time limit
+    of the contribution patterns.
+    """
+    global worker_tables
+    worker_tables = tables
+    extract_contributions.pattern_timeout = pattern_timeout
+
+
+def extract_session_worker(session_path, term_number):
+    """
+    Runs extract_session in a worker process with the tables of init_worker.
+    """
+    return extract_session(session_path, term_number, worker_tables)
+
+
+def iterate_session_results(
+    sessions, tables, workers=None, max_in_flight=None, pattern_timeout=extract_contributions.pattern_timeout
+):
+    """
+    Extracts sessions (in parallel) and yields the results in the order of sessions.
+
+    :param sessions (list): (session_path, term_number) tuples.
+    :param tables (dict): Tables returned by load_tables.
+    :param workers (int): Number of worker processes (default: number of CPUs, 1 runs in this process).
+    :param max_in_flight (int): Maximum number of submitted but not yet collected sessions (default: 2 * workers).
+    :param pattern_timeout (float): Time limit of one pattern search in seconds (None: no limit).
+    :return (generator): (session_path, term_number, session_result) in the order of sessions.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        previous_pattern_timeout = extract_contributions.pattern_timeout
+        extract_contributions.pattern_timeout = pattern_timeout
+        try:
+            for session_path, term_number in sessions:
+                yield session_path, term_number, extract_session(session_path, term_number, tables)
+        finally:
+            extract_contributions.pattern_timeout = previous_pattern_timeout
+        return
+
+    max_in_flight = max(max_in_flight or 2 * workers, 1)
+    sessions = iter(sessions)
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(tables, pattern_timeout)) as executor:
+
+        def submit_next():
+            for session_path, term_number in sessions:
+                in_flight.append((session_path, term_number, executor.submit(extract_session_worker, session_path, term_number)))
+                return True
+            return False
+
+        # Keep at most max_in_flight sessions submitted and collect them in submission order
+        while len(in_flight) < max_in_flight and submit_next():
+            pass
+        while in_flight:
+            session_path, term_number, future = in_flight.popleft()
+            session_result = future.result()
+            submit_next()
+            yield session_path, term_number, session_result
+
+
+# Manifest of the incremental extraction and cache of the extracted sessions (speech ids starting at 0)
+MANIFEST_PATH = PATHS.STAGE04 / "extraction_manifest.json"
+SESSION_CACHE_DIR = PATHS.STAGE04 / "sessionCache"
+
+# Brackets whose extraction timed out (one JSON record per line)
+QUARANTINE_PATH = PATHS.STAGE04 / "quarantined_brackets.jsonl"
+
+# Source files whose changes invalidate all cached sessions
+EXTRACTOR_SOURCE_FILES = [
+    Path(__file__).resolve(),
+    Path(__file__).resolve().parent / "extract_contributions.py",
+]
+
+
+def file_hash(path, hash_object=None):
+    """
+    Returns the sha256 hash object of a file (or updates the given one with the file content).
+
+    :param path (Path): Path to the file.
+    :param hash_object (hashlib object): Hash object to update (default: a new sha256 object).
+    :return (hashlib object): The updated hash object.
+    """
+    hash_object = hash_object or hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hash_object.update(block)
+    return hash_object
+
+
+def get_extractor_version(table_paths, settings=None):
+    """
+    Returns the version of the extraction: a hash of the extractor code, of the stage 03 tables and of the settings.
+
+    :param table_paths (list): Paths of the stage 03 tables (see load_tables).
+    :param settings (dict): Settings changing the extraction results (e.g. the pattern timeout).
+    :return (str): The version hash.
+    """
+    hash_object = hashlib.sha256()
+    hash_object.update(json.dumps(settings, sort_keys=True).encode())
+    for path in list(EXTRACTOR_SOURCE_FILES) + list(table_paths):
+        hash_object.update(str(Path(path).name).encode())
+        file_hash(path, hash_object)
+    return hash_object.hexdigest()
+
+
+def get_session_fingerprint(session_path):
+    """
+    Returns the content hash of a session folder (session_content.xml and meta_data.xml).
+
+    :param session_path (Path): Session folder.
+    :return (str): The fingerprint.
+    """
+    hash_object = file_hash(session_path / "session_content.xml")
+    return file_hash(session_path / "meta_data.xml", hash_object).hexdigest()
+
+
+def read_manifest(manifest_path):
+    """
+    Reads the manifest of the incremental extraction.
+
+    :param manifest_path (Path): Path to the manifest (.json).
+    :return (dict): extractor_version and sessions (session -> entry), empty if the manifest does not exist.
+    """
+    if not manifest_path.is_file():
+        return {"extractor_version": None, "sessions": {}}
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_manifest(manifest, manifest_path):
+    """
+    Writes the manifest of the incremental extraction (replaces the old file only when it is complete).
+
+    :param manifest (dict): The manifest.
+    :param manifest_path (Path): Path to the manifest (.json).
+    """
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = manifest_path.with_suffix(".tmp")
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temporary_path, manifest_path)
+
+
+def run_extraction(
+    terms=(19, 20),
+    workers=None,
+    max_in_flight=None,
+    input_dirs=None,
+    factions_path=PATHS.FACTIONS_ABBR_STAGE03,
+    politicians_path=PATHS.MPS_FACTIONS_STAGE03,
+    lookup_path=PATHS.SPEAKER_LOOKUP_STAGE03,
+    contributions_extended_dir=PATHS.CONTRIB_EXT_19.parent,
+    speech_content_dir=PATHS.SPEECH_CONTENT_STAGE04,
+    contributions_simplified_dir=PATHS.CONTRIB_SIMPLIFIED,
+    final_contributions_simplified_dir=PATHS.FINAL_CONTRIB_SIM,
+    excel_dir=PATHS.EXCEL_FINAL_STAGE,
+    excel_speech_content_paths=None,
+    write_excel=True,
+    incremental=True,
+    manifest_path=MANIFEST_PATH,
+    session_cache_dir=SESSION_CACHE_DIR,
+    pattern_timeout=extract_contributions.pattern_timeout,
+    quarantine_path=QUARANTINE_PATH,
+):
+    """
+    Runs the extraction of stage 04 for all sessions of the given terms and writes the output files.
+
+    With incremental=True only new or changed sessions (content hash of session_content.xml and meta_data.xml)
+    are extracted, the others are read from the session cache. All sessions are extracted again if the
+    extractor code or the stage 03 tables changed. The term and combined files are always rebuilt from the
+    sessions, the contributions extended of a session are only written again if they changed.
+
+    Sessions of terms that are not extracted (not in terms or without input folder) are kept. The speech ids
+    count over the sessions of all terms in the manifest, later terms whose ids shifted are rebuilt from the
+    session cache. A ValueError is raised if the sessions of an earlier term are not in the manifest or if the
+    session cache of a later term whose ids shifted is incomplete (before any output file is written).
+
+    :param terms (tuple): Electoral terms to extract.
+    :param workers (int): Number of worker processes (default: number of CPUs, 1 runs in this process).
+    :param max_in_flight (int): Maximum number of sessions in flight (default: 2 * workers).
+    :param input_dirs (dict): Term -> folder of the split sessions (default: ELECTORAL_TERM_19_20_INPUT).
+    :param factions_path (Path): Factions with abbreviations (see load_tables).
+    :param politicians_path (Path): Politicians (see load_tables).
+    :param lookup_path (Path): Speaker faction lookup (see load_tables).
+    :param contributions_extended_dir (Path): Output folder of the contributions extended (electoral_term_<term>/<session>.pkl).
+    :param speech_content_dir (Path): Output folder of the speech content (electoral_term_<term>/speech_content.pkl).
+    :param contributions_simplified_dir (Path): Output folder of the contributions simplified.
+    :param final_contributions_simplified_dir (Path): Final stage folder of the contributions simplified.
+    :param excel_dir (Path): Folder of the Excel exports of the contributions simplified.
+    :param excel_speech_content_paths (dict): Term -> Excel export of the speech content
+        (default: EXCEL_SPEECH_STAGE04_19/20).
+    :param write_excel (bool): Write the Excel exports.
+    :param incremental (bool): Only extract new or changed sessions (False extracts all sessions).
+    :param manifest_path (Path): Manifest of the extracted sessions (.json).
+    :param session_cache_dir (Path): Cache of the extracted sessions.
+    :param pattern_timeout (float): Time limit of one pattern search in seconds (None: no limit). Brackets whose
+        extraction timed out are skipped and written to quarantine_path.
+    :param quarantine_path (Path): Output file of the quarantined brackets of all sessions (.jsonl).
+    :return (dict): Term -> number of speeches.
+    """
+    input_dirs = input_dirs or ELECTORAL_TERM_19_20_INPUT
+    excel_speech_content_paths = excel_speech_content_paths or {
+        19: PATHS.EXCEL_SPEECH_STAGE04_19,
+        20: PATHS.EXCEL_SPEECH_STAGE04_20,
+    }
+    terms = sorted(term_number for term_number in terms if input_dirs.get(term_number) and input_dirs[term_number].is_dir())
+
+    sessions = [
+        (session_path, term_number)
+        for term_number in terms
+        for session_path in sorted(input_dirs[term_number].iterdir())
+        if session_path.is_dir()
+    ]
+
+    # Find the sessions that have to be extracted
+    extractor_version = get_extractor_version(
+        [factions_path, politicians_path, lookup_path], {"pattern_timeout": pattern_timeout}
+    )
+    manifest = read_manifest(manifest_path)
+    if not incremental or manifest["extractor_version"] != extractor_version:
+        manifest = {"extractor_version": extractor_version, "sessions": {}}
+
+    # Speech ids count over the sessions of all terms, the sessions of earlier terms that are not
+    # extracted in this run have to be known from the manifest
+    for term_number in sorted(set(input_dirs) - set(terms)):
+        if term_number < max(terms, default=term_number) and not any(
+            entry["term"] == term_number for entry in manifest["sessions"].values()
+        ):
+            raise ValueError(
+                f"run_extraction: the speech ids of term {max(terms)} depend on the sessions of term {term_number}, "
+                "which are not in the manifest. Extract all terms."
+            )
+
+    fingerprints = {session_path.stem: get_session_fingerprint(session_path) for session_path, _ in sessions}
+    changed_sessions = []
+    for session_path, term_number in sessions:
+        entry = manifest["sessions"].get(session_path.stem)
+        if (
+            entry is None
+            or entry["fingerprint"] != fingerprints[session_path.stem]
+            or not (session_cache_dir / entry["piece"]).is_file()
+        ):
+            changed_sessions.append((session_path, term_number))
+    print(f"run_extraction: {len(changed_sessions)} of {len(sessions)} sessions new or changed.")
+
+    # Extract the new and changed sessions into the session cache
+    if changed_sessions:
+        tables = load_tables(factions_path, politicians_path, lookup_path, terms=tuple(terms))
+        session_results = iterate_session_results(changed_sessions, tables, workers, max_in_flight, pattern_timeout)
+        for session_path, term_number, session_result in tqdm(session_results, total=len(changed_sessions), desc="Extract sessions"):
+            piece = Path(f"electoral_term_{term_number}") / f"{session_path.stem}.pkl"
+            (session_cache_dir / piece).parent.mkdir(parents=True, exist_ok=True)
+            pd.to_pickle(session_result, session_cache_dir / piece)
+            manifest["sessions"][session_path.stem] = {
+                "term": term_number,
+                "fingerprint": fingerprints[session_path.stem],
+                "piece": piece.as_posix(),
+                "speeches": len(session_result[0]),
+                "first_speech_id": None,
+                "outputs": [],
+            }
+
+    # Remove sessions of the extracted terms that do not exist anymore (with their cached result and output files)
+    removed_sessions = [
+        session
+        for session, entry in manifest["sessions"].items()
+        if entry["term"] in terms and session not in fingerprints
+    ]
+    for session in removed_sessions:
+        entry = manifest["sessions"].pop(session)
+        (session_cache_dir / entry["piece"]).unlink(missing_ok=True)
+        for output_path in entry["outputs"]:
+            Path(output_path).unlink(missing_ok=True)
+
+    # First speech id of every session of the manifest (in session order, term 19 before term 20)
+    manifest_sessions = sorted(manifest["sessions"].items(), key=lambda item: (item[1]["term"], item[0]))
+    first_speech_ids = {}
+    speech_content_id = FIRST_SPEECH_ID
+    for session, entry in manifest_sessions:
+        first_speech_ids[session] = speech_content_id
+        speech_content_id += entry["speeches"]
+
+    # Later terms whose speech ids shifted are rebuilt from the session cache as well
+    shifted_terms = {
+        entry["term"]
+        for session, entry in manifest_sessions
+        if entry["term"] not in terms and entry["first_speech_id"] != first_speech_ids[session]
+    }
+    for term_number in sorted(shifted_terms):
+        if not all(
+            (session_cache_dir / entry["piece"]).is_file()
+            for entry in manifest["sessions"].values()
+            if entry["term"] == term_number
+        ):
+            # Keep the extracted sessions, but write no outputs with colliding speech ids
+            write_manifest(manifest, manifest_path)
+            raise ValueError(
+                f"run_extraction: the speech ids of term {term_number} shifted, but its session cache is incomplete. "
+                f"Extract term {term_number} as well."
+            )
+        print(f"run_extraction: speech ids of term {term_number} shifted, rebuilding it from the session cache.")
+    terms = sorted(set(terms) | shifted_terms)
+    sessions = [(session, entry) for session, entry in manifest_sessions if entry["term"] in terms]
+
+    for term_number in terms:
+        (contributions_extended_dir / f"electoral_term_{term_number}").mkdir(parents=True, exist_ok=True)
+        (speech_content_dir / f"electoral_term_{term_number}").mkdir(parents=True, exist_ok=True)
+    contributions_simplified_dir.mkdir(parents=True, exist_ok=True)
+    final_contributions_simplified_dir.mkdir(parents=True, exist_ok=True)
+
+    # Rebuild the output files from the session cache in session order
+    speech_records = {term_number: [] for term_number in terms}
+    contributions_simplified = {term_number: [] for term_number in terms}
+    quarantine = []
+
+    for session, entry in sessions:
+        term_number = entry["term"]
+        speech_content_id = first_speech_ids[session]
+        session_records, contributions_extended, session_contributions_simplified, session_quarantine = shift_speech_ids(
+            pd.read_pickle(session_cache_dir / entry["piece"]), speech_content_id
+        )
+
+        contributions_extended_path = contributions_extended_dir / f"electoral_term_{term_number}" / f"{session}.pkl"
+        # The speech ids of a session change with the number of speeches of the sessions before
+        if entry["first_speech_id"] != speech_content_id or not contributions_extended_path.is_file():
+            contributions_extended.to_pickle(contributions_extended_path)
+            entry["first_speech_id"] = speech_content_id
+            entry["outputs"] = [str(contributions_extended_path)]
+
+        speech_records[term_number].extend(session_records)
+        quarantine.extend(session_quarantine)
+        contributions_simplified[term_number].append(session_contributions_simplified)
+
+    simplified_contribs_by_term = {}
+    for term_number in terms:
+        speech_content = pd.DataFrame.from_records(speech_records[term_number])
+        speech_content.to_pickle(speech_content_dir / f"electoral_term_{term_number}" / "speech_content.pkl")
+
+        term_contributions_simplified = pd.concat(contributions_simplified[term_number], sort=False)
+        term_contributions_simplified.to_pickle(contributions_simplified_dir / f"contributions_simplified_{term_number}.pkl")
+        term_contributions_simplified.to_pickle(final_contributions_simplified_dir / f"contributions_simplified_{term_number}.pkl")
+        simplified_contribs_by_term[term_number] = term_contributions_simplified
+
+        if write_excel:
+            term_contributions_simplified.to_excel(excel_dir / f"contributions_simplified_{term_number}.xlsx", index=False)
+            speech_content.to_excel(excel_speech_content_paths[term_number], index=False)
+
+    # make combined contributions simplified file (with the existing files of the terms that were not rebuilt)
+    for term_number in sorted({entry["term"] for entry in manifest["sessions"].values()} - set(terms)):
+        term_path = contributions_simplified_dir / f"contributions_simplified_{term_number}.pkl"
+        if term_path.is_file():
+            simplified_contribs_by_term[term_number] = pd.read_pickle(term_path)
+    simplified_contribs_by_term = dict(sorted(simplified_contribs_by_term.items()))
+    if simplified_contribs_by_term:
+        combined_df = pd.concat(simplified_contribs_by_term.values(), ignore_index=True)
+        combined_df.to_pickle(contributions_simplified_dir / "contributions_simplified_19_20.pkl")
+        combined_df.to_pickle(final_contributions_simplified_dir / "contributions_simplified_19_20.pkl")
+        if write_excel:
+            combined_df.to_excel(excel_dir / "contributions_simplified_19_20.xlsx", index=False)
+
+    # Write the quarantined brackets and count them per extractor
+    quarantine_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(quarantine_path, "w", encoding="utf-8") as f:
+        for record in quarantine:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    timeouts = {}
+    for record in quarantine:
+        timeouts[record["extractor"]] = timeouts.get(record["extractor"], 0) + 1
+    if timeouts:
+        print(f"run_extraction: {len(quarantine)} brackets timed out {timeouts}, see <{quarantine_path}>.")
+
+    write_manifest(manifest, manifest_path)
+
+    return {term_number: len(speech_records[term_number]) for term_number in terms}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel extraction of speeches and contributions (stage 04).")
+    parser.add_argument("--terms", type=int, nargs="+", default=[19, 20], help="Electoral terms to extract.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: number of CPUs).")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="Maximum number of sessions in flight (default: 2 * workers).")
+    parser.add_argument("--no-excel", action="store_true", help="Do not write the Excel exports.")
+    parser.add_argument("--full", action="store_true", help="Extract all sessions again (ignore the manifest).")
+    parser.add_argument(
+        "--pattern-timeout",
+        type=float,
+        default=extract_contributions.pattern_timeout,
+        help="Time limit of one pattern search in seconds (0: no limit).",
+    )
+    args = parser.parse_args()
+
+    speeches = run_extraction(
+        terms=tuple(args.terms),
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        write_excel=not args.no_excel,
+        incremental=not args.full,
+        pattern_timeout=args.pattern_timeout or None,
+    )
+    for term_number, count in speeches.items():
+        print(f"Electoral term {term_number}: {count} speeches saved.")
@@ -1,8 +1,86 @@
 # imports
+import argparse
+import hashlib
+import math
+import os
+import pickle
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 import regex
 import Levenshtein
+from tqdm import tqdm
+
+from dataGeneration import paths as PATHS
+
+# Persistent resolutions of the matching: one pickle per electoral term
+RESOLUTION_CACHE_DIR = PATHS.STAGE06 / "resolutionCache"
+
+
+class FuzzyNameIndex:
+    """
+    Index of distinct names for fuzzy matching with a minimum Levenshtein ratio.
+
+    Levenshtein.ratio(a, b) = 1 - d / (len(a) + len(b)) with the insertion/deletion distance d >= |len(a) - len(b)|,
+    so only names with a length in [len * t / (2 - t), len * (2 - t) / t] can reach the threshold t. The names
+    are grouped by length, the exact ratio is only computed for these groups and the result is memoized per
+    distinct (name, threshold), as OCR-mangled names repeat a lot.
+    """
+
+    def __init__(self, names):
+        """
+        :param names (iterable): Names (duplicates and missing values are ignored).
+        """
+        self.names_by_length = {}
+        for name in dict.fromkeys(names):
+            if isinstance(name, str):
+                self.names_by_length.setdefault(len(name), []).append(name)
+        self.cache = {}
+        self.statistics = {"hits": 0, "misses": 0, "ratios": 0}
+
+    def get_matches(self, name, fuzzy_threshold=0.7):
+        """
+        Returns the names with a Levenshtein ratio to name of at least fuzzy_threshold.
+
+        :param name (str): Name to compare against.
+        :param fuzzy_threshold (float): Minimum similarity ratio.
+        :return (tuple): The matching names (in the order of the index names per length).
+        """
+        key = (name, fuzzy_threshold)
+        matches = self.cache.get(key)
+        if matches is not None:
+            self.statistics["hits"] += 1
+            return matches
+        self.statistics["misses"] += 1
+
+        if fuzzy_threshold <= 0:
+            lengths = self.names_by_length
+        elif fuzzy_threshold > 1:
+            # The ratio is at most 1
+            lengths = []
+        else:
+            lengths = range(
+                math.floor(len(name) * fuzzy_threshold / (2 - fuzzy_threshold)),
+                math.ceil(len(name) * (2 - fuzzy_threshold) / fuzzy_threshold) + 1,
+            )
+        matches = []
+        for length in lengths:
+            candidates = self.names_by_length.get(length, ())
+            self.statistics["ratios"] += len(candidates)
+            matches.extend(
+                candidate for candidate in candidates if Levenshtein.ratio(candidate, name) >= fuzzy_threshold
+            )
+        matches = self.cache[key] = tuple(matches)
+        return matches
+
+
+# Fuzzy indexes of get_fuzzy_names: distinct last names -> FuzzyNameIndex (least recently used ones are removed)
+fuzzy_name_indexes = OrderedDict()
+fuzzy_name_indexes_size = 8
 
 
 def get_fuzzy_names(df, name_to_check, fuzzy_threshold=0.7):
@@ -15,9 +93,16 @@ def get_fuzzy_names(df, name_to_check, fuzzy_threshold=0.7):
     :param fuzzy_threshold (float): Minimum similarity ratio.
     :return: (pd.DataFrame): Matching subset of df.
     """
-    return df.loc[
-        df["last_name"].apply(Levenshtein.ratio, args=[name_to_check]) >= fuzzy_threshold
-    ]
+    last_names = tuple(pd.unique(df["last_name"]))
+    fuzzy_index = fuzzy_name_indexes.get(last_names)
+    if fuzzy_index is None:
+        fuzzy_index = fuzzy_name_indexes[last_names] = FuzzyNameIndex(last_names)
+        if len(fuzzy_name_indexes) > fuzzy_name_indexes_size:
+            fuzzy_name_indexes.popitem(last=False)
+    else:
+        fuzzy_name_indexes.move_to_end(last_names)
+
+    return df.loc[df["last_name"].isin(fuzzy_index.get_matches(name_to_check, fuzzy_threshold))]
 
 
 def get_possible_matches(df, **columns):
@@ -320,8 +405,271 @@ def check_woman(df, index, acad_title, possible_matches):
     return False, possible_matches
 
 
+class PoliticianIndex:
+    """
+    Index of the politicians of an electoral term for insert_politician_id_into_contributions_extended.
+
+    The candidates of a contribution are looked up by last name in a dict (last_name -> row positions) and
+    narrowed with small maps (faction_id, constituency, gender -> row positions) and the first names of
+    the few candidate rows, instead of filtering the whole DataFrame for every contribution. Row positions
+    are kept in the order of the DataFrame, so the first candidate is the same row as before.
+    """
+
+    def __init__(self, politicians):
+        """
+        :param politicians (pd.DataFrame): Politicians of the term with ui, faction_id, first_name (list of
+            lower case tokens), last_name, constituency and gender (lower case, see stage 05).
+        """
+        self.politicians = politicians
+        self.ui = politicians["ui"].to_numpy()
+        self.faction_id = politicians["faction_id"].to_numpy()
+        self.last_name = politicians["last_name"].to_numpy(dtype=object)
+        self.constituency = politicians["constituency"].to_numpy(dtype=object)
+        self.first_name_sets = [set(first_name) for first_name in politicians["first_name"]]
+
+        self.last_name_rows = self.build_map(self.last_name)
+        self.faction_rows = self.build_map(self.faction_id)
+        self.constituency_rows = self.build_map(self.constituency)
+        self.gender_rows = self.build_map(politicians["gender"].to_numpy(dtype=object))
+
+        # Fuzzy index of the distinct last names
+        self.fuzzy_index = FuzzyNameIndex(self.last_name_rows)
+
+        # Resolutions of the matching keys, shared by all sessions of the term (see resolve_cached)
+        self.resolutions = {}
+        self.resolution_statistics = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def build_map(values):
+        """
+        Maps every value to the positions of its rows (missing values are not mapped, they never match).
+
+        :param values (np.ndarray): Column values.
+        :return (dict): value -> np.ndarray of row positions (ascending).
+        """
+        rows = {}
+        for row, value in enumerate(values):
+            if value == value:
+                rows.setdefault(value, []).append(row)
+        return {value: np.array(value_rows, dtype=np.intp) for value, value_rows in rows.items()}
+
+    def narrow(self, rows, value_rows):
+        """
+        Returns the candidate rows contained in the rows of a value.
+
+        :param rows (np.ndarray): Candidate row positions.
+        :param value_rows (np.ndarray): Row positions of the value (None: no rows).
+        :return (np.ndarray): The remaining candidate row positions (ascending).
+        """
+        if value_rows is None:
+            return rows[:0]
+        return rows[np.isin(rows, value_rows, assume_unique=True)]
+
+    def get_fuzzy_rows(self, last_name, fuzzy_threshold=0.7):
+        """
+        Returns the rows whose last name has a Levenshtein ratio of at least fuzzy_threshold (see get_fuzzy_names).
+
+        :param last_name (str): Last name to compare against.
+        :param fuzzy_threshold (float): Minimum similarity ratio.
+        :return (np.ndarray): Row positions (ascending).
+        """
+        matches = [self.last_name_rows[candidate] for candidate in self.fuzzy_index.get_matches(last_name, fuzzy_threshold)]
+        if not matches:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(matches))
+
+    def is_unique(self, rows, values=None):
+        """
+        Checks whether the rows have exactly one unique value (see check_unique).
+
+        :param rows (np.ndarray): Row positions.
+        :param values (np.ndarray): Column values (default: ui).
+        :return (bool): True if unique, False otherwise.
+        """
+        return len(np.unique((self.ui if values is None else values)[rows])) == 1
+
+    def resolve(self, last_name, first_name, faction_id, constituency, frau):
+        """
+        Resolves the politician of a contribution with the matching cascade of
+        insert_politician_id_into_contributions_extended: last name (fuzzy if not found), faction,
+        first name, constituency and gender.
+
+        :param last_name (str): Lower case last name.
+        :param first_name (list[str]): Lower case first name tokens.
+        :param faction_id (int): Faction ID of the contribution (negative if unknown).
+        :param constituency (str): Lower case constituency ("" if unknown).
+        :param frau (bool): Whether "Frau" is in the academic title (list or str) of the contribution, used
+            for gender heuristics.
+        :return (int, int, str): politician_id (or None), faction_id to set (or None) and the status
+            "found", "no_last_name" (empty last name), "no_candidates" (not even a fuzzy match) or
+            "ambiguous" (no unique match).
+        """
+        # E.g. Präsident, Bundeskanzler, Staatssekretär etc.
+        if not last_name:
+            return None, None, "no_last_name"
+
+        # Check Last Name.
+        rows = self.last_name_rows.get(last_name)
+        if rows is not None and self.is_unique(rows):
+            found_faction_id = int(self.faction_id[rows[0]]) if self.is_unique(rows, self.faction_id) else None
+            return int(self.ui[rows[0]]), found_faction_id, "found"
+
+        # Fuzzy search, if last_name can't be found.
+        if rows is None:
+            rows = self.get_fuzzy_rows(last_name)
+        if len(rows) == 0:
+            return None, None, "no_candidates"
+
+        # Check Faction ID.
+        if faction_id >= 0:
+            rows = self.narrow(rows, self.faction_rows.get(faction_id))
+            if self.is_unique(rows):
+                found_faction_id = int(self.faction_id[rows[0]]) if self.is_unique(rows, self.faction_id) else None
+                return int(self.ui[rows[0]]), found_faction_id, "found"
+
+        # Check First Name.
+        if first_name:
+            first_name_set = set(first_name)
+            rows = rows[[not self.first_name_sets[row].isdisjoint(first_name_set) for row in rows]]
+            if self.is_unique(rows):
+                return int(self.ui[rows[0]]), None, "found"
+
+        # Match with location info.
+        if constituency:
+            rows = rows[[Levenshtein.ratio(self.constituency[row], constituency) > 0.7 for row in rows]]
+            if self.is_unique(rows):
+                return int(self.ui[rows[0]]), None, "found"
+        elif constituency == "":
+            # Probably someone joined during the period, e.g. there
+            # is an entry in STAMMDATEN for the correct person
+            # without the location info, as there was only one
+            # person with the last name before.
+            rows = self.narrow(rows, self.constituency_rows.get(""))
+            if self.is_unique(rows):
+                return int(self.ui[rows[0]]), None, "found"
+
+        # Check Gender.
+        if frau:
+            rows = self.narrow(rows, self.gender_rows.get("weiblich"))
+            if self.is_unique(rows):
+                return int(self.ui[rows[0]]), None, "found"
+
+        return None, None, "ambiguous"
+
+    def resolve_cached(self, key):
+        """
+        Resolves a matching key with resolve and remembers the resolution (also unresolvable ones), as
+        the same speakers interject in hundreds of sessions of a term.
+
+        :param key (tuple): (last_name, first_name (tuple), faction_id, constituency, frau) as
+            normalized by insert_politician_id_into_contributions_extended (hashable, see get_matching_keys).
+        :return (int, int, str): Resolution of the key (see resolve).
+        """
+        resolution = self.resolutions.get(key)
+        if resolution is None:
+            self.resolution_statistics["misses"] += 1
+            resolution = self.resolutions[key] = self.resolve(*key)
+        else:
+            self.resolution_statistics["hits"] += 1
+        return resolution
+
+
+def get_resolution_cache_fingerprint(lookup_path=PATHS.SPEAKER_LOOKUP_STAGE03):
+    """
+    Returns the fingerprint of the resolution cache: the sha256 of the speaker lookup (derived from
+    MDB_STAMMDATEN) and of this module, so stored resolutions are discarded when either changes.
+
+    :param lookup_path (Path): Path to speaker_faction_lookup.csv.
+    :return (str): Hex digest.
+    """
+    hash_object = hashlib.sha256()
+    for path in (Path(lookup_path), Path(__file__)):
+        hash_object.update(path.read_bytes())
+    return hash_object.hexdigest()
+
+
+def get_resolution_cache_path(electoral_term, cache_dir=RESOLUTION_CACHE_DIR):
+    """
+    Returns the path to the resolution cache of a term.
+
+    :param electoral_term (int): Electoral term.
+    :param cache_dir (Path): Directory of the resolution cache.
+    :return (Path): Path to the resolution cache of the term.
+    """
+    return Path(cache_dir) / f"electoral_term_{electoral_term}.pkl"
+
+
+def load_resolution_cache(politician_index, electoral_term, fingerprint, cache_dir=RESOLUTION_CACHE_DIR):
+    """
+    Loads the stored resolutions of a term into a PoliticianIndex. Stored resolutions with another
+    fingerprint or a file that can not be unpickled (e.g. truncated) are ignored (they are replaced on
+    the next save_resolution_cache).
+
+    :param politician_index (PoliticianIndex): Index of the politicians of the term.
+    :param electoral_term (int): Electoral term.
+    :param fingerprint (str): Current fingerprint (see get_resolution_cache_fingerprint).
+    :param cache_dir (Path): Directory of the resolution cache.
+    :return (int): Number of loaded resolutions.
+    """
+    path = get_resolution_cache_path(electoral_term, cache_dir)
+    if not path.exists():
+        return 0
+    try:
+        with open(path, "rb") as f:
+            cache = pickle.load(f)
+    except Exception:
+        # Unpickling can raise almost any error on a corrupt file, treat it as a missing cache
+        return 0
+    if not isinstance(cache, dict) or cache.get("fingerprint") != fingerprint:
+        return 0
+    politician_index.resolutions.update(cache["resolutions"])
+    return len(cache["resolutions"])
+
+
+def save_resolution_cache(politician_index, electoral_term, fingerprint, cache_dir=RESOLUTION_CACHE_DIR):
+    """
+    Stores the resolutions of a PoliticianIndex for the next runs (written atomically).
+
+    :param politician_index (PoliticianIndex): Index of the politicians of the term.
+    :param electoral_term (int): Electoral term.
+    :param fingerprint (str): Current fingerprint (see get_resolution_cache_fingerprint).
+    :param cache_dir (Path): Directory of the resolution cache.
+    :return (Path): Path to the resolution cache of the term.
+    """
+    path = get_resolution_cache_path(electoral_term, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(
+            {"fingerprint": fingerprint, "resolutions": politician_index.resolutions},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(tmp_path, path)
+    return path
+
+
+def get_matching_keys(df):
+    """
+    Returns the hashable matching keys of the contributions (after the normalization of
+    insert_politician_id_into_contributions_extended). first_name and acad_title are lists in stage 05,
+    the key holds the first name tokens as tuple and of the academic title only whether it contains
+    "Frau", the only part the matching reads.
+
+    :param df (pd.DataFrame): Normalized contributions.
+    :return (iterator): (last_name, first_name (tuple), faction_id, constituency, frau) per row.
+    """
+    return zip(
+        df["last_name"].tolist(),
+        map(tuple, df["first_name"].tolist()),
+        df["faction_id"].tolist(),
+        df["constituency"].tolist(),
+        ["Frau" in acad_title for acad_title in df["acad_title"].tolist()],
+    )
+
+
 def insert_politician_id_into_contributions_extended(
-    df, politicians_electoral_term, mgs_electoral_term
+    df, politicians_electoral_term, mgs_electoral_term, politician_index=None
 ):
     """
     Inserts politician IDs into a contributions DataFrame by matching names, factions, and other metadata.
@@ -330,6 +678,8 @@ def insert_politician_id_into_contributions_extended(
     :param df (pd.DataFrame): Contributions DataFrame to enrich with politician_id.
     :param politicians_electoral_term (pd.DataFrame): DataFrame containing parliament members for the term.
     :param mgs_electoral_term (pd.DataFrame): DataFrame containing government members for the term.
+    :param politician_index (PoliticianIndex): Index of politicians_electoral_term, built once per term
+        so its resolutions are reused across sessions (default: built for this call).
     :return: (pd.DataFrame, pd.DataFrame): Updated DataFrame with politician IDs, and a DataFrame of unresolved cases.
     """
     assert {
@@ -358,104 +708,339 @@ def insert_politician_id_into_contributions_extended(
     df["last_name"] = df["last_name"].str.replace("ß", "ss", regex=False)
     df.insert(4, "politician_id", -1)
 
-    for index, row in df.iterrows():
+    if politician_index is None:
+        politician_index = PoliticianIndex(politicians_electoral_term)
 
-        # Start Matching
+    # Group the rows by their distinct matching key and resolve every key only once
+    keys = get_matching_keys(df)
+    key_codes = {}
+    codes = np.fromiter(
+        (key_codes.setdefault(key, len(key_codes)) for key in keys),
+        dtype=np.intp,
+        count=len(df),
+    )
+    resolutions = [politician_index.resolve_cached(key) for key in key_codes]
+
+    # Broadcast the resolutions back onto the rows
+    politician_ids = np.array(
+        [-1 if politician_id is None else politician_id for politician_id, _, _ in resolutions]
+    )[codes]
+    faction_ids = np.array([faction_id for _, faction_id, _ in resolutions], dtype=object)[codes]
+    statuses = np.array([status for _, _, status in resolutions], dtype=object)[codes]
+
+    # No reliable match found: store for debugging (rows as before the assignment)
+    # Example: Meyer in 01033. Have the same last name and
+    # are in the same faction at same period. In this
+    # particular case the location information in the toc
+    # "Westhagen", does not match with the two possible
+    # location informations "Hagen", "Bremen"
+    # probably "Hagen" == "Westfalen" is meant.
+    # Other things: Cornelia Irgendwas, ist in dem spoken content
+    # mit "Conny Irgendwas abgespeichert. Findet Vornamen natürlich
+    # nicht.
+    problem_positions = np.flatnonzero(statuses != "found")
+    if len(problem_positions):
+        values = df.values
+        problem_df = [
+            pd.Series(values[position], index=df.columns, name=df.index[position])
+            for position in problem_positions
+        ]
+
+    df["politician_id"] = politician_ids
+    faction_positions = np.flatnonzero(faction_ids != None)  # noqa: E711
+    if len(faction_positions):
+        faction_column = df["faction_id"].to_numpy(copy=True)
+        faction_column[faction_positions] = faction_ids[faction_positions]
+        df["faction_id"] = faction_column
+
+    if (statuses == "ambiguous").any():
+        # Restore original name values in case further postprocessing requires it
+        df["first_name"] = first_name_copy
+        df["last_name"] = last_name_copy
 
-        # E.g. Präsident, Bundeskanzler, Staatssekretär etc.
-        if not row["last_name"]:
-            # Skip entries with empty last names (likely moderators etc.)
-            problem_df.append(row)
-            continue
-        else:
-            found, possible_matches = check_last_name(
-                df, index, politicians_electoral_term, row["last_name"]
-            )
-            if found:
-                if check_unique(possible_matches, col="faction_id"):
-                    set_id(
-                        df,
-                        index,
-                        possible_matches,
-                        col_set="faction_id",
-                        col_check="faction_id",
-                    )
-                    continue
-                else:
-                    continue
+    problem_df = pd.DataFrame(problem_df)
+    return df, problem_df
 
-        # Fuzzy search, if last_name can't be found.
-        if len(possible_matches) == 0:
-            possible_matches = get_fuzzy_names(
-                politicians_electoral_term, row["last_name"]
-            )
 
-        if len(possible_matches) == 0:
-            problem_df.append(row)
-            continue
+def check_batched_matching(df, politicians_electoral_term):
+    """
+    Regression check of the batched matching of insert_politician_id_into_contributions_extended against
+    resolving every row on its own (e.g. with contributions of stage 05, where first_name and acad_title
+    are lists).
+
+    :param df (pd.DataFrame): Contributions (not modified).
+    :param politicians_electoral_term (pd.DataFrame): Politicians of the term.
+    :return (list): Mismatches as (index, (politician_id, faction_id) of the row on its own,
+        (politician_id, faction_id) of the batched matching).
+    """
+    matched, _ = insert_politician_id_into_contributions_extended(
+        df.copy(), politicians_electoral_term, None
+    )
+    politician_index = PoliticianIndex(politicians_electoral_term)
+
+    mismatches = []
+    for (index, row), politician_id, faction_id in zip(
+        df.iterrows(), matched["politician_id"], matched["faction_id"]
+    ):
+        constituency = "" if pd.isna(row["constituency"]) else row["constituency"]
+        expected_politician_id, expected_faction_id, _ = politician_index.resolve(
+            row["last_name"].lower().replace("ß", "ss"),
+            [string.lower() for string in row["first_name"]],
+            row["faction_id"],
+            constituency.lower(),
+            "Frau" in row["acad_title"],
+        )
+        expected = (
+            -1 if expected_politician_id is None else expected_politician_id,
+            row["faction_id"] if expected_faction_id is None else expected_faction_id,
+        )
+        if expected != (politician_id, faction_id):
+            mismatches.append((index, expected, (politician_id, faction_id)))
+    return mismatches
 
-        # Check Faction ID.
-        if row["faction_id"] >= 0:
-            found, possible_matches = check_faction_id(
-                df, index, possible_matches, row["faction_id"]
-            )
-            if found:
-                if check_unique(possible_matches, col="faction_id"):
-                    df["faction_id"].at[index] = int(possible_matches["faction_id"].iloc[0])
-                    continue
-                else:
-                    continue
 
-        # Check First Name.
-        if row["first_name"]:
-            found, possible_matches = check_first_name(
-                df, index, possible_matches, row["first_name"]
-            )
-            if found:
-                continue
+# Input and output folders of the matching (stage 06)
+CONTRIBUTIONS_EXTENDED_INPUT = PATHS.STAGE05 / "contributionsExtendedStage05"
+CONTRIBUTIONS_EXTENDED_OUTPUT = PATHS.CONTRIBUTIONS_EXTENDED_STAGE06
 
-        # Match with location info.
-        if row["constituency"]:
-            found, possible_matches = check_location_info(
-                df, index, possible_matches, row["constituency"]
-            )
-            if found:
-                continue
-        elif row["constituency"] == "":
-            # Probably someone joined during the period, e.g. there
-            # is an entry in STAMMDATEN for the correct person
-            # without the location info, as there was only one
-            # person with the last name before.
-            possible_matches = get_possible_matches(possible_matches, constituency="")
 
-            if check_unique(possible_matches):
-                set_id(
-                    df, index, possible_matches, col_set="politician_id", col_check="ui"
-                )
-                continue
+def load_politicians(lookup_path=PATHS.SPEAKER_LOOKUP_STAGE03):
+    """
+    Loads the politicians of the speaker lookup and normalizes the names like the contributions
+    (lower case, "ß" -> "ss", first names split into tokens).
 
-        # Check Gender.
-        found, possible_matches = check_woman(
-            df, index, row["acad_title"], possible_matches
-        )
-        if found:
+    :param lookup_path (Path): Path to speaker_faction_lookup.csv.
+    :return (pd.DataFrame): Politicians with ui, electoral_term, faction_id, first_name, last_name, gender,
+        constituency and institution_type.
+    """
+    politicians = pd.read_csv(lookup_path)
+    politicians = politicians.loc[
+        :,
+        [
+            "ui",
+            "electoral_term",
+            "faction_id",
+            "first_name",
+            "last_name",
+            "gender",
+            "constituency",
+            "institution_type",
+        ],
+    ].copy()
+
+    politicians = politicians.astype(dtype={"ui": "int64"})
+
+    # Some cleaning to make matching easier.
+    politicians["constituency"] = politicians["constituency"].fillna("")
+
+    politicians["first_name"] = politicians["first_name"].str.lower()
+    politicians["last_name"] = politicians["last_name"].str.lower()
+    politicians["constituency"] = politicians["constituency"].str.lower()
+
+    politicians["first_name"] = politicians["first_name"].str.replace("ß", "ss", regex=False)
+    politicians["last_name"] = politicians["last_name"].str.replace("ß", "ss", regex=False)
+
+    politicians["first_name"] = politicians["first_name"].apply(str.split)
+    return politicians
+
+
+def get_term_tables(politicians, term_number):
+    """
+    Returns the politicians and government members of an electoral term.
+
+    :param politicians (pd.DataFrame): Politicians returned by load_politicians.
+    :param term_number (int): Electoral term.
+    :return (pd.DataFrame, pd.DataFrame): Politicians and government members of the term.
+    """
+    politicians_electoral_term = politicians.loc[politicians["electoral_term"] == term_number]
+    gov_members_electoral_term = politicians_electoral_term.loc[
+        politicians_electoral_term["institution_type"] == "Regierungsmitglied"
+    ]
+    return politicians_electoral_term, gov_members_electoral_term
+
+
+def list_match_sessions(input_dir=CONTRIBUTIONS_EXTENDED_INPUT, output_dir=CONTRIBUTIONS_EXTENDED_OUTPUT):
+    """
+    Lists the contributions extended files of stage 05 (electoral_term_XX/*.pkl) in a fixed order.
+
+    :param input_dir (Path): Folder of the contributions extended of stage 05.
+    :param output_dir (Path): Folder of the contributions extended of stage 06.
+    :return (list): (input_path, output_path, term_number) tuples sorted by term folder and file name.
+    """
+    sessions = []
+    for folder_path in sorted(Path(input_dir).iterdir()):
+        if not folder_path.is_dir():
             continue
 
-        # No reliable match found: store for debugging
-        # Example: Meyer in 01033. Have the same last name and
-        # are in the same faction at same period. In this
-        # particular case the location information in the toc
-        # "Westhagen", does not match with the two possible
-        # location informations "Hagen", "Bremen"
-        # probably "Hagen" == "Westfalen" is meant.
-        # Other things: Cornelia Irgendwas, ist in dem spoken content
-        # mit "Conny Irgendwas abgespeichert. Findet Vornamen natürlich
-        # nicht.
-        problem_df.append(row)
+        term_number = regex.search(r"(?<=electoral_term_)\d{2}", folder_path.stem)
+        if term_number is None:
+            continue
+        term_number = int(term_number.group(0))
 
-        # Restore original name values in case further postprocessing requires it
-        df["first_name"] = first_name_copy
-        df["last_name"] = last_name_copy
+        for input_path in sorted(folder_path.glob("*.pkl")):
+            sessions.append((input_path, Path(output_dir) / folder_path.stem / input_path.name, term_number))
+    return sessions
 
-    problem_df = pd.DataFrame(problem_df)
-    return df, problem_df
\ No newline at end of file
+
+def match_session(input_path, output_path, politicians_electoral_term, gov_members_electoral_term, politician_index):
+    """
+    Matches the contributions extended of one session and writes them to output_path.
+
+    :param input_path (Path): Contributions extended of stage 05.
+    :param output_path (Path): Contributions extended of stage 06.
+    :param politicians_electoral_term (pd.DataFrame): Politicians of the term.
+    :param gov_members_electoral_term (pd.DataFrame): Government members of the term.
+    :param politician_index (PoliticianIndex): Index of politicians_electoral_term.
+    :return (pd.DataFrame, dict): Unresolved cases of the session and the resolutions that were
+        added to politician_index.resolutions by this session.
+    """
+    resolution_count = len(politician_index.resolutions)
+    contributions_extended = pd.read_pickle(input_path)
+
+    _, problems = insert_politician_id_into_contributions_extended(
+        contributions_extended,
+        politicians_electoral_term,
+        gov_members_electoral_term,
+        politician_index,
+    )
+
+    contributions_extended.to_pickle(output_path)
+    new_resolutions = dict(islice(politician_index.resolutions.items(), resolution_count, None))
+    return problems, new_resolutions
+
+
+# Term tables of a worker process: term -> (politicians, government members, PoliticianIndex), set by init_match_worker
+worker_terms = None
+
+def init_match_worker(term_tables, term_resolutions):
+    """
+    Initializer of the worker processes: stores the politicians and government members of every term
+    once per worker and builds the PoliticianIndex of the terms with the known resolutions.
+    """
+    global worker_terms
+    worker_terms = {}
+    for term_number, (politicians_electoral_term, gov_members_electoral_term) in term_tables.items():
+        politician_index = PoliticianIndex(politicians_electoral_term)
+        politician_index.resolutions.update(term_resolutions.get(term_number, {}))
+        worker_terms[term_number] = (politicians_electoral_term, gov_members_electoral_term, politician_index)
+
+
+def match_session_worker(input_path, output_path, term_number):
+    """
+    Runs match_session in a worker process with the term tables of init_match_worker.
+    """
+    return match_session(input_path, output_path, *worker_terms[term_number])
+
+
+def iterate_match_results(sessions, term_tables, term_indexes, workers=None, max_in_flight=None):
+    """
+    Matches sessions (in parallel) and yields the results in the order of sessions.
+
+    :param sessions (list): (input_path, output_path, term_number) tuples.
+    :param term_tables (dict): Term -> (politicians, government members) of the term.
+    :param term_indexes (dict): Term -> PoliticianIndex of the term (its resolutions are shared with the workers).
+    :param workers (int): Number of worker processes (default: number of CPUs, 1 runs in this process).
+    :param max_in_flight (int): Maximum number of submitted but not yet collected sessions (default: 2 * workers).
+    :return (generator): (input_path, term_number, (problems, new_resolutions)) in the order of sessions.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for input_path, output_path, term_number in sessions:
+            yield input_path, term_number, match_session(
+                input_path, output_path, *term_tables[term_number], term_indexes[term_number]
+            )
+        return
+
+    term_resolutions = {term_number: index.resolutions for term_number, index in term_indexes.items()}
+    max_in_flight = max(max_in_flight or 2 * workers, 1)
+    sessions = iter(sessions)
+    in_flight = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_match_worker, initargs=(term_tables, term_resolutions)
+    ) as executor:
+
+        def submit_next():
+            for input_path, output_path, term_number in sessions:
+                in_flight.append(
+                    (input_path, term_number, executor.submit(match_session_worker, input_path, output_path, term_number))
+                )
+                return True
+            return False
+
+        # Keep at most max_in_flight sessions submitted and collect them in submission order
+        while len(in_flight) < max_in_flight and submit_next():
+            pass
+        while in_flight:
+            input_path, term_number, future = in_flight.popleft()
+            session_result = future.result()
+            submit_next()
+            yield input_path, term_number, session_result
+
+
+def run_matching(
+    workers=None,
+    max_in_flight=None,
+    input_dir=CONTRIBUTIONS_EXTENDED_INPUT,
+    output_dir=CONTRIBUTIONS_EXTENDED_OUTPUT,
+    lookup_path=PATHS.SPEAKER_LOOKUP_STAGE03,
+    resolution_cache_dir=RESOLUTION_CACHE_DIR,
+):
+    """
+    Runs the matching of stage 06 for all contributions extended files of stage 05 and writes them to
+    output_dir. The sessions are matched in worker processes, the politicians of the terms are sent to
+    every worker once. The results are collected in the order of list_match_sessions, so the output and
+    the problems do not depend on the number of workers.
+
+    :param workers (int): Number of worker processes (default: number of CPUs, 1 runs in this process).
+    :param max_in_flight (int): Maximum number of sessions in flight (default: 2 * workers).
+    :param input_dir (Path): Folder of the contributions extended of stage 05.
+    :param output_dir (Path): Folder of the contributions extended of stage 06.
+    :param lookup_path (Path): Path to speaker_faction_lookup.csv.
+    :param resolution_cache_dir (Path): Directory of the resolution cache (None: no persistent cache).
+    :return (dict): Input path -> DataFrame of the unresolved cases of the session (in session order).
+    """
+    politicians = load_politicians(lookup_path)
+    sessions = list_match_sessions(input_dir, output_dir)
+    fingerprint = get_resolution_cache_fingerprint(lookup_path)
+
+    term_tables = {}
+    term_indexes = {}
+    for term_number in sorted({term_number for _, _, term_number in sessions}):
+        term_tables[term_number] = get_term_tables(politicians, term_number)
+        # Index of the politicians for the matching, built once per term
+        term_indexes[term_number] = PoliticianIndex(term_tables[term_number][0])
+        if resolution_cache_dir is not None:
+            load_resolution_cache(term_indexes[term_number], term_number, fingerprint, resolution_cache_dir)
+
+    for _, output_path, _ in sessions:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    problems = {}
+    for input_path, term_number, (session_problems, new_resolutions) in tqdm(
+        iterate_match_results(sessions, term_tables, term_indexes, workers, max_in_flight),
+        total=len(sessions),
+        desc="Match contributions...",
+    ):
+        problems[input_path] = session_problems
+        for key, resolution in new_resolutions.items():
+            term_indexes[term_number].resolutions.setdefault(key, resolution)
+
+    if resolution_cache_dir is not None:
+        for term_number, politician_index in term_indexes.items():
+            save_resolution_cache(politician_index, term_number, fingerprint, resolution_cache_dir)
+    return problems
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel matching of the contributions extended (stage 06).")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: number of CPUs).")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="Maximum number of sessions in flight (default: 2 * workers).")
+    parser.add_argument("--no-resolution-cache", action="store_true", help="Do not read or write the resolution cache.")
+    args = parser.parse_args()
+
+    problems = run_matching(
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        resolution_cache_dir=None if args.no_resolution_cache else RESOLUTION_CACHE_DIR,
+    )
+    print(f"{len(problems)} sessions matched, {sum(len(df) for df in problems.values())} unresolved contributions.")
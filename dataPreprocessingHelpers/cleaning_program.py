@@ -0,0 +1,254 @@
+
+# imports
+import re
+import string
+import time
+try:
+    from re import _parser as sre_parser  # Python >= 3.11
+except ImportError:
+    import sre_parse as sre_parser
+
+
+# flags every phrase pattern is applied with
+PHRASE_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# pattern parts that can match a line break (or change group numbers), see _is_mergeable_line_pattern
+_LINE_CROSSING_TOKENS = ("\\s", "\\W", "\\D", "\\n", "[^", "(?", "\\1", "\\2", "\\3", "\\4", "\\5", "\\6", "\\7", "\\8", "\\9")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """
+    Checks whether a regex pattern contains a '|' outside of any group or character class.
+
+    :param: pattern (str): The regex pattern.
+
+    :return: (bool): True if the pattern has a top-level alternation.
+    """
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+    return False
+
+
+
+def _is_mergeable_line_pattern(pattern: str) -> bool:
+    """
+    Checks whether a phrase pattern always replaces one complete line and nothing else: it is anchored with
+    '^' and '$', has no top-level alternation, cannot match across a line break, and matches neither an
+    empty line nor a line that was already replaced by ' '. Applying several of these patterns one after
+    another gives the same result as applying their alternation once.
+
+    :param: pattern (str): The regex pattern.
+
+    :return: (bool): True if the pattern can be merged with other full-line patterns.
+    """
+    if not (pattern.startswith("^") and pattern.endswith("$") and not pattern.endswith("\\$")):
+        return False
+    if _has_top_level_alternation(pattern) or any(token in pattern for token in _LINE_CROSSING_TOKENS):
+        return False
+    try:
+        compiled = re.compile(pattern, PHRASE_PATTERN_FLAGS)
+    except re.error:
+        return False
+    return compiled.search("") is None and compiled.search(" ") is None
+
+
+
+def _required_literal_prefilter(pattern: str):
+    """
+    Builds a cheap prefilter for patterns that do not start with a literal, e.g. "(ich)? (möchte|will) mich.*?":
+    the longest run of literal characters every match has to contain (" mich"), compiled with the same flags.
+    If the prefilter does not find the literal, the pattern cannot match and the (slow) substitution is skipped.
+    Patterns starting with their literal are already scanned that way by the regex engine.
+
+    :param: pattern (str): The regex pattern.
+
+    :return: prefilter (re.Pattern): Compiled literal, or None if the pattern has no suitable literal.
+    """
+    try:
+        items = list(sre_parser.parse(pattern, PHRASE_PATTERN_FLAGS))
+    except re.error:
+        return None
+
+    best_start, best_run = 0, ""
+    run_start, run = 0, []
+    for position, (op, value) in enumerate(items + [(None, None)]):
+        if op is sre_parser.LITERAL:
+            if not run:
+                run_start = position
+            run.append(chr(value))
+            continue
+        if len(run) > len(best_run):
+            best_start, best_run = run_start, "".join(run)
+        run = []
+
+    if len(best_run) < 3 or best_start == 0:
+        return None
+    return re.compile(re.escape(best_run), PHRASE_PATTERN_FLAGS)
+
+
+
+def compile_phrase_patterns(patterns: list[str]) -> list[tuple]:
+    """
+    Compiles the phrase patterns once. Consecutive full-line patterns (see `_is_mergeable_line_pattern`)
+    are merged into a single alternation, all other patterns are compiled on their own together with a
+    literal prefilter (see `_required_literal_prefilter`). The order of the patterns is kept, so the result
+    equals applying every pattern one after another.
+
+    :param: patterns (list[str]): Regex patterns in application order.
+
+    :return: compiled_patterns (list[tuple]): (pattern, prefilter or None) pairs in application order.
+    """
+    compiled_patterns = []
+    line_group = []
+
+    def flush_line_group():
+        if len(line_group) == 1:
+            compiled_patterns.append((re.compile(line_group[0], PHRASE_PATTERN_FLAGS), None))
+        elif line_group:
+            compiled_patterns.append((re.compile("|".join(f"(?:{p})" for p in line_group), PHRASE_PATTERN_FLAGS), None))
+        line_group.clear()
+
+    for pattern in patterns or []:
+        if _is_mergeable_line_pattern(pattern):
+            line_group.append(pattern)
+        else:
+            flush_line_group()
+            compiled_patterns.append((re.compile(pattern, PHRASE_PATTERN_FLAGS), _required_literal_prefilter(pattern)))
+    flush_line_group()
+
+    return compiled_patterns
+
+
+
+class CleaningProgram:
+    """
+    The text cleaning of `preprocess_speech_data` (lowercasing, digit removal, punctuation removal,
+    phrase-based removal and whitespace normalization) compiled once per config.
+    Consecutive full-line phrase patterns are merged into one alternation, patterns with a required literal
+    are skipped if the literal does not occur, and white space is collapsed with
+    `str.split`/`str.join` instead of `re.sub(r"\s+", ...)`.
+    Punctuation stays a (precompiled) regex character class: `str.translate` is only fast for pure ASCII
+    strings and about 7x slower than the character class on German speeches.
+    """
+
+    def __init__(
+        self,
+        to_lower: bool = False,
+        remove_digits: bool = False,
+        remove_punctuation: bool = False,
+        phrase_patterns: list[str] = None
+    ):
+        """
+        :param: to_lower (bool): If Enabled: Converts all text to lowercase.
+        :param: remove_digits (bool): If Enabled: Replaces every digit sequence with a space.
+        :param: remove_punctuation (bool): If Enabled: Replaces every character of `string.punctuation` with a space.
+        :param: phrase_patterns (list[str]): Regex patterns whose matches are replaced with a space.
+        """
+        self.to_lower = to_lower
+        self.remove_digits = remove_digits
+        self.remove_punctuation = remove_punctuation
+        self.digit_pattern = re.compile(r"\d+")
+        self.punctuation_pattern = re.compile(rf"[{re.escape(string.punctuation)}]")
+        self.phrase_patterns = compile_phrase_patterns(phrase_patterns)
+
+
+    def clean(self, text: str) -> str:
+        """
+        Cleans a single speech.
+
+        :param: text (str): The raw speech text.
+
+        :return: cleaned_text (str): The cleaned speech.
+        """
+        if self.to_lower:
+            text = text.lower()
+
+        if self.remove_digits:
+            text = self.digit_pattern.sub(" ", text)
+
+        if self.remove_punctuation:
+            text = self.punctuation_pattern.sub(" ", text)
+
+        for pattern, prefilter in self.phrase_patterns:
+            if prefilter is None or prefilter.search(text):
+                text = pattern.sub(" ", text)
+
+        # collapse white space (str.split and re's \s use the same whitespace definition)
+        return " ".join(text.split())
+
+
+    def clean_many(self, texts) -> list[str]:
+        """
+        Cleans a batch of speeches.
+
+        :param: texts (iterable[str]): The raw speech texts.
+
+        :return: cleaned_texts (list[str]): The cleaned speeches in input order.
+        """
+        clean = self.clean
+        return [clean(text) for text in texts]
+
+
+
+def _reference_clean(text, to_lower, remove_digits, remove_punctuation, phrase_patterns):
+    """
+    The per-call `re.sub` implementation `CleaningProgram` replaces (only used by the micro-benchmark).
+    """
+    if to_lower:
+        text = text.lower()
+    if remove_digits:
+        text = re.sub(r"\d+", " ", text)
+    if remove_punctuation:
+        text = re.sub(rf"[{re.escape(string.punctuation)}]", " ", text)
+    for pattern in phrase_patterns or []:
+        text = re.sub(pattern, ' ', text, flags=re.IGNORECASE | re.MULTILINE)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+
+# micro-benchmark: python -m dataPreprocessingHelpers.cleaning_program
+if __name__ == "__main__":
+    from dataPreprocessingHelpers.phrase_patterns import PHRASE_PATTERNS_CLASSIFICATION_3
+
+    paragraphs = [
+        "Sehr geehrte Frau Präsidentin!",
+        "Meine Damen und Herren! Liebe Kolleginnen und Kollegen!",
+        "Wir haben im Jahr 2019 insgesamt 30 Milliarden Euro für die Bundeswehr ausgegeben (Drucksache 19/1234).",
+        "Das wort hat jetzt der Kollege Müller, CDU/CSU-Fraktion.",
+        "Die Bürgerinnen und Bürger erwarten zu Recht, dass wir – nach § 42 – endlich handeln!",
+        "Ich danke Ihnen für Ihre Aufmerksamkeit.",
+    ]
+    speeches = ["\n\n".join(paragraphs[i % 3:] + paragraphs[:i % 3]) * (1 + i % 4) for i in range(2000)]
+    settings = dict(to_lower=True, remove_digits=True, remove_punctuation=True, phrase_patterns=PHRASE_PATTERNS_CLASSIFICATION_3)
+
+    start = time.perf_counter()
+    expected = [_reference_clean(speech, **settings) for speech in speeches]
+    reference_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    program = CleaningProgram(**settings)
+    result = program.clean_many(speeches)
+    program_seconds = time.perf_counter() - start
+
+    assert result == expected, "CleaningProgram output differs from the reference implementation"
+    print(f"Phrase patterns: {len(PHRASE_PATTERNS_CLASSIFICATION_3)} -> {len(program.phrase_patterns)} compiled programs")
+    print(f"Reference (re.sub per call): {reference_seconds / len(speeches) * 1e6:.1f} µs/speech")
+    print(f"CleaningProgram.clean_many:  {program_seconds / len(speeches) * 1e6:.1f} µs/speech")
+    print(f"Speedup: {reference_seconds / program_seconds:.2f}x")
@@ -0,0 +1,399 @@
+"""
+Offline benchmark of preprocessing_pipeline.py on a synthetic Bundestag corpus.
+
+Generates speeches with German parliamentary text, ({n}) contribution markers and a matching
+contributions_simplified table, runs the data_set_1/3/7 configs of ML-Task-1 on it (every config in a
+fresh process, so peak memory is per config) and appends the results (total and per-stage throughput,
+peak memory, commit) as one JSON line per config to a results file for comparison across commits.
+
+Usage (from the repository root, spaCy model and NLTK data have to be installed once, see
+preprocessing_pipeline.ensure_required_nlp_resources):
+    python -m dataPreprocessingHelpers.preprocessing_benchmark --speeches 2000
+    python -m dataPreprocessingHelpers.preprocessing_benchmark --speeches 500 --configs data_set_3 --repeat 3
+"""
+
+
+# imports
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import multiprocessing
+import tempfile
+import pandas as pd
+from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from dataPreprocessingHelpers.phrase_patterns import PHRASE_PATTERNS_CLASSIFICATION_3
+from dataPreprocessingHelpers.domain_stopwords import DOMAIN_SPECIFIC_STOPWORDS_CLASSIFICATION_1
+from dataPreprocessingHelpers.stage_profiler import process_peak_rss_mb, read_profile_report
+
+# bump whenever generate_synthetic_corpus changes, results are only compared within the same corpus version
+BENCHMARK_CORPUS_VERSION = 2
+
+# default results file, one JSON line per config and run
+BENCHMARK_RESULTS_PATH = Path("dataPreprocessedStage/benchmark/preprocessing_benchmark.jsonl")
+
+# equivalents of the ML-Task-1 configs (Preprocessing_ML-Task-1_Classification.py) without paths and logging
+BENCHMARK_CONFIGS = {
+    # full cleaning, domain specific spacy stopword removal, phrase pattern removal, contribution removal
+    "data_set_1": {
+        "position_short": ["Presidium of Parliament", "Guest"],
+        "only_valid_faction_id": True,
+        "contributions": "REMOVE",
+        "to_lower": True,
+        "remove_digits": True,
+        "remove_punctuation": True,
+        "stopword_mode": "SPACY",
+        "custom_stopwords": DOMAIN_SPECIFIC_STOPWORDS_CLASSIFICATION_1,
+        "phrase_patterns": PHRASE_PATTERNS_CLASSIFICATION_3,
+        "lemmatization": True,
+        "stemming": True,
+        "tokenization_method": "SPACY",
+        "add_char_count": True,
+        "add_token_count": True,
+        "add_lemma_count": True,
+    },
+    # cleaning (lowercase), contributions insert
+    "data_set_3": {
+        "position_short": ["Presidium of Parliament", "Guest"],
+        "only_valid_faction_id": True,
+        "contributions": "INSERT",
+        "to_lower": True,
+        "lemmatization": True,
+        "stemming": True,
+        "tokenization_method": "SPACY",
+        "add_char_count": True,
+        "add_token_count": True,
+        "add_lemma_count": True,
+    },
+    # no cleaning (BERT), contributions insert
+    "data_set_7": {
+        "position_short": ["Presidium of Parliament", "Guest"],
+        "only_valid_faction_id": True,
+        "contributions": "INSERT",
+        "lemmatization": True,
+        "stemming": True,
+        "tokenization_method": "SPACY",
+        "add_char_count": True,
+        "add_token_count": True,
+        "add_lemma_count": True,
+    },
+}
+
+# building blocks of the synthetic speeches
+_GREETINGS = [
+    "Sehr geehrte Frau Präsidentin!",
+    "Sehr geehrter Herr Präsident!",
+    "Frau Präsidentin,",
+    "Herr Vizepräsident,",
+    "Meine sehr geehrten Damen und Herren! Liebe Kolleginnen und Kollegen!",
+    "Werte Kolleginnen und Kollegen!",
+]
+_CLOSINGS = [
+    "Vielen Dank für Ihre Aufmerksamkeit.",
+    "Ich danke Ihnen.",
+    "Herzlichen Dank.",
+    "Zum Schluss möchte ich sagen: Wir werden diesem Antrag nicht zustimmen.",
+    "Abschließend zum Ende noch ein Wort an die Regierung.",
+]
+_TOPIC_PREFIXES = [
+    "Klima", "Energie", "Renten", "Bildungs", "Gesundheits", "Steuer", "Haushalts", "Verkehrs", "Wohnungs",
+    "Arbeits", "Digital", "Sicherheits", "Migrations", "Landwirtschafts", "Familien", "Wirtschafts", "Pflege",
+    "Verteidigungs", "Kinder", "Forschungs",
+]
+_TOPIC_SUFFIXES = [
+    "politik", "gesetz", "reform", "paket", "strategie", "förderung", "wende", "versicherung", "ausschuss",
+    "programm", "haushalt", "markt", "system", "bericht", "kommission",
+]
+# (singular, plural) subjects and verbs
+_SUBJECTS = (
+    ["Die Bundesregierung", "Diese Koalition", "Unsere Fraktion", "Die Opposition", "Der Bundesminister",
+     "Die Ministerin", "Das Parlament", "Die Union"],
+    ["Die Länder", "Die Kommunen", "Viele Bürgerinnen und Bürger", "Die Unternehmen", "Die Beschäftigten",
+     "Die Familien in diesem Land"],
+)
+_VERBS = [
+    ("versagt", "versagen"), ("handelt", "handeln"), ("zögert", "zögern"), ("liefert", "liefern"),
+    ("streitet", "streiten"), ("spart", "sparen"), ("investiert", "investieren"), ("scheitert", "scheitern"),
+    ("profitiert", "profitieren"), ("leidet", "leiden"), ("wartet", "warten"), ("verliert", "verlieren"),
+]
+_ADJECTIVES = [
+    "neue", "überfällige", "gescheiterte", "soziale", "nachhaltige", "gerechte", "teure", "verfassungswidrige",
+    "dringende", "europäische", "nationale", "bürokratische", "wichtige", "mutige",
+]
+_CONNECTORS = [
+    "Deshalb sagen wir ganz klar:", "Aber", "Und", "Trotzdem", "Meine Damen und Herren,", "Ehrlich gesagt",
+    "Im Gegenteil:", "Gleichzeitig", "Darum", "Natürlich",
+]
+_CLAUSES = [
+    "obwohl die Zahlen etwas anderes sagen", "weil das im Koalitionsvertrag steht", "seit {year} Jahren",
+    "mit {amount} Milliarden Euro", "für {amount} Millionen Menschen", "laut Drucksache {term}/{number}",
+    "nach § {number} des Grundgesetzes", "bis zum Jahr {year}", "um {amount} Prozent",
+]
+_FACTIONS = ["der SPD", "der CDU/CSU", "dem BÜNDNIS 90/DIE GRÜNEN", "der FDP", "der AfD", "der LINKEN"]
+_CONTRIBUTIONS = [
+    "(Beifall bei {faction})",
+    "(Beifall bei {faction} sowie bei Abgeordneten {faction2})",
+    "(Zuruf von {faction}: Unsinn!)",
+    "(Heiterkeit bei {faction})",
+    "(Widerspruch bei {faction})",
+    "(Zurufe von {faction})",
+    "(Lachen bei {faction})",
+]
+_POSITIONS = ["Member of Parliament"] * 14 + ["Minister", "Secretary of State", "Presidium of Parliament", "Guest"]
+
+
+def _synthetic_sentence(rng: random.Random, term: int) -> str:
+    """
+    Builds one sentence of a synthetic speech.
+    """
+    topic = rng.choice(_TOPIC_PREFIXES) + rng.choice(_TOPIC_SUFFIXES)
+    if rng.random() < 0.25:
+        sentence = f"Das ist eine {rng.choice(_ADJECTIVES)} Entscheidung beim Thema {topic}"
+    else:
+        plural = rng.random() < 0.4
+        sentence = f"{rng.choice(_SUBJECTS[plural])} {rng.choice(_VERBS)[plural]} beim Thema {topic}"
+    if rng.random() < 0.6:
+        clause = rng.choice(_CLAUSES).format(
+            year=rng.randint(2, 2045), amount=rng.randint(1, 500), term=term, number=rng.randint(1, 9999)
+        )
+        sentence += f", {clause}"
+    if rng.random() < 0.3:
+        sentence = f"{rng.choice(_CONNECTORS)} {sentence[0].lower()}{sentence[1:]}"
+    return sentence + rng.choice([".", ".", ".", "!", "?"])
+
+
+
+def generate_synthetic_corpus(n_speeches: int, seed: int = 0, term: int = 19) -> tuple:
+    """
+    Generates a synthetic speech corpus in the format of stage 04 (speech_content_<term>.pkl) together with the
+    matching contributions_simplified table. Every speech consists of a greeting, several paragraphs of German
+    parliamentary sentences and a closing; contributions are placed between paragraphs as ({n}) markers. Every
+    speech has a contribution after the greeting, so the INSERT configs can match all speeches.
+    The corpus only depends on `n_speeches`, `seed` and `term`.
+
+    :param: n_speeches (int): Number of speeches.
+    :param: seed (int): Seed of the random generator.
+    :param: term (int): Electoral term (used for ids, sessions and Drucksache numbers).
+
+    :return: (speeches, contributions_simplified) (tuple[pd.DataFrame, pd.DataFrame])
+    """
+    rng = random.Random(seed)
+    speeches = {
+        "id": [], "session": [], "first_name": [], "last_name": [], "faction_id": [], "position_short": [],
+        "position_long": [], "politician_id": [], "speech_content": [], "date": [],
+    }
+    contributions_simplified = {"text_position": [], "content": [], "speech_id": []}
+
+    first_speech_id = term * 10_000_000
+    for number in range(n_speeches):
+        speech_id = first_speech_id + number
+        paragraphs = [rng.choice(_GREETINGS)]
+        for _ in range(rng.randint(3, 10)):
+            paragraphs.append(" ".join(_synthetic_sentence(rng, term) for _ in range(rng.randint(2, 7))))
+        paragraphs.append(rng.choice(_CLOSINGS))
+
+        # contributions between paragraphs (always one after the greeting)
+        text_position = 0
+        for paragraph_number in range(1, len(paragraphs)):
+            if paragraph_number == 1 or rng.random() < 0.4:
+                faction, faction2 = rng.sample(_FACTIONS, 2)
+                contributions_simplified["text_position"].append(text_position)
+                contributions_simplified["content"].append(rng.choice(_CONTRIBUTIONS).format(faction=faction, faction2=faction2))
+                contributions_simplified["speech_id"].append(speech_id)
+                paragraphs[paragraph_number - 1] += f"\n\n({{{text_position}}})"
+                text_position += 1
+
+        position_short = rng.choice(_POSITIONS)
+        speeches["id"].append(speech_id)
+        speeches["session"].append(f"{term}{number // 200 + 1:03d}")
+        speeches["first_name"].append(rng.choice(["Anna", "Peter", "Maria", "Jens", "Sahra", "Friedrich"]))
+        speeches["last_name"].append(rng.choice(["Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Wagner"]))
+        speeches["faction_id"].append(rng.choice([-1, 0, 2, 3, 4, 6, 13, 23]))
+        speeches["position_short"].append(position_short)
+        speeches["position_long"].append(None if position_short == "Member of Parliament" else position_short)
+        speeches["politician_id"].append(rng.randint(11000000, 11005000))
+        speeches["speech_content"].append("\n\n".join(paragraphs))
+        speeches["date"].append(1508457600 + (number // 200) * 86400)
+
+    return pd.DataFrame(speeches), pd.DataFrame(contributions_simplified)
+
+
+
+def _git_commit() -> str:
+    """
+    :return: commit (str): Short hash of the checked out commit (with "-dirty" for local changes), or None.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+
+def run_benchmark_config(name: str, config: dict, input_path: Path, contributions_path: Path, work_dir: Path) -> dict:
+    """
+    Runs `preprocess_speech_data` for one benchmark config and measures it.
+
+    :param: name (str): Name of the config (see `BENCHMARK_CONFIGS`).
+    :param: config (dict): Keyword arguments of `preprocess_speech_data` (without paths).
+    :param: input_path (Path): Synthetic speeches.
+    :param: contributions_path (Path): Synthetic contributions_simplified table.
+    :param: work_dir (Path): Directory for the output and the stage report.
+
+    :return: result (dict): Wall time, throughput, peak memory and the stage records of the config.
+
+    :raises: ValueError: If the config inserts contributions but not every speech has a contribution (the pipeline
+            would silently fall back to REMOVE and the INSERT path would not be measured).
+    """
+    from dataPreprocessingHelpers.preprocessing_pipeline import preprocess_speech_data
+
+    output_path = work_dir / f"{name}.pkl"
+    profile_path = work_dir / f"{name}_profile.json"
+    speeches = pd.read_pickle(input_path)
+    n_speeches = len(speeches)
+
+    if config.get("contributions", "").upper() == "INSERT":
+        missing_speech_ids = set(speeches["id"]) - set(pd.read_pickle(contributions_path)["speech_id"])
+        if missing_speech_ids:
+            raise ValueError(f"run_benchmark_config: {name} inserts contributions, but {len(missing_speech_ids)} speeches have none (the pipeline would fall back to REMOVE)")
+
+    start = time.perf_counter()
+    preprocess_speech_data(
+        input_path=input_path,
+        output_path_pickle=output_path,
+        contributions_simplified_path=contributions_path,
+        profile_report_path=profile_path,
+        log_prefix=f"[benchmark {name}]",
+        **config
+    )
+    wall_seconds = time.perf_counter() - start
+
+    return {
+        "config": name,
+        "speeches": n_speeches,
+        "wall_seconds": round(wall_seconds, 3),
+        "speeches_per_second": round(n_speeches / wall_seconds, 1),
+        "process_peak_rss_mb": process_peak_rss_mb(),
+        "output_bytes": output_path.stat().st_size,
+        "stages": read_profile_report(profile_path),
+    }
+
+
+
+def run_benchmark(
+    n_speeches: int = 1000,
+    configs: list[str] = None,
+    results_path: Path = BENCHMARK_RESULTS_PATH,
+    seed: int = 0,
+    repeat: int = 1,
+    isolate: bool = True,
+    work_dir: Path = None
+) -> list[dict]:
+    """
+    Generates the synthetic corpus, runs the benchmark configs and appends one JSON line per config and
+    repetition to `results_path`. Prints the throughput of every run and the change to the latest previous
+    result with the same config, corpus size and seed.
+
+    :param: n_speeches (int): Size of the synthetic corpus.
+    :param: configs (list[str]): Names of `BENCHMARK_CONFIGS` to run (default: all).
+    :param: results_path (Path): JSON lines file the results are appended to (None: do not save).
+    :param: seed (int): Seed of the synthetic corpus.
+    :param: repeat (int): Number of runs per config.
+    :param: isolate (bool): If Enabled: Runs every config in a fresh process, so that the peak memory and the
+            (per-process) spaCy model loading are measured per config.
+    :param: work_dir (Path): Directory for the corpus and outputs (default: temporary directory, deleted afterwards).
+
+    :return: results (list[dict]): The appended result records.
+
+    :raises: ValueError: If an unknown config name is given.
+    """
+    configs = configs or list(BENCHMARK_CONFIGS)
+    unknown = [name for name in configs if name not in BENCHMARK_CONFIGS]
+    if unknown:
+        raise ValueError(f"run_benchmark: Unknown benchmark configs {unknown}, available: {list(BENCHMARK_CONFIGS)}")
+
+    # results of earlier runs for the comparison
+    previous_results = {}
+    if results_path and Path(results_path).exists():
+        with open(results_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    previous_results[(record["config"], record["speeches"], record.get("seed"), record.get("corpus_version", 1))] = record
+
+    run_info = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "corpus_version": BENCHMARK_CORPUS_VERSION,
+    }
+
+    temporary_dir = tempfile.TemporaryDirectory(prefix="preprocessing_benchmark_") if work_dir is None else None
+    work_dir = Path(temporary_dir.name if temporary_dir else work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    try:
+        print(f"[benchmark] Generating synthetic corpus with {n_speeches} speeches (seed {seed}) ... ", end="", flush=True)
+        speeches, contributions_simplified = generate_synthetic_corpus(n_speeches, seed)
+        input_path = work_dir / "speech_content_synthetic.pkl"
+        contributions_path = work_dir / "contributions_simplified_synthetic.pkl"
+        speeches.to_pickle(input_path)
+        contributions_simplified.to_pickle(contributions_path)
+        print(f"Done. ({speeches['speech_content'].str.len().sum() / 1e6:.1f}M chars, {len(contributions_simplified)} contributions)")
+
+        for name in configs:
+            for _ in range(repeat):
+                arguments = (name, BENCHMARK_CONFIGS[name], input_path, contributions_path, work_dir)
+                if isolate:
+                    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                        result = executor.submit(run_benchmark_config, *arguments).result()
+                else:
+                    result = run_benchmark_config(*arguments)
+                result = {**run_info, **result}
+                results.append(result)
+
+                previous = previous_results.get((name, n_speeches, seed, BENCHMARK_CORPUS_VERSION))
+                change = f", {previous['wall_seconds'] / result['wall_seconds']:.2f}x vs. {previous['commit']}" if previous else ""
+                print(f"[benchmark] {name}: {result['wall_seconds']:.2f}s, {result['speeches_per_second']:.1f} speeches/s, process peak {result['process_peak_rss_mb']} MB{change}")
+    finally:
+        if temporary_dir:
+            temporary_dir.cleanup()
+
+    if results_path:
+        Path(results_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(results_path, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + "\n")
+        print(f"[benchmark] Results appended to <{results_path}>")
+
+    return results
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline benchmark of the preprocessing pipeline on a synthetic corpus.")
+    parser.add_argument("--speeches", type=int, default=1000, help="number of synthetic speeches")
+    parser.add_argument("--configs", nargs="+", default=None, choices=list(BENCHMARK_CONFIGS), help="configs to run (default: all)")
+    parser.add_argument("--results", type=Path, default=BENCHMARK_RESULTS_PATH, help="JSON lines file the results are appended to")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic corpus")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per config")
+    parser.add_argument("--no-isolate", action="store_true", help="run all configs in this process")
+    args = parser.parse_args()
+
+    import spacy
+    if not spacy.util.is_package("de_core_news_sm"):
+        sys.exit("[benchmark] spaCy model de_core_news_sm is not installed, run ensure_required_nlp_resources() once (needs network).")
+
+    run_benchmark(args.speeches, args.configs, args.results, args.seed, args.repeat, isolate=not args.no_isolate)
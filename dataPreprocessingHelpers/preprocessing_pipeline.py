@@ -2,7 +2,6 @@
 # imports
 import re
 import os
-import string
 import numpy as np
 import pandas as pd
 import spacy
@@ -10,10 +9,37 @@ from nltk.corpus import stopwords
 import nltk
 from pathlib import Path
 from nltk.stem.snowball import GermanStemmer
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import multiprocessing
+import itertools
+import time
 from spacy.cli import download as spacy_download
 from pandas import concat
+from dataPreprocessingHelpers.cleaning_program import CleaningProgram
+from dataPreprocessingHelpers.stage_cache import StageCache, file_hash, stage_keys
+from dataPreprocessingHelpers.stage_profiler import StageProfiler, process_peak_rss_mb, write_profile_report, read_profile_report, aggregate_profile_records
+
+
+# contribution position marker, e.g. "({2})"
+CONTRIBUTION_MARKER_PATTERN = re.compile(r"\(\{\d+\}\)")
+
+# spaCy model of the current process, see load_spacy_model
+_SPACY_INSTANCE = None
+
+# row-level stages of process_speech_rows in pipeline order (used as stage cache prefixes)
+PREPROCESSING_STAGES = ("contributions", "clean", "stopwords", "spacy", "stem", "tokenize")
+
+# columns added by process_speech_rows in output order
+PREPROCESSING_COLUMNS = [
+    "speech_content_cleaned",
+    "speech_content_stopword",
+    "speech_content_lemmatized",
+    "speech_content_stemmed",
+    "speech_content_tokenized",
+    "speech_length_chars",
+    "speech_length_lemmas",
+    "speech_length_tokens",
+]
 
 
 def ensure_required_nlp_resources():
@@ -84,15 +110,224 @@ def safe_nltk_download(resource):
 
 
 
+def speech_data_to_arrow_table(df: pd.DataFrame, preserve_index: bool = None):
+    """
+    Converts a speech DataFrame into an Arrow table with a stable schema: list columns become list<string>
+    (also if all lists are empty) and columns without any value become string.
+
+    :dependency: pyarrow
+
+    :param: df (pd.DataFrame): The speech dataset.
+    :param: preserve_index (bool): Passed to `pyarrow.Table.from_pandas` (True always stores the index as a column).
+
+    :return: table (pyarrow.Table): The converted table.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+    fields = []
+    for field in table.schema:
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        elif pa.types.is_list(field.type) and pa.types.is_null(field.type.value_type):
+            field = field.with_type(pa.list_(pa.string()))
+        fields.append(field)
+    return table.cast(pa.schema(fields, metadata=table.schema.metadata))
+
+
+
+def arrow_table_to_speech_data(table) -> pd.DataFrame:
+    """
+    Converts an Arrow table (e.g. read from a Parquet file) back into a speech DataFrame.
+    List columns are returned as python lists instead of numpy arrays.
+
+    :dependency: pyarrow
+
+    :param: table (pyarrow.Table): The table to convert.
+
+    :return: df (pd.DataFrame): The speech dataset.
+    """
+    import pyarrow as pa
+
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type) and field.name in df.columns:
+            df[field.name] = [None if value is None else list(value) for value in df[field.name]]
+    return df
+
+
+
+def load_speech_data(path, columns: list[str] = None) -> pd.DataFrame:
+    """
+    Loads a speech dataset from a pickle (.pkl) or Parquet (.parquet) file. Parquet files are read column-wise,
+    so loading e.g. only `id`, `faction_id` and one text column skips all other columns on disk.
+    List columns (e.g. `speech_content_lemmatized`) are returned as python lists for both formats.
+
+    :dependency: pyarrow: only for .parquet files
+
+    :param: path (str or Path): Path to the .pkl or .parquet file.
+    :param: columns (list[str]): Columns to load. None loads all columns.
+
+    :return: df (pd.DataFrame): The loaded dataset.
+
+    :raises: ValueError: If the file suffix is neither .pkl nor .parquet.
+    :raises: KeyError: If one of the requested columns does not exist in a .pkl file.
+    """
+    path = Path(path)
+
+    if path.suffix == ".pkl":
+        df = pd.read_pickle(path)
+        return df[columns] if columns is not None else df
+
+    if path.suffix == ".parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        return arrow_table_to_speech_data(pq.read_table(path, columns=columns, use_pandas_metadata=True))
+
+    raise ValueError(f"load_speech_data: [ERROR]: Unsupported file type '{path.suffix}', expected '.pkl' or '.parquet'")
+
+
+
+def save_speech_data(df: pd.DataFrame, path, compression: str = "zstd") -> None:
+    """
+    Saves a speech dataset as pickle (.pkl) or Parquet (.parquet) file, depending on the file suffix.
+    In Parquet files list columns are stored natively as list<string> (also if all lists are empty) and
+    columns without any value as string.
+
+    :dependency: pyarrow: only for .parquet files
+
+    :param: df (pd.DataFrame): The dataset to save.
+    :param: path (str or Path): Path to the .pkl or .parquet file.
+    :param: compression (str): Parquet compression codec, e.g. "zstd", "snappy", "gzip" or "none" (ignored for .pkl).
+
+    :return: None
+
+    :raises: ValueError: If the file suffix is neither .pkl nor .parquet.
+    """
+    path = Path(path)
+
+    if path.suffix == ".pkl":
+        df.to_pickle(path)
+        return
+
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(speech_data_to_arrow_table(df), path, compression=compression)
+        return
+
+    raise ValueError(f"save_speech_data: [ERROR]: Unsupported file type '{path.suffix}', expected '.pkl' or '.parquet'")
+
+
+
+def iter_speech_data(path, chunk_size: int, columns: list[str] = None):
+    """
+    Yields a speech dataset in chunks of at most `chunk_size` rows. Parquet files are read batch by batch,
+    so only one chunk is held in memory. Pickle files cannot be read partially: they are loaded once and
+    then split into chunks.
+
+    :dependency: pyarrow: only for .parquet files
+
+    :param: path (str or Path): Path to the .pkl or .parquet file.
+    :param: chunk_size (int): Maximum number of rows per chunk.
+    :param: columns (list[str]): Columns to load. None loads all columns.
+
+    :return: chunks (generator of pd.DataFrame): The dataset in row order.
+
+    :raises: ValueError: If the file suffix is neither .pkl nor .parquet or chunk_size is not a positive integer.
+    """
+    path = Path(path)
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f"iter_speech_data: [ERROR]: chunk_size must be a positive integer, got {chunk_size}")
+
+    if path.suffix == ".parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        # a RangeIndex is only stored as metadata, so it has to be continued batch by batch
+        index_columns = (parquet_file.schema_arrow.pandas_metadata or {}).get("index_columns", [])
+        range_index = index_columns[0] if len(index_columns) == 1 and isinstance(index_columns[0], dict) else None
+
+        offset = 0
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns, use_pandas_metadata=True):
+            chunk = arrow_table_to_speech_data(pa.Table.from_batches([batch]))
+            if range_index is not None:
+                start, step = range_index["start"] + offset * range_index["step"], range_index["step"]
+                chunk.index = pd.RangeIndex(start, start + len(chunk) * step, step, name=range_index["name"])
+            offset += len(chunk)
+            yield chunk
+        return
+
+    df = load_speech_data(path, columns)
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+
+class ChunkedParquetWriter:
+    """
+    Appends speech DataFrame chunks to one Parquet file (one row group per chunk). The schema is fixed by
+    the first chunk, every later chunk is cast to it. Can be used as a context manager.
+    """
+
+    def __init__(self, path, compression: str = "zstd"):
+        """
+        :param: path (str or Path): Path to the .parquet file (overwritten if it exists).
+        :param: compression (str): Parquet compression codec, e.g. "zstd", "snappy", "gzip" or "none".
+        """
+        self.path = Path(path)
+        self.compression = compression
+        self.writer = None
+        self.rows = 0
+
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        Appends one chunk to the file.
+
+        :param: df (pd.DataFrame): The chunk. Its index is always stored, so chunks with and without a
+                RangeIndex share the same schema.
+
+        :return: None
+        """
+        import pyarrow.parquet as pq
+
+        table = speech_data_to_arrow_table(df, preserve_index=True)
+        if self.writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.writer = pq.ParquetWriter(self.path, table.schema, compression=self.compression)
+        else:
+            table = table.cast(self.writer.schema)
+        self.writer.write_table(table)
+        self.rows += len(df)
+
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+
 def combine_two_datasets(input_path_a, input_path_b, output_path) -> None:
     """
-    Combines two pickled pandas DataFrames into one and saves the result to the specified output path.
+    Combines two pandas DataFrames (.pkl or .parquet) into one and saves the result to the specified output path.
 
-    :param: input_path_a (str or Path): File path to the first pickled dataset (e.g. term 19).
-    :param: input_path_b (str or Path): File path to the second pickled dataset (e.g. term 20).
-    :param: output_path (str or Path): File path to which the combined dataset should be saved.
+    :param: input_path_a (str or Path): File path to the first dataset (e.g. term 19).
+    :param: input_path_b (str or Path): File path to the second dataset (e.g. term 20).
+    :param: output_path (str or Path): File path (.pkl or .parquet) to which the combined dataset should be saved.
 
-    :return: None: The function saves the combined DataFrame as a pickle file and prints status messages.
+    :return: None: The function saves the combined DataFrame and prints status messages.
 
     :raises: FileNotFoundError: If one of the input files does not exist.
     :raises: ValueError: If the loaded objects are not pandas DataFrames.
@@ -111,12 +346,12 @@ def combine_two_datasets(input_path_a, input_path_b, output_path) -> None:
             raise FileNotFoundError(f"combine_two_datasets: [ERROR]: Input file B not found: {input_path_b}")
 
         # Validate output path extension
-        if output_path.suffix != ".pkl":
-            raise ValueError(f"combine_two_datasets: [ERROR]: Output path must end with '.pkl', got: {output_path.suffix}")
+        if output_path.suffix not in (".pkl", ".parquet"):
+            raise ValueError(f"combine_two_datasets: [ERROR]: Output path must end with '.pkl' or '.parquet', got: {output_path.suffix}")
 
         # Load input data
-        data_set_a = pd.read_pickle(input_path_a)
-        data_set_b = pd.read_pickle(input_path_b)
+        data_set_a = load_speech_data(input_path_a)
+        data_set_b = load_speech_data(input_path_b)
 
         # Verify that both are DataFrames
         if not isinstance(data_set_a, pd.DataFrame) or not isinstance(data_set_b, pd.DataFrame):
@@ -131,21 +366,688 @@ def combine_two_datasets(input_path_a, input_path_b, output_path) -> None:
 
         # Save combined dataset
         os.makedirs(os.path.dirname(output_path), exist_ok=True) # ensure output dir exists
-        data_set_a_b.to_pickle(output_path)
+        save_speech_data(data_set_a_b, output_path)
+
+        # Report statistics
+        print(f"combine_two_datasets: Dataset A: {len(data_set_a)} rows")
+        print(f"combine_two_datasets: Dataset B: {len(data_set_b)} rows")
+        print(f"combine_two_datasets: Combined : {len(data_set_a_b)} rows")
+        print(f"combine_two_datasets: Datasets successfully combined and saved to: {output_path}")
+
+    except Exception as e:
+        print(f"combine_two_datasets: [ERROR]: Failed to combine datasets: {e}")
+
+
+
+class MemoizedStemmer:
+    """
+    GermanStemmer with a token -> stem dictionary: parliamentary speeches reuse a small vocabulary, so every
+    distinct token is stemmed only once instead of once per occurrence. The dictionary is cleared when it
+    exceeds `max_size` entries to bound its memory.
+    """
+
+    def __init__(self, max_size: int = 500_000):
+        """
+        :param: max_size (int): Maximum number of cached stems.
+        """
+        self.stemmer = GermanStemmer()
+        self.stems = {}
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+
+    def stem_many(self, tokens: list[str]) -> list[str]:
+        """
+        Stems a list of tokens, identical to `[GermanStemmer().stem(token) for token in tokens]`.
+
+        :param: tokens (list[str]): Tokens of one text.
+
+        :return: stems (list[str]): The stems in token order.
+        """
+        stems = self.stems
+        new_tokens = [token for token in set(tokens) if token not in stems]
+        if len(stems) + len(new_tokens) > self.max_size:
+            stems.clear()
+            new_tokens = list(set(tokens))
+        for token in new_tokens:
+            stems[token] = self.stemmer.stem(token)
+
+        self.misses += len(new_tokens)
+        self.hits += len(tokens) - len(new_tokens)
+        return [stems[token] for token in tokens]
+
+
+    def hit_rate(self) -> float:
+        """
+        :return: hit_rate (float): Share of token occurrences answered from the dictionary (0.0 before the first call).
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+
+def remove_stopwords_many(texts, stopwords: frozenset) -> list[str]:
+    """
+    Removes whitespace-separated stopwords from a batch of texts with one frozenset lookup per token.
+
+    :param: texts (iterable[str]): Cleaned texts.
+    :param: stopwords (frozenset): Complete stopword set.
+
+    :return: filtered_texts (list[str]): The texts without stopwords, in input order.
+    """
+    return [" ".join([word for word in text.split() if word not in stopwords]) for text in texts]
+
+
+
+def spacy_single_pass(
+    spacy_instance,
+    texts: list[str],
+    stopwords: set = None,
+    lemmatization: bool = False,
+    tokenization: bool = False,
+    batch_size: int = 256,
+):
+    """
+    Parses every text exactly once with `nlp.pipe` and derives stopword-filtered text, lemmas and tokens
+    from the same `Doc`. Pipeline components that are not needed for the requested outputs are disabled
+    while parsing (parser and NER are never needed, the rest only for lemmatization).
+
+    If `stopwords` is given, stopword removal is applied to the Doc: tokens that are spaCy stopwords, part of
+    `stopwords` (case-insensitive), whitespace or punctuation are dropped, and lemmas/tokens are taken from the
+    remaining tokens only. Otherwise lemmas/tokens are taken from all non-whitespace tokens.
+
+    :dependency: spaCy: a loaded pipeline, e.g. `de_core_news_sm`
+
+    :param: spacy_instance (spacy.Language): Loaded spaCy pipeline.
+    :param: texts (list[str]): Texts to parse (usually cleaned speeches).
+    :param: stopwords (set): Stopwords to remove in addition to spaCy's own list. None disables stopword removal.
+    :param: lemmatization (bool): If Enabled: Returns the lemmas of each text.
+    :param: tokenization (bool): If Enabled: Returns the tokens of each text.
+    :param: batch_size (int): Number of texts buffered and processed per `nlp.pipe` batch.
+
+    :return: (list[str], list[list[str]], list[list[str]]): Stopword-filtered texts (empty strings if stopword
+             removal is disabled), lemmas and tokens (empty lists if disabled), each aligned with `texts`.
+
+    :raises: TypeError: If one of the texts is not a string.
+    """
+    for text in texts:
+        if not isinstance(text, str):
+            raise TypeError(f"spacy_single_pass expects string input, got {type(text)}")
+
+    remove_stop = stopwords is not None
+    stopwords = set(stopwords or ())
+
+    # the lemmatizer depends on tok2vec/tagger/morphologizer, everything else only needs the tokenizer
+    if lemmatization:
+        disabled_pipes = [pipe for pipe in spacy_instance.pipe_names if pipe in ("parser", "ner", "senter")]
+    else:
+        disabled_pipes = list(spacy_instance.pipe_names)
+
+    stopword_texts, lemmas, tokens = [], [], []
+    with spacy_instance.select_pipes(disable=disabled_pipes):
+        for doc in spacy_instance.pipe(texts, batch_size=batch_size):
+            if remove_stop:
+                kept = [
+                    t for t in doc
+                    if not (t.is_stop or t.is_space or t.is_punct or t.lower_ in stopwords or t.text in stopwords)
+                ]
+                stopword_texts.append(" ".join(t.text for t in kept))
+            else:
+                kept = [t for t in doc if not t.is_space]
+                stopword_texts.append("")
+            lemmas.append([t.lemma_ for t in kept] if lemmatization else [])
+            tokens.append([t.text for t in kept] if tokenization else [])
+
+    return stopword_texts, lemmas, tokens
+
+
+
+def build_contribution_index(contributions_simplified: pd.DataFrame) -> dict:
+    """
+    Builds a lookup index from the simplified contributions, so that every contribution position marker
+    (e.g. ({2}) ) can be resolved with one dict lookup instead of a scan over the whole contributions table.
+    Contributions sharing the same speech and text position are joined with a space in table order.
+
+    :param: contributions_simplified (pd.DataFrame): Simplified contributions with columns
+            'speech_id', 'text_position' and 'content'.
+
+    :return: index (dict): Maps (speech_id, text_position) as ints to the joined contribution content.
+
+    :raises: ValueError: If 'speech_id' or 'text_position' cannot be converted to int.
+    """
+    speech_ids = contributions_simplified["speech_id"].astype(int).tolist()
+    text_positions = contributions_simplified["text_position"].astype(int).tolist()
+    contents = contributions_simplified["content"].astype(str).tolist()
+
+    grouped = {}
+    for speech_id, text_position, content in zip(speech_ids, text_positions, contents):
+        grouped.setdefault((speech_id, text_position), []).append(content)
+
+    return {key: " ".join(parts) for key, parts in grouped.items()}
+
+
+
+def insert_contributions(text: str, speech_id, contribution_index: dict) -> str:
+    """
+    Replaces every contribution position marker ({<NUM>}) in a speech with the matching contributions
+    from a prebuilt index. Markers without indexed contributions are replaced by an empty string.
+
+    :param: text (str): The speech text with contribution position markers.
+    :param: speech_id (int): The ID of the speech.
+    :param: contribution_index (dict): Index built by `build_contribution_index`.
+
+    :return: text (str): The speech text with reinserted contributions.
+    """
+    if "({" not in text:
+        return text
+    try:
+        speech_id = int(speech_id)
+    except (TypeError, ValueError):
+        speech_id = None
+
+    return CONTRIBUTION_MARKER_PATTERN.sub(
+        lambda match: contribution_index.get((speech_id, int(match.group()[2:-2])), ""),
+        text,
+    )
+
+
+
+
+def text_chars(texts: pd.Series) -> int:
+    """
+    Counts the characters of all texts of a column (the input size of a stage, see `StageProfiler`).
+
+    :param: texts (pd.Series): The texts.
+
+    :return: chars (int): Total number of characters.
+    """
+    return int(texts.astype(str).str.len().sum())
+
+
+
+def load_spacy_model(log_prefix: str = "", parallel_processing: bool = False):
+    """
+    Loads the German spaCy model once per process and returns the cached instance on every later call.
+    Worker processes that handle several shards or datasets therefore only pay the model loading time once.
+    Falls back to downloading the model if it is not installed.
+
+    :dependency: spacy: de_core_news_sm (German language model)
+
+    :param: log_prefix (str): Adds a custom message before every log.
+    :param: parallel_processing (bool): Shifts the log messages to multiline while parallel processing.
+
+    :return: spacy_instance (spacy.Language): The loaded spaCy pipeline.
+    """
+    global _SPACY_INSTANCE
+
+    if _SPACY_INSTANCE is None:
+        print(f"{log_prefix}: Setting up spacy instance ... ", end="", flush= not parallel_processing)
+        try:
+            _SPACY_INSTANCE = spacy.load("de_core_news_sm")
+        except OSError:
+            print(f"{log_prefix}: spaCy model not found. Downloading ...")
+            spacy_download("de_core_news_sm")
+            _SPACY_INSTANCE = spacy.load("de_core_news_sm")
+        print(f"{log_prefix}: Done.")
+
+    return _SPACY_INSTANCE
+
+
+
+def stage_output_columns(stage: str, stopword_mode: str, tokenization_method: str) -> list[str]:
+    """
+    Returns the columns written by one stage of `process_speech_rows`. Every column is written by exactly
+    one stage, e.g. with spaCy stopword removal/tokenization the spaCy pass writes the stopword/token columns.
+
+    :param: stage (str): One of `PREPROCESSING_STAGES`.
+    :param: stopword_mode (str): "NLTK" or "SPACY" or "NONE".
+    :param: tokenization_method (str): "NLTK" or "SPACY" or "NONE".
+
+    :return: columns (list[str]): The output columns of the stage.
+
+    :raises: ValueError: If the stage is unknown.
+    """
+    spacy_stopwords = stopword_mode.upper() == "SPACY"
+    spacy_tokens = tokenization_method.upper() == "SPACY"
+
+    if stage == "contributions":
+        return ["speech_content"]
+    if stage == "clean":
+        return ["speech_content_cleaned"]
+    if stage == "stopwords":
+        return [] if spacy_stopwords else ["speech_content_stopword"]
+    if stage == "spacy":
+        return (
+            (["speech_content_stopword"] if spacy_stopwords else [])
+            + ["speech_content_lemmatized"]
+            + (["speech_content_tokenized"] if spacy_tokens else [])
+        )
+    if stage == "stem":
+        return ["speech_content_stemmed"]
+    if stage == "tokenize":
+        return [] if spacy_tokens else ["speech_content_tokenized"]
+    raise ValueError(f"stage_output_columns: Unknown stage '{stage}'")
+
+
+
+def process_speech_rows(
+    df: pd.DataFrame,
+    contributions: str = "NONE",
+    contribution_index: dict = None,
+    to_lower: bool = False,
+    remove_digits: bool = False,
+    remove_punctuation: bool = False,
+    phrase_patterns: list[str] = None,
+    stopword_mode: str = "NONE",
+    all_stopwords: set = None,
+    lemmatization: bool = False,
+    stemming: bool = False,
+    tokenization_method: str = "NONE",
+    add_char_count: bool = False,
+    add_token_count: bool = False,
+    add_lemma_count: bool = False,
+    spacy_batch_size: int = 256,
+    completed_stages: int = 0,
+    profiler: StageProfiler = None,
+    log_prefix: str = "",
+    parallel_processing: bool = False
+) -> pd.DataFrame:
+    """
+    Applies the row-level stages of the preprocessing pipeline to an already loaded and filtered speech DataFrame:
+    contribution handling, cleaning, stopword removal, lemmatization, stemming, tokenization and length counts.
+    Every row is processed independently, so the function can run on the whole dataset or on any shard of it
+    (see `preprocess_speech_data(shard_executor=...)`). The output of concatenated shards is identical to the
+    output of one call on the whole DataFrame.
+
+    The parameters have the same meaning as in `preprocess_speech_data`, except:
+    :param: df (pd.DataFrame): Filtered speeches with at least the columns 'id' and 'speech_content'.
+    :param: contribution_index (dict): Index built by `build_contribution_index` (only used if contributions="INSERT").
+    :param: all_stopwords (set): Complete stopword set (base list plus custom stopwords) for NLTK or SPACY stopword removal.
+    :param: completed_stages (int): Number of leading stages of `PREPROCESSING_STAGES` that are skipped because
+            their output columns (see `stage_output_columns`) are already part of `df`, e.g. from the stage cache.
+    :param: profiler (StageProfiler): If given: Records wall time, rows, input chars and process peak memory of every stage.
+
+    :return: df (pd.DataFrame): The DataFrame with all preprocessing columns added.
+    """
+    # set up variables
+    all_sw = all_stopwords or set()
+    stemmer = MemoizedStemmer()
+    needs_spacy = (
+            stopword_mode.upper() == "SPACY"
+            or tokenization_method.upper() == "SPACY"
+            or lemmatization
+    )
+    profiler = profiler if profiler is not None else StageProfiler()
+    df = df.copy()
+
+
+    def handle_contributions(text: str, speech_id: int):
+        """
+        Either removes or reinserts contributions into speech_content, based on simplified contribution data.
+        Reinsertion looks the markers up in `contribution_index` (see `build_contribution_index`).
+
+        :param: text (str): The speech text with contribution position markers.
+        :param: speech_id (int): The ID of the speech.
+
+        :return: str: The updated text (either without contribution position markers or with inserted contribution descriptions).
+        """
+        # remove contribution text postion markers
+        if contributions.upper() == "REMOVE":
+            text = re.sub(r'\[.*?\]', ' ', text, flags=re.IGNORECASE | re.MULTILINE)   # Remove "[Beifall]" and brackets like "[...]"
+            text = re.sub(r'\(\{\d+\}\)', ' ', text, flags=re.IGNORECASE | re.MULTILINE)  # Remove "({<NUM>})" (placeholders for contributions)
+
+        # insert old contributions
+        elif contributions.upper() == "INSERT":
+            # failsafe
+            if contribution_index is None:
+                print(f"{log_prefix}: [WARNING] contribution_simplified df empty for speech {speech_id}. Skipping insertion.")
+                return text
+
+            # replace every text position contribution marker with the indexed contributions
+            text = insert_contributions(text, speech_id, contribution_index)
+
+        return text
+
+
+    def stem_text(text: str) -> str:
+        """
+        Applies stemming to the given German text using NLTK's SnowballStemmer.
+        Tokenizes the input text and stems each word if alphabetic. Falls back to downloading
+        the Punkt tokenizer if not available.
+
+        :dependency: nltk: punkt tokenizer and SnowballStemmer for German
+        :dependency: stemmer: pre-initialized MemoizedStemmer object (every distinct token is stemmed once)
+
+        :param: text (str): Preprocessed input text (ideally cleaned and stopword-processed).
+
+        :return: stemmed_text (str): Stemmed version of the input string (words joined by spaces).
+                                 Returns empty string if stemming is disabled or fails.
+
+        :raises: TypeError: If input is not a string.
+        """
+        # typecheck input
+        if not isinstance(text, str):
+            raise TypeError(f"{log_prefix}: WARNING: Stemming expects string input, got {type(text)}")
+
+        if stemming:
+            try:
+                tokens = nltk.word_tokenize(text, language="german")
+                return " ".join(stemmer.stem_many([token for token in tokens if token.isalpha()]))
+            except LookupError:
+                try:
+                    nltk.download('punkt_tab', quiet=True)
+                    tokens = nltk.word_tokenize(text, language="german")
+                    return " ".join(stemmer.stem_many([token for token in tokens if token.isalpha()]))
+                except:
+                    print(f"{log_prefix}: WARNING: punkt tokenizer not available, skipping stemming.")
+                    return ""
+
+        return ""
+
+
+    def tokenize_text(text: str) -> list[str]:
+        """
+        Tokenizes the input text with NLTK. Returns a list of string tokens. Falls back to downloading resources if required.
+        spaCy tokenization is done in `spacy_single_pass` together with stopword removal and lemmatization.
+
+        :dependency: nltk: for simple word-based tokenization (`punkt`)
+
+        :param: text (str): The input string to tokenize. Raw or preprocessed text.
+
+        :return: tokens (list[str]): A list of tokens
+                                     Or an empty list if tokenization fails or is disabled (method = "NONE").
+
+        :raises: TypeError: If input is not a string.
+        """
+        # typecheck input
+        if not isinstance(text, str):
+            raise TypeError(f"Tokenization expects string input, got {type(text)}")
+
+        if tokenization_method.upper() == "NLTK":
+            try:
+                return nltk.word_tokenize(text, language="german")
+            except LookupError:
+                try:
+                    nltk.download("punkt", quiet=True)
+                    return nltk.word_tokenize(text, language="german")
+                except:
+                    print(f"{log_prefix}: WARNING: punkt tokenizer not available, skipping tokenization.")
+                    return []
+
+        return []
+
+
+    def char_count(text: str) -> int:
+        """
+        Returns the number of characters in the input text if character count
+        tracking is enabled via the 'add_char_count' flag. Otherwise, returns -1.
+
+        :param: text (str): The preprocessed text string whose character length is to be evaluated.
+
+        :return: count (int): Number of characters in the text, or -1 if 'add_char_count' flag is False.
+
+        :raises: TypeError: If input is not a string.
+        """
+        # typecheck input
+        if not isinstance(text, str):
+            raise TypeError(f"{log_prefix}: WARNING: char_count expects string input, got {type(text)}")
+
+        if add_char_count:
+            return len(text)
+        return -1
+
+
+    def lemma_count(text: list[str]) -> int:
+        """
+        Returns the number of lemmas (assumed to be whitespace-separated tokens)
+        in the input text if lemma count tracking is enabled via the
+        'add_lemma_count' flag and text has been lemmatized. Otherwise, returns -1.
+
+        :param: text (list[str]): List of lemmatized tokens to be counted
+
+        :return: count (int): Number of lemmas, or -1 if 'add_lemma_count' is False or lemmatization is disabled.
+
+        :raises TypeError: If input is not a list.
+        """
+        # typecheck input
+        if not isinstance(text, list):
+            raise TypeError(f"{log_prefix}: WARNING: lemma_count expects string list input, got {type(text)}")
+
+        if add_lemma_count and lemmatization:
+            return len(text)
+        return -1
+
+
+    def token_count(text: list[str]) -> int:
+        """
+        Returns the number of tokens in the input list if token count tracking
+        is enabled via the 'add_token_count' flag and text has been tokenized. Otherwise, returns -1.
+
+        :param: text (list[str]): A list of tokens (e.g., words or subwords).
+
+        :return: count (int): Number of tokens,  or -1 if 'add_token_count' is False or tokenization is disabled.
+
+        :raises TypeError: If input is not a list.
+        """
+        # typecheck input
+        if not isinstance(text, list):
+            raise TypeError(f"{log_prefix}: WARNING: token_count expects string list input, got {type(text)}")
+
+        if add_token_count and (tokenization_method.upper() != "NONE"):
+            return len(text)
+        return -1
+
+
+
+    # setup spacy instance (loaded once per process)
+    stages_to_run = PREPROCESSING_STAGES[completed_stages:]
+    spacy_instance = load_spacy_model(log_prefix, parallel_processing) if needs_spacy and "spacy" in stages_to_run else None
+
+    # Apply contributions logic row-wise
+    if "contributions" in stages_to_run:
+        with profiler.stage("contributions", len(df), text_chars(df["speech_content"])):
+            if contributions.upper() != "NONE": print(f"{log_prefix}: Handle contributions ... ", end="", flush= not parallel_processing)
+            df["speech_content"] = [
+                handle_contributions(text, speech_id)
+                for text, speech_id in zip(df["speech_content"], df["id"])
+            ]
+            if contributions.upper() != "NONE": print(f"{log_prefix}: Done.")
+
+    # clean speech_content as to the defined specifications
+    if "clean" in stages_to_run:
+        with profiler.stage("clean", len(df), text_chars(df["speech_content"])):
+            print(f"{log_prefix}: Clean speech content ...", end="", flush= not parallel_processing)
+            cleaning_program = CleaningProgram(to_lower, remove_digits, remove_punctuation, phrase_patterns)
+            df["speech_content_cleaned"] = cleaning_program.clean_many(df["speech_content"].astype(str)) # only collapses whitespace as standard
+            print(f"{log_prefix}: Done.")
+
+    # remove stopwords with NLTK (spaCy stopword removal happens in the single spaCy pass below)
+    if "stopwords" in stages_to_run and stopword_mode.upper() != "SPACY":
+        with profiler.stage("stopwords", len(df), text_chars(df["speech_content_cleaned"])):
+            if stopword_mode.upper() == "NLTK":
+                print(f"{log_prefix}: Removing stopwords ... ", end="", flush= not parallel_processing)
+                df["speech_content_stopword"] = remove_stopwords_many(df["speech_content_cleaned"], frozenset(all_sw))
+                print(f"{log_prefix}: Done.")
+            else:
+                df["speech_content_stopword"] = ""
+
+    # parse every speech once with spaCy: stopword removal, lemmas and tokens all come from the same Doc
+    if "spacy" in stages_to_run:
+        with profiler.stage("spacy", len(df)) as stage_counts:
+            spacy_lemmas = [[] for _ in range(len(df))]
+            spacy_tokens = [[] for _ in range(len(df))]
+            if needs_spacy:
+                print(f"{log_prefix}: Running spaCy (stopwords/lemmas/tokens) ... ", end="", flush= not parallel_processing)
+                if stopword_mode.upper() == "SPACY":
+                    spacy_source = df["speech_content_cleaned"]
+                elif stopword_mode.upper() != "NONE":
+                    spacy_source = df["speech_content_stopword"]
+                else:
+                    spacy_source = df["speech_content_cleaned"]
+                stage_counts["chars"] = text_chars(spacy_source)
+                spacy_stopword_texts, spacy_lemmas, spacy_tokens = spacy_single_pass(
+                    spacy_instance,
+                    spacy_source.tolist(),
+                    stopwords=all_sw if stopword_mode.upper() == "SPACY" else None,
+                    lemmatization=lemmatization,
+                    tokenization=tokenization_method.upper() == "SPACY",
+                    batch_size=spacy_batch_size,
+                )
+                if stopword_mode.upper() == "SPACY":
+                    df["speech_content_stopword"] = spacy_stopword_texts
+                print(f"{log_prefix}: Done.")
+
+            # lemmas after stopwords have been removed
+            df["speech_content_lemmatized"] = spacy_lemmas
+            if tokenization_method.upper() == "SPACY":
+                df["speech_content_tokenized"] = spacy_tokens
+
+    # stem speeches after stopwords have been removed
+    if "stem" in stages_to_run:
+        stem_source = "speech_content_stopword" if stopword_mode.upper() != "NONE" else "speech_content_cleaned"
+        with profiler.stage("stem", len(df), text_chars(df[stem_source]) if stemming else 0):
+            if stemming: print(f"{log_prefix}: Stemming speeches ... ", end="", flush= not parallel_processing)
+            df["speech_content_stemmed"] = df[stem_source].apply(stem_text)
+            if stemming: print(f"{log_prefix}: Done. ({len(stemmer.stems)} distinct tokens, {stemmer.hit_rate():.1%} stem cache hits)")
+
+    # tokenize speeches after stopwords have been removed (spaCy tokens come from the single spaCy pass)
+    if "tokenize" in stages_to_run and tokenization_method.upper() != "SPACY":
+        token_source = "speech_content_stopword" if stopword_mode.upper() != "NONE" else "speech_content_cleaned"
+        with profiler.stage("tokenize", len(df), text_chars(df[token_source]) if tokenization_method.upper() != "NONE" else 0):
+            if tokenization_method.upper() != "NONE": print(f"{log_prefix}: Tokenizing speeches ... ", end="", flush= not parallel_processing)
+            df["speech_content_tokenized"] = df[token_source].apply(lambda t: tokenize_text(t))
+            if tokenization_method.upper() != "NONE":print(f"{log_prefix}: Done.")
+
+    with profiler.stage("counts", len(df)):
+        # add speech_length_char column for next step
+        if add_char_count: print(f"{log_prefix}: Counting chars ... ", end="", flush= not parallel_processing)
+        if stemming: # use stemmed speech content
+            df["speech_length_chars"] = df["speech_content_stemmed"].apply(char_count)
+        elif stopword_mode.upper() != "NONE": # use stop-word-cleaned speech content
+            df["speech_length_chars"] = df["speech_content_stopword"].apply(char_count)
+        else:
+            df["speech_length_chars"] = df["speech_content_cleaned"].apply(char_count)
+        if add_char_count: print(f"{log_prefix}: Done.")
+
+        # add speech_length_lemmas column for next step
+        if add_lemma_count: print(f"{log_prefix}: Counting chars ... ", end="", flush= not parallel_processing)
+        df["speech_length_lemmas"] = df["speech_content_lemmatized"].apply(lemma_count)
+        if add_lemma_count: print(f"{log_prefix}: Done.")
+
+        # add speech_length_tokens column for next step
+        if add_token_count: print(f"{log_prefix}: Counting chars ... ", end="", flush= not parallel_processing)
+        df["speech_length_tokens"] = df["speech_content_tokenized"].apply(token_count)
+        if add_token_count: print(f"{log_prefix}: Done.")
+
+    # fixed column order, independent of the stages that were taken from the stage cache
+    return df[[column for column in df.columns if column not in PREPROCESSING_COLUMNS] + PREPROCESSING_COLUMNS]
+
+
+
+def split_contribution_index(contribution_index: dict, shards: list[pd.DataFrame]) -> list:
+    """
+    Splits a contribution index into one sub-index per shard, so that every worker only receives the
+    contributions of its own speeches. Uses a single pass over the index via a speech_id -> shard map.
+
+    :param: contribution_index (dict): Index built by `build_contribution_index` or None.
+    :param: shards (list[pd.DataFrame]): The speech shards (column 'id' required).
+
+    :return: shard_indexes (list[dict]): One index per shard (None for every shard if `contribution_index` is None).
+    """
+    if contribution_index is None:
+        return [None] * len(shards)
+
+    # speech ids can (in theory) occur in more than one shard
+    shards_of_speech = {}
+    for shard_number, shard in enumerate(shards):
+        for speech_id in shard["id"]:
+            try:
+                shards_of_speech.setdefault(int(speech_id), set()).add(shard_number)
+            except (TypeError, ValueError):
+                continue
+
+    shard_indexes = [{} for _ in shards]
+    for key, content in contribution_index.items():
+        for shard_number in shards_of_speech.get(key[0], ()):
+            shard_indexes[shard_number][key] = content
+
+    return shard_indexes
+
+
+
+def process_speech_rows_profiled(df: pd.DataFrame, **row_options) -> tuple:
+    """
+    Runs `process_speech_rows` with a profiler of its own and returns the profiler records together with
+    the result, so the stage timings of a shard can be sent back from a worker process.
+
+    :param: df (pd.DataFrame): Filtered speeches (or a shard of them).
+    :param: row_options (dict): Keyword arguments passed to `process_speech_rows`.
+
+    :return: (df, records) (tuple): The processed speeches and the records of `StageProfiler.to_records`.
+    """
+    profiler = StageProfiler()
+    df = process_speech_rows(df, profiler=profiler, **row_options)
+    return df, profiler.to_records()
+
+
+
+def process_speech_rows_sharded(
+    df: pd.DataFrame,
+    contribution_index: dict,
+    row_options: dict,
+    shard_executor,
+    shard_size: int,
+    profiler: StageProfiler = None,
+    log_prefix: str = ""
+) -> pd.DataFrame:
+    """
+    Splits the filtered speeches into shards of `shard_size` rows, runs `process_speech_rows` for every shard
+    on the given executor and reassembles the results in the original row order.
+
+    :param: df (pd.DataFrame): Filtered speeches.
+    :param: contribution_index (dict): Index built by `build_contribution_index` or None.
+    :param: row_options (dict): Keyword arguments passed to `process_speech_rows`.
+    :param: shard_executor (concurrent.futures.Executor): Executor the shards are submitted to.
+    :param: shard_size (int): Maximum number of speeches per shard.
+    :param: profiler (StageProfiler): If given: Receives the stage records of all shards (wall times are summed
+            over the shards, i.e. they are worker times, not elapsed time).
+    :param: log_prefix (str): Adds a custom message before every log.
+
+    :return: df (pd.DataFrame): The processed speeches, identical to a single `process_speech_rows` call.
 
-        # Report statistics
-        print(f"combine_two_datasets: Dataset A: {len(data_set_a)} rows")
-        print(f"combine_two_datasets: Dataset B: {len(data_set_b)} rows")
-        print(f"combine_two_datasets: Combined : {len(data_set_a_b)} rows")
-        print(f"combine_two_datasets: Datasets successfully combined and saved to: {output_path}")
+    :raises: ValueError: If shard_size is not a positive integer.
+    """
+    if not isinstance(shard_size, int) or shard_size < 1:
+        raise ValueError(f"{log_prefix}: shard_size must be a positive integer, got {shard_size}")
+
+    shards = [df.iloc[start:start + shard_size] for start in range(0, len(df), shard_size)]
+    shard_indexes = split_contribution_index(contribution_index, shards)
+    print(f"{log_prefix}: Processing {len(df)} speeches in {len(shards)} shards of up to {shard_size} rows.")
+
+    futures = [
+        shard_executor.submit(
+            process_speech_rows_profiled,
+            shard,
+            contribution_index=shard_index,
+            log_prefix=f"{log_prefix} [shard {shard_number + 1}/{len(shards)}]",
+            **row_options
+        )
+        for shard_number, (shard, shard_index) in enumerate(zip(shards, shard_indexes))
+    ]
+
+    # collect in submission order to keep the original row order
+    results = [future.result() for future in futures]
+    if profiler is not None:
+        for _, records in results:
+            profiler.merge(records)
+    return concat([shard_df for shard_df, _ in results])
 
-    except Exception as e:
-        print(f"combine_two_datasets: [ERROR]: Failed to combine datasets: {e}")
 
 
 
 # Wrapper-Function for parallel processing
-def run_preprocessing(dataset, config):
+def run_preprocessing(dataset, config, shard_executor=None, shard_size=None):
     """
     Wrapper-Function for parallel processing
     Executes the speech preprocessing pipeline for a single dataset based on the provided configuration
@@ -158,6 +1060,8 @@ def run_preprocessing(dataset, config):
             - 'output_path_pickle' (Path): Path to save the cleaned .pkl file.
         Optional keys:
             Any keyword argument accepted by `preprocess_speech_data()` (e.g., stopword_mode, lemmatization, ...).
+    :param: shard_executor (concurrent.futures.Executor): Optional executor the shards of this dataset are submitted to.
+    :param: shard_size (int): Maximum number of speeches per shard (only used with shard_executor).
 
     :return: (str): A status message indicating the completion of the 'dataset' processing.
 
@@ -185,6 +1089,8 @@ def run_preprocessing(dataset, config):
             input_path=config["input_path"],
             output_path_pickle=config["output_path_pickle"],
             output_path_excel=config.get("output_path_excel", None),
+            output_path_parquet=config.get("output_path_parquet", None),
+            parquet_compression=config.get("parquet_compression", "zstd"),
             position_short=["Presidium of Parliament", "Guest"],
             only_valid_faction_id=config.get("only_valid_faction_id", False),
             without_faction=config.get("without_faction", None),
@@ -205,6 +1111,13 @@ def run_preprocessing(dataset, config):
             add_char_count=config.get("add_char_count", False),
             add_token_count=config.get("add_token_count", False),
             add_lemma_count=config.get("add_lemma_count", False),
+            spacy_batch_size=config.get("spacy_batch_size", 256),
+            shard_executor=shard_executor,
+            shard_size=config.get("shard_size", shard_size),
+            stage_cache_dir=config.get("stage_cache_dir", None),
+            stage_cache_max_bytes=config.get("stage_cache_max_bytes", 2 * 1024 ** 3),
+            chunk_size=config.get("chunk_size", None),
+            profile_report_path=config.get("profile_report_path", None),
             log_prefix = config.get("log_prefix", ""),
             parallel_processing = True
         )
@@ -215,7 +1128,7 @@ def run_preprocessing(dataset, config):
 
 
 # parallel execution
-def execute_parallel_preprocessing(dataset_configs):
+def execute_parallel_preprocessing(dataset_configs, shard_size=None, n_cores=None, n_datasets_in_flight=2, profile_report_path=None):
     """
     Executes multiple preprocessing tasks in parallel using all available CPU cores.
     This function distributes independent dataset configurations across multiple processes
@@ -223,6 +1136,12 @@ def execute_parallel_preprocessing(dataset_configs):
     by `run_preprocessing`, which wraps the `preprocess_speech_data()` call with proper
     configuration validation.
 
+    Without `shard_size` every dataset runs in its own process, so a run can never use more cores than it has
+    datasets and the largest dataset determines the total runtime. With `shard_size` the datasets are
+    loaded and filtered in the main process (at most `n_datasets_in_flight` at the same time to bound memory)
+    and their speeches are split into shards of `shard_size` rows, which are processed by one shared pool of
+    worker processes. Every worker loads the spaCy model only once. The output is identical in both modes.
+
     :param: dataset_configs (dict):
             A dictionary where each key is a dataset name (str), and each value is a config dict for one dataset
             with arguments passed to `run_preprocessing`.
@@ -240,6 +1159,13 @@ def execute_parallel_preprocessing(dataset_configs):
                 ...
             }
         }
+    :param: shard_size (int): If given: Enables sharded processing with up to `shard_size` speeches per shard.
+    :param: n_cores (int): Number of worker processes. Default: min(10, cpu_count()) without sharding, cpu_count() with sharding.
+    :param: n_datasets_in_flight (int): Number of datasets that are loaded and sharded at the same time (only with sharding).
+    :param: profile_report_path (Path): If given: Saves the stage reports of all datasets and their per-stage totals
+            (dataset "ALL") to this .json or .csv file. Every config without its own 'profile_report_path' writes its
+            report next to its 'output_path_pickle' (<output stem>_profile.json/.csv).
+
     :return: None. Prints progress and result status messages to console.
 
     :raises: TypeError: If input is not a dict.
@@ -252,24 +1178,79 @@ def execute_parallel_preprocessing(dataset_configs):
     if not dataset_configs:
         raise ValueError(f"execute_parallel_preprocessing: No dataset configurations provided.")
 
-    # Determine the number of CPU cores to use
-    n_cores = min(10, multiprocessing.cpu_count())
-    print(f"[INFO] Using {n_cores} cores")
-
-    # Create a process pool and submit preprocessing tasks
-    with ProcessPoolExecutor(max_workers=n_cores) as executor:
-        futures = [
-            executor.submit(run_preprocessing, dataset, config)
+    # every dataset writes its own stage report, the aggregated report is built from these files
+    if profile_report_path:
+        profile_report_path = Path(profile_report_path)
+        dataset_configs = {
+            dataset: config if config.get("profile_report_path") or "output_path_pickle" not in config else dict(
+                config,
+                profile_report_path=config["output_path_pickle"].with_name(f"{config['output_path_pickle'].stem}_profile{profile_report_path.suffix}")
+            )
             for dataset, config in dataset_configs.items()
-        ]
+        }
 
-        # Wait for all tasks to complete and print results
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                print(f"[RESULT] {result}")
-            except Exception as e:
-                print(f"[ERROR] Unexpected error during parallel execution: {type(e).__name__}: {e}")
+    def save_aggregated_profile_report():
+        """
+        Combines the stage reports of all datasets into `profile_report_path` (if given).
+        """
+        if not profile_report_path:
+            return
+        records = []
+        for dataset, config in dataset_configs.items():
+            dataset_report_path = config.get("profile_report_path")
+            if not dataset_report_path or not Path(dataset_report_path).exists():
+                print(f"[WARNING] No stage report for {dataset}, it is missing in the aggregated report.")
+                continue
+            for record in read_profile_report(dataset_report_path):
+                records.append(dict(record, dataset=dataset))
+        write_profile_report(aggregate_profile_records(records), profile_report_path)
+        print(f"[INFO] Saved aggregated stage report to <{profile_report_path}>")
+
+    # one process per dataset
+    if shard_size is None:
+        # Determine the number of CPU cores to use
+        n_cores = n_cores or min(10, multiprocessing.cpu_count())
+        print(f"[INFO] Using {n_cores} cores")
+
+        # Create a process pool and submit preprocessing tasks
+        with ProcessPoolExecutor(max_workers=n_cores) as executor:
+            futures = [
+                executor.submit(run_preprocessing, dataset, config)
+                for dataset, config in dataset_configs.items()
+            ]
+
+            # Wait for all tasks to complete and print results
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    print(f"[RESULT] {result}")
+                except Exception as e:
+                    print(f"[ERROR] Unexpected error during parallel execution: {type(e).__name__}: {e}")
+        save_aggregated_profile_report()
+        return
+
+    # one shared process pool for the shards of all datasets
+    n_cores = n_cores or multiprocessing.cpu_count()
+    n_datasets_in_flight = max(1, min(len(dataset_configs), n_datasets_in_flight))
+    print(f"[INFO] Using {n_cores} cores, shards of {shard_size} speeches, {n_datasets_in_flight} datasets in flight")
+
+    # "spawn" so that no worker is forked while the dataset threads are running
+    with ProcessPoolExecutor(max_workers=n_cores, mp_context=multiprocessing.get_context("spawn")) as shard_executor:
+        with ThreadPoolExecutor(max_workers=n_datasets_in_flight) as dataset_executor:
+            futures = [
+                dataset_executor.submit(run_preprocessing, dataset, config, shard_executor, shard_size)
+                for dataset, config in dataset_configs.items()
+            ]
+
+            # Wait for all tasks to complete and print results
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    print(f"[RESULT] {result}")
+                except Exception as e:
+                    print(f"[ERROR] Unexpected error during parallel execution: {type(e).__name__}: {e}")
+
+    save_aggregated_profile_report()
 
 
 
@@ -277,6 +1258,8 @@ def preprocess_speech_data(
     input_path: Path,                   # mandatory: cannot be empty
     output_path_pickle: Path,           # mandatory: cannot be empty
     output_path_excel: Path = None,     # optional: can be empty
+    output_path_parquet: Path = None,   # optional: can be empty
+    parquet_compression: str = "zstd",  # compression codec of the parquet export, e.g. "zstd", "snappy", "gzip" or "none"
     position_short: list[str] = None,   # All lines with position_shorts that match any of those strings will be deleted before the preprocessing process starts
     only_valid_faction_id: bool = False,# All lines with invalid faction_id (-1) will be deleted before the preprocessing process starts
     without_faction: str = None,        # All lines matching this faction_id will be deleted before the preprocessing process starts
@@ -298,6 +1281,13 @@ def preprocess_speech_data(
     add_char_count: bool = False,       # adds a column with the character count of each speech to the output
     add_token_count: bool = False,      # adds a column with the token count of each speech to the output
     add_lemma_count: bool = False,      # adds a column with the lemma count of each speech to the output
+    spacy_batch_size: int = 256,        # number of speeches per nlp.pipe batch in the single spaCy pass
+    shard_executor = None,              # optional executor: row-level stages run per shard on this executor
+    shard_size: int = None,             # maximum number of speeches per shard (only used with shard_executor)
+    stage_cache_dir: Path = None,       # optional directory of the stage cache shared between configs
+    stage_cache_max_bytes: int = 2 * 1024 ** 3, # size limit of the stage cache, least recently used entries are evicted
+    chunk_size: int = None,             # if given: streams the input in chunks of chunk_size rows into a parquet output
+    profile_report_path: Path = None,   # optional .json or .csv path for the per-stage timing/throughput report
     log_prefix: str = "",               # adds a custom message before every log
     parallel_processing: bool = False         # shifts the log messages to multiline while parallel processing for better readability
 ):
@@ -323,9 +1313,11 @@ def preprocess_speech_data(
     :param:
     | Parameter                      | Type                               | Standard | Description                                                                                                                                     |
     |--------------------------------|------------------------------------|----------|-------------------------------------------------------------------------------------------------------------------------------------------------|
-    | `input_path`                   | `Path`                             |          | Mandatory: Path to the input `.pkl` file containing the speeches                                                                                |
+    | `input_path`                   | `Path`                             |          | Mandatory: Path to the input `.pkl` or `.parquet` file containing the speeches                                                                  |
     | `output_path_pickle`           | `Path`                             |          | Mandatory: Path where the cleaned `.pkl` file shall be saved                                                                                    |
     | `output_path_excel`            | `Path`                             | `None`   | Enables Excel export of the results to the given path                                                                                           |
+    | `output_path_parquet`          | `Path`                             | `None`   | Enables Parquet export of the results to the given path (list columns are stored as list<string>, see `load_speech_data`)                      |
+    | `parquet_compression`          | `str`                              | `"zstd"` | Compression codec of the Parquet export, e.g. "zstd", "snappy", "gzip" or "none"                                                               |
     | `position_short`               | `list[str]`                        | `None`   | Filters out rows where position_short matches one mentioned in the given list (e.g., "Guest") (Case sensitive!)                                 |
     | `only_valid_faction_id`        | `bool`                             | `False`  | If Enabled: Removes all speeches with `faction_id == -1`                                                                                        |
     | `without_faction`              | `str`                              | `None`   | Removes all speeches with this specific faction ID                                                                                              |
@@ -346,12 +1338,22 @@ def preprocess_speech_data(
     | `add_char_count`               | `bool`                             | `False`  | If Enabled: Adds a column with character count (counts characters after latest preprocessing step)                                              |
     | `add_token_count`              | `bool`                             | `False`  | If Enabled: Adds a column with token count (if tokenization is also enabled)                                                                    |
     | `add_lemma_count`              | `bool`                             | `False`  | If Enabled: Adds a column with lemma count (if lemmatization is also enabled)                                                                   |
+    | `spacy_batch_size`             | `int`                              | `256`    | Number of speeches per `nlp.pipe` batch. spaCy stopword removal, lemmatization and tokenization share one parse per speech                     |
+    | `shard_executor`               | `Executor`                         | `None`   | If given: Splits the filtered speeches into shards and runs the row-level stages of every shard on this executor (e.g. a `ProcessPoolExecutor`) |
+    | `shard_size`                   | `int`                              | `None`   | Maximum number of speeches per shard. Sharding is only used if `shard_executor` is given and the dataset has more rows than `shard_size`     |
+    | `stage_cache_dir`              | `Path`                             | `None`   | If given: Caches the output of every row-level stage in this directory and reuses the longest cached prefix of stages (same input file, filters and stage parameters) |
+    | `stage_cache_max_bytes`        | `int`                              | `2 GiB`  | Size limit of the stage cache. The least recently used entries are deleted when the limit is exceeded                                          |
+    | `chunk_size`                   | `int`                              | `None`   | If given: Streaming mode. Reads, processes and writes the speeches in chunks of `chunk_size` rows, so memory is bounded by the chunk size (for `.parquet` input). The output is written to `output_path_parquet` (default: `output_path_pickle` with suffix `.parquet`), no pickle/Excel export. The stage cache is not used |
+    | `profile_report_path`          | `Path`                             | `None`   | If given: Saves wall time, rows/sec, chars/sec and process peak memory of every stage (load, filter, stage_cache, contributions, clean, stopwords, spacy, stem, tokenize, counts, save) as `.json` or `.csv` report |
 
     :return:
     - No value is returned (in-place saving only).
     - The preprocessed speech DataFrame is saved to:
         - `output_path_pickle` (.pkl, always)
         - `output_path_excel` (.xlsx, optional)
+        - `output_path_parquet` (.parquet, optional)
+        - in streaming mode (`chunk_size`) only to `output_path_parquet` (.parquet, default: `output_path_pickle` with suffix .parquet)
+    - If `profile_report_path` is given, the stage report is saved to this path (.json or .csv).
     - If `generate_contributions_data=True`, two additional files are saved in the same directory:
         - `contributions_simplified.pkl`
         - `contributions_extended.pkl`
@@ -371,11 +1373,11 @@ def preprocess_speech_data(
     """
 
     # set up variables
-    spacy_instance = None
     all_sw = set()
-    stemmer = GermanStemmer()
     contributions_simplified_df = None
     contributions_extended_df = None
+    contribution_index = None
+    profiler = StageProfiler(log_prefix.strip() or input_path.stem)
 
 
     def initial_data_filter(data: pd.DataFrame) -> pd.DataFrame:
@@ -443,331 +1445,55 @@ def preprocess_speech_data(
             print(f"{log_prefix}: [change_faction Transform] Replaced faction_id '{old_id}' with '{new_id}' in {replacements} rows.")
 
         # Generates one file for contributions_simplified and one for contributions_extended only containing the relevant data
-        if generate_contributions_data:
-            if contributions_simplified_df is None:
-                print(f"{log_prefix}: [ERROR] Could not load contributions simplified and will not generate file: {e}")
-                return data
-            if contributions_extended_df is None:
-                print(f"{log_prefix}: [ERROR] Could not load contributions extended and will not generate file: {e}")
-                return data
-            # setup data
-            contrib_ext_df  = contributions_extended_df.copy()
-            contrib_simpl_df = contributions_simplified_df.copy()
-            # filterlogic contributions
-            valid_ids = set(data["id"])
-            contrib_ext_filtered = contrib_ext_df[contrib_ext_df["speech_id"].isin(valid_ids)]
-            contrib_simpl_filtered = contrib_simpl_df[contrib_simpl_df["speech_id"].isin(valid_ids)]
-            # prepare output path
-            output_path_pickle.parent.mkdir(parents=True, exist_ok=True)
-            # save filtered contributions
-            contrib_simpl_filtered.to_pickle(output_path_pickle.parent / f"contributions_simplified.pkl")
-            contrib_ext_filtered.to_pickle(output_path_pickle.parent / f"contributions_extended.pkl")
-            print(f"{log_prefix}: [generate_contribution_data Transform] Saved {len(contrib_simpl_filtered)} rows for simplified and {len(contrib_ext_filtered)} for extended.")
+        # (in streaming mode once for all chunks, see below)
+        if generate_contributions_data and not chunk_size:
+            save_filtered_contributions(set(data["id"]))
 
         print(f"{log_prefix}: [initial_data_filter Summary] Total rows after filtering: {len(data)} (from {original_len})")
 
         return data
 
 
-    def handle_contributions(text: str, speech_id: int, contributions_simplified: pd.DataFrame):
-        """
-        Either removes or reinserts contributions into speech_content, based on simplified contribution data.
-
-        :param: text (str): The speech text with contribution position markers.
-        :param: speech_id (int): The ID of the speech.
-
-        :return: str: The updated text (either without contribution position markers or with inserted contribution descriptions).
-        """
-        # remove contribution text postion markers
-        if contributions.upper() == "REMOVE":
-            text = re.sub(r'\[.*?\]', ' ', text, flags=re.IGNORECASE | re.MULTILINE)   # Remove "[Beifall]" and brackets like "[...]"
-            text = re.sub(r'\(\{\d+\}\)', ' ', text, flags=re.IGNORECASE | re.MULTILINE)  # Remove "({<NUM>})" (placeholders for contributions)
-
-        # insert old contributions
-        elif contributions.upper() == "INSERT":
-            # failsafe
-            if contributions_simplified.empty:
-                print(f"{log_prefix}: [WARNING] contribution_simplified df empty for speech {speech_id}. Skipping insertion.")
-                return text
-
-            # helperfunction to find the right contributions for the text position marker and speech id
-            def handle_match(match):
-                try:
-                    pos = int(match.group().strip("{}()"))
-                    speech_contribution = contributions_simplified[
-                        (contributions_simplified["speech_id"].astype(int) == speech_id) &
-                        (contributions_simplified["text_position"].astype(int) == pos)
-                        ]
-                    if not speech_contribution.empty:
-                        return " ".join(speech_contribution["content"].astype(str))
-                except Exception:
-                    print(f"{log_prefix}: [WARNING] Insertion did not work in speech {speech_id}. Skipping insertion.")
-                    pass
-                return ""
-
-            # replace every text position contribution marker step by step
-            text = re.sub(r'\(\{\d+\}\)', handle_match, text)
-
-        return text
-
-
-    def clean(text):
-        """
-        Normalizes and cleans a speech string by applying several optional steps:
-        lowercasing, digit removal, punctuation removal, phrase-based regex cleaning,
-        and whitespace normalization.
-
-        :param: text (str): The raw speech tet.
-
-        :return: cleaned_text (str): Speech in various states of cleanliness.
-        """
-        if to_lower:
-            text = text.lower()
-
-        if remove_digits:
-            text = re.sub(r"\d+", " ", text)  # Remove digits
-
-        if remove_punctuation:
-            text = re.sub(rf"[{re.escape(string.punctuation)}]", " ", text) # Remove punctuation
-
-        # phrase-based removal if patterns were passed
-        text = phrase_based_removal(text, phrase_patterns or [])
-
-        # collapse white space as standard
-        text = re.sub(r"\s+", " ", text)
-
-        return text.strip()
-
-
-    def phrase_based_removal(text: str, patterns: list[str]) -> str:
-        """
-        Removes phrases from the input text that match any of the provided regex patterns.
-        If the list is empty, the text is returned unchanged.
-
-        :param text (str): The raw or partially cleaned speech text to be processed.
-        :param patterns (list[str]): A list of regex patterns. Each pattern will be applied independently to the text and replaced with a space.
-
-        :return: cleaned_text (str): The input string with all matched patterns removed.
-        """
-        if not patterns:
-            return text
-
-        for pattern in patterns:
-            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE | re.MULTILINE)
-
-        return text
-
-
-    def remove_stopwords(text):
-        """
-        Removes stopwords from the input text based on the configured method ("NLTK" or "SPACY").
-
-        :param text (str): Typically cleaned speech text.
-
-        :return: filtered_text (str): The input string without stopwords, or original if stopword_mode is "NONE".
-        """
-        if stopword_mode.upper() == "NLTK":
-            return " ".join([w for w in text.split() if w not in all_sw])
-
-        elif stopword_mode.upper() == "SPACY":
-            doc = spacy_instance(text)
-            return " ".join(t.text for t in doc if not t.is_stop and not t.is_space and not t.is_punct)
-
-        return ""
-
-
-    def lemmatize_text(text: str) -> list[str]:
-        """
-        Lemmatizes the given text using spaCy's German language model.
-
-        :dependency: spaCy – requires `de_core_news_sm` and a valid `spacy_instance`
-
-        :param: text (str): The input text string (usually pre-cleaned and stopword-processed).
-
-        :return: lemmas (list[str]): List of lemmatized word forms, skipping whitespace tokens.
-                                 Returns empty list on error or if lemmatization is disabled.
-
-        :raises: TypeError: If input is not a string.
-        """
-        # typecheck input
-        if not isinstance(text, str):
-            raise TypeError(f"Lemmatization expects string input, got {type(text)}")
-
-        if lemmatization:
-            try:
-                doc = spacy_instance(text)
-                return [t.lemma_ for t in doc if not t.is_space]
-            except Exception as e:
-                print(f"{log_prefix}: WARNING: spaCy lemmatization failed: {e}")
-                return []
-
-        return []
-
-
-    def stem_text(text: str) -> str:
-        """
-        Applies stemming to the given German text using NLTK's SnowballStemmer.
-        Tokenizes the input text and stems each word if alphabetic. Falls back to downloading
-        the Punkt tokenizer if not available.
-
-        :dependency: nltk: punkt tokenizer and SnowballStemmer for German
-        :dependency: stemmer: pre-initialized GermanStemmer object
-
-        :param: text (str): Preprocessed input text (ideally cleaned and stopword-processed).
-
-        :return: stemmed_text (str): Stemmed version of the input string (words joined by spaces).
-                                 Returns empty string if stemming is disabled or fails.
-
-        :raises: TypeError: If input is not a string.
-        """
-        # typecheck input
-        if not isinstance(text, str):
-            raise TypeError(f"{log_prefix}: WARNING: Stemming expects string input, got {type(text)}")
-
-        if stemming:
-            try:
-                tokens = nltk.word_tokenize(text, language="german")
-                return " ".join(stemmer.stem(token) for token in tokens if token.isalpha())
-            except LookupError:
-                try:
-                    nltk.download('punkt_tab', quiet=True)
-                    tokens = nltk.word_tokenize(text, language="german")
-                    return " ".join(stemmer.stem(token) for token in tokens if token.isalpha())
-                except:
-                    print(f"{log_prefix}: WARNING: punkt tokenizer not available, skipping stemming.")
-                    return ""
-
-        return ""
-
-
-    def tokenize_text(text: str) -> list[str]:
-        """
-        Tokenizes the input text using the selected method: "SPACY" or "NLTK".
-        Returns a list of string tokens. Falls back to downloading resources if required.
-
-        :dependency: spaCy: for linguistically-informed tokenization (`de_core_news_sm`)
-        :dependency: nltk: for simple word-based tokenization (`punkt`)
-
-        :param: text (str): The input string to tokenize. Raw or preprocessed text.
-
-        :return: tokens (list[str]): A list of tokens
-                                     Or an empty list if tokenization fails or is disabled (method = "NONE").
-
-        :raises: TypeError: If input is not a string.
-        """
-        # typecheck input
-        if not isinstance(text, str):
-            raise TypeError(f"Tokenization expects string input, got {type(text)}")
-
-        if tokenization_method.upper() == "SPACY":
-            try:
-                doc = spacy_instance(text)
-                return [t.text for t in doc if not t.is_space]
-            except Exception as e:
-                print(f"{log_prefix}: WARNING: spaCy tokenization failed: {e}")
-                return []
-
-        elif tokenization_method.upper() == "NLTK":
-            try:
-                return nltk.word_tokenize(text, language="german")
-            except LookupError:
-                try:
-                    nltk.download("punkt", quiet=True)
-                    return nltk.word_tokenize(text, language="german")
-                except:
-                    print(f"{log_prefix}: WARNING: punkt tokenizer not available, skipping tokenization.")
-                    return []
-
-        return []
-
-
-    def char_count(text: str) -> int:
-        """
-        Returns the number of characters in the input text if character count
-        tracking is enabled via the 'add_char_count' flag. Otherwise, returns -1.
-
-        :param: text (str): The preprocessed text string whose character length is to be evaluated.
-
-        :return: count (int): Number of characters in the text, or -1 if 'add_char_count' flag is False.
-
-        :raises: TypeError: If input is not a string.
-        """
-        # typecheck input
-        if not isinstance(text, str):
-            raise TypeError(f"{log_prefix}: WARNING: char_count expects string input, got {type(text)}")
-
-        if add_char_count:
-            return len(text)
-        return -1
-
-
-    def lemma_count(text: list[str]) -> int:
-        """
-        Returns the number of lemmas (assumed to be whitespace-separated tokens)
-        in the input text if lemma count tracking is enabled via the
-        'add_lemma_count' flag and text has been lemmatized. Otherwise, returns -1.
-
-        :param: text (list[str]): List of lemmatized tokens to be counted
-
-        :return: count (int): Number of lemmas, or -1 if 'add_lemma_count' is False or lemmatization is disabled.
-
-        :raises TypeError: If input is not a list.
-        """
-        # typecheck input
-        if not isinstance(text, list):
-            raise TypeError(f"{log_prefix}: WARNING: lemma_count expects string list input, got {type(text)}")
-
-        if add_lemma_count and lemmatization:
-            return len(text)
-        return -1
-
-
-    def token_count(text: list[str]) -> int:
+    def save_filtered_contributions(valid_ids: set) -> None:
         """
-        Returns the number of tokens in the input list if token count tracking
-        is enabled via the 'add_token_count' flag and text has been tokenized. Otherwise, returns -1.
-
-        :param: text (list[str]): A list of tokens (e.g., words or subwords).
+        Saves one file for contributions_simplified and one for contributions_extended, both only containing
+        the contributions of the remaining speeches, next to `output_path_pickle`.
 
-        :return: count (int): Number of tokens,  or -1 if 'add_token_count' is False or tokenization is disabled.
+        :param: valid_ids (set): IDs of the speeches left after filtering.
 
-        :raises TypeError: If input is not a list.
+        :return: None
         """
-        # typecheck input
-        if not isinstance(text, list):
-            raise TypeError(f"{log_prefix}: WARNING: token_count expects string list input, got {type(text)}")
-
-        if add_token_count and (tokenization_method.upper() != "NONE"):
-            return len(text)
-        return -1
-
+        if contributions_simplified_df is None:
+            print(f"{log_prefix}: [ERROR] Could not load contributions simplified and will not generate file.")
+            return
+        if contributions_extended_df is None:
+            print(f"{log_prefix}: [ERROR] Could not load contributions extended and will not generate file.")
+            return
+        # filterlogic contributions
+        contrib_ext_filtered = contributions_extended_df[contributions_extended_df["speech_id"].isin(valid_ids)]
+        contrib_simpl_filtered = contributions_simplified_df[contributions_simplified_df["speech_id"].isin(valid_ids)]
+        # prepare output path
+        output_path_pickle.parent.mkdir(parents=True, exist_ok=True)
+        # save filtered contributions
+        contrib_simpl_filtered.to_pickle(output_path_pickle.parent / f"contributions_simplified.pkl")
+        contrib_ext_filtered.to_pickle(output_path_pickle.parent / f"contributions_extended.pkl")
+        print(f"{log_prefix}: [generate_contribution_data Transform] Saved {len(contrib_simpl_filtered)} rows for simplified and {len(contrib_ext_filtered)} for extended.")
 
 
 
     # check input path value
     if not input_path or not input_path.exists():
-        raise ValueError(f"{log_prefix}: You must provide a valid input_path pointing to an existing .pkl file")
-    # load data and check for speech_content column
-    df = pd.read_pickle(input_path)
-    assert "speech_content" in df.columns, "Input file must contain 'speech_content' column."
+        raise ValueError(f"{log_prefix}: You must provide a valid input_path pointing to an existing .pkl or .parquet file")
+    # load data and check for speech_content column (streaming mode: only the ids for the contribution checks)
+    if chunk_size:
+        df = load_speech_data(input_path, columns=["id"])
+    else:
+        with profiler.stage("load") as stage_counts:
+            df = load_speech_data(input_path)
+            assert "speech_content" in df.columns, "Input file must contain 'speech_content' column."
+            stage_counts["rows"], stage_counts["chars"] = len(df), text_chars(df["speech_content"])
     print(f"{log_prefix}: Input path <{input_path}> is correct.")
 
-    # setup spacy instance
-    needs_spacy = (
-            stopword_mode.upper() == "SPACY"
-            or tokenization_method.upper() == "SPACY"
-            or lemmatization
-    )
-    if needs_spacy and spacy_instance is None:
-        print(f"{log_prefix}: Setting up spacy instance ... ", end="", flush= not parallel_processing)
-        try:
-            spacy_instance = spacy.load("de_core_news_sm")
-        except OSError:
-            print(f"{log_prefix}: spaCy model not found. Downloading ...")
-            from spacy.cli import download
-            download("de_core_news_sm")
-            spacy_instance = spacy.load("de_core_news_sm")
-        print(f"{log_prefix}: Done.")
 
     # setup nltk
     if stemming or tokenization_method.upper() == "NLTK":
@@ -785,7 +1511,7 @@ def preprocess_speech_data(
                 print(f"{log_prefix}: [WARNING] Missing contribution_simplified file: {simplified_path}.")
             try:
                 print(f"{log_prefix}: Loading contributions simplified Pickle ...")
-                contributions_simplified_df = pd.read_pickle(simplified_path)
+                contributions_simplified_df = load_speech_data(simplified_path)
                 print(f"{log_prefix}: Contributions loaded.")
             except (EOFError, FileNotFoundError) as e:
                 contributions_simplified_df = pd.DataFrame()  # empty
@@ -809,7 +1535,7 @@ def preprocess_speech_data(
                 print(f"{log_prefix}: [WARNING] Missing contribution extended file: {contrib_ext_path}.")
             try:
                 print(f"{log_prefix}: Loading contributions extended Pickle ...")
-                contributions_extended_df = pd.read_pickle(contrib_ext_path)
+                contributions_extended_df = load_speech_data(contrib_ext_path)
                 print(f"{log_prefix}: Contributions loaded.")
             except (EOFError, FileNotFoundError) as e:
                 contributions_extended_df = pd.DataFrame()  # empty
@@ -824,24 +1550,6 @@ def preprocess_speech_data(
                 print(f"{log_prefix}: [ERROR] {len(missing_speech_ids)} speeches in input dir have no matching contributions in the provided contributions extended file. No contributions data will be generated!")
                 generate_contributions_data = False
 
-    # filter for relevant rows (deletes all irrelevant rows)
-    print(f"{log_prefix}: Filter data frame ... ", end="", flush= not parallel_processing)
-    df = initial_data_filter(df)
-    print(f"{log_prefix}: Done.")
-
-    # Apply contributions logic in DataFrame row-wise
-    if contributions.upper() != "NONE": print(f"{log_prefix}: Handle contributions ... ", end="", flush= not parallel_processing)
-    df["speech_content"] = df.apply(
-        lambda row: handle_contributions(row["speech_content"], row["id"], contributions_simplified_df),
-        axis=1
-    )
-    if contributions.upper() != "NONE": print(f"{log_prefix}: Done.")
-
-    # clean speech_content as to the defined specifications
-    print(f"{log_prefix}: Clean speech content ...", end="", flush= not parallel_processing)
-    df["speech_content_cleaned"] = df["speech_content"].astype(str).apply(clean) # only collapses whitespace as standard
-    print(f"{log_prefix}: Done.")
-
     # setup NLTK stopwords
     if stopword_mode == "NLTK":
         print(f"{log_prefix}: Setting up NLTK for stopword removal ... ", end="", flush= not parallel_processing)
@@ -860,83 +1568,199 @@ def preprocess_speech_data(
         # download stopwords once
         safe_nltk_download("corpora/stopwords")
         nltk_sw = set(stopwords.words("german"))
-        # spacy_instance = spacy.load("de_core_news_sm")
         # additional domain-specific stopwords
         custom_sw = custom_stopwords or set()
-        # combine all stopwords
+        # combine all stopwords (checked against every token in spacy_single_pass, the model itself is not modified)
         all_sw = nltk_sw.union(custom_sw)
-        for word in all_sw:
-            spacy_instance.Defaults.stop_words.add(word)
-            spacy_instance.vocab[word].is_stop = True
         print(f"{log_prefix}: Done.")
 
-    # remove stopwords if not (stopword_mode == "NONE")
-    if stopword_mode.upper() != "NONE": print(f"{log_prefix}: Removing stopwords ... ", end="", flush= not parallel_processing)
-    df["speech_content_stopword"] = df["speech_content_cleaned"].apply(remove_stopwords)
-    if stopword_mode.upper() != "NONE": print(f"{log_prefix}: Done.")
+    # row-level stages: contributions, cleaning, stopwords, lemmas, stems, tokens and counts
+    row_options = dict(
+        contributions=contributions,
+        to_lower=to_lower,
+        remove_digits=remove_digits,
+        remove_punctuation=remove_punctuation,
+        phrase_patterns=phrase_patterns,
+        stopword_mode=stopword_mode,
+        all_stopwords=all_sw,
+        lemmatization=lemmatization,
+        stemming=stemming,
+        tokenization_method=tokenization_method,
+        add_char_count=add_char_count,
+        add_token_count=add_token_count,
+        add_lemma_count=add_lemma_count,
+        spacy_batch_size=spacy_batch_size,
+        parallel_processing=parallel_processing,
+    )
 
-    # lemmatize speeches after stopwords have been removed
-    if lemmatization: print(f"{log_prefix}: Lemmatizing speeches ... ", end="", flush= not parallel_processing)
-    if stopword_mode.upper() != "NONE":
-        df["speech_content_lemmatized"] = df["speech_content_stopword"].apply(lemmatize_text)
-    else:
-        df["speech_content_lemmatized"] = df["speech_content_cleaned"].apply(lemmatize_text)
-    if lemmatization: print(f"{log_prefix}: Done.")
+    def save_profile_report() -> None:
+        """
+        Saves the records of all stages to `profile_report_path` (if given).
+        """
+        if profile_report_path:
+            write_profile_report(profiler.to_records(), profile_report_path)
+            print(f"{log_prefix}: [profile] Saved stage report to <{profile_report_path}>.")
 
-    # stem speeches after stopwords have been removed
-    if stemming: print(f"{log_prefix}: Stemming speeches ... ", end="", flush= not parallel_processing)
-    if stopword_mode.upper() != "NONE":
-        df["speech_content_stemmed"] = df["speech_content_stopword"].apply(stem_text)
-    else:
-        df["speech_content_stemmed"] = df["speech_content_cleaned"].apply(stem_text)
-    if stemming: print(f"{log_prefix}: Done.")
+    def run_row_stages(data: pd.DataFrame, completed_stages: int, prefix: str) -> pd.DataFrame:
+        """
+        Runs the row-level stages on the given speeches, sharded on `shard_executor` if configured.
 
-    # tokenize speeches after stopwords have been removed
-    if tokenization_method.upper() != "NONE": print(f"{log_prefix}: Tokenizing speeches ... ", end="", flush= not parallel_processing)
-    if stopword_mode.upper() != "NONE":
-        df["speech_content_tokenized"] = df["speech_content_stopword"].apply(lambda t: tokenize_text(t))
-    else:
-        df["speech_content_tokenized"] = df["speech_content_cleaned"].apply(lambda t: tokenize_text(t))
-    if tokenization_method.upper() != "NONE":print(f"{log_prefix}: Done.")
-
-    # add speech_length_char column for next step
-    if add_char_count: print(f"{log_prefix}: Counting chars ... ", end="", flush= not parallel_processing)
-    if stemming: # use stemmed speech content
-        df["speech_length_chars"] = df["speech_content_stemmed"].apply(char_count)
-    elif stopword_mode.upper() != "NONE": # use stop-word-cleaned speech content
-        df["speech_length_chars"] = df["speech_content_stopword"].apply(char_count)
-    else:
-        df["speech_length_chars"] = df["speech_content_cleaned"].apply(char_count)
-    if add_char_count: print(f"{log_prefix}: Done.")
+        :param: data (pd.DataFrame): Filtered speeches.
+        :param: completed_stages (int): Number of stages already taken from the stage cache.
+        :param: prefix (str): Log prefix.
+
+        :return: data (pd.DataFrame): The processed speeches.
+        """
+        if shard_executor is not None and shard_size and len(data) > shard_size:
+            return process_speech_rows_sharded(data, contribution_index, dict(row_options, completed_stages=completed_stages), shard_executor, shard_size, profiler, prefix)
+        return process_speech_rows(data, contribution_index=contribution_index, completed_stages=completed_stages, profiler=profiler, log_prefix=prefix, **row_options)
+
+    # streaming mode: read, process and write chunk by chunk
+    if chunk_size:
+        if stage_cache_dir:
+            print(f"{log_prefix}: [WARNING] The stage cache is not used in streaming mode.")
+        if output_path_excel:
+            print(f"{log_prefix}: [WARNING] Skipping Excel export in streaming mode.")
+        streaming_output_path = output_path_parquet or output_path_pickle.with_suffix(".parquet")
+        print(f"{log_prefix}: Streaming mode: chunks of {chunk_size} speeches are written to <{streaming_output_path}>.")
+
+        # build the (speech_id, text_position) -> content index once for all chunks
+        del df
+        if contributions.upper() == "INSERT" and not contributions_simplified_df.empty:
+            contribution_index = build_contribution_index(contributions_simplified_df)
+
+        # running sums for the summary statistics
+        valid_ids = set()
+        content_chars, content_rows = 0, 0
+        stopword_chars, stopword_rows = 0, 0
+        token_sum, token_rows = 0, 0
+
+        with ChunkedParquetWriter(streaming_output_path, compression=parquet_compression) as writer:
+            chunks = iter_speech_data(input_path, chunk_size)
+            for chunk_number in itertools.count(1):
+                load_start = time.perf_counter()
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                assert "speech_content" in chunk.columns, "Input file must contain 'speech_content' column."
+                profiler.add("load", time.perf_counter() - load_start, len(chunk), text_chars(chunk["speech_content"]), process_peak_rss_mb())
+                chunk_prefix = f"{log_prefix} [chunk {chunk_number}]"
+
+                # filter for relevant rows (deletes all irrelevant rows)
+                with profiler.stage("filter", len(chunk)):
+                    print(f"{chunk_prefix}: Filter data frame ... ", end="", flush= not parallel_processing)
+                    chunk = initial_data_filter(chunk)
+                    print(f"{chunk_prefix}: Done.")
+                valid_ids.update(chunk["id"])
+                if chunk.empty:
+                    continue
+
+                chunk = run_row_stages(chunk, 0, chunk_prefix)
+
+                with profiler.stage("save", len(chunk)):
+                    print(f"{chunk_prefix}: Save cleaned data ... ", end="", flush= not parallel_processing)
+                    writer.write(chunk)
+                    print(f"{chunk_prefix}: Done.")
+
+                content_lengths = chunk["speech_content"].str.len()
+                content_chars, content_rows = content_chars + content_lengths.sum(), content_rows + content_lengths.count()
+                stopword_lengths = chunk["speech_content_stopword"].str.len()
+                stopword_chars, stopword_rows = stopword_chars + stopword_lengths.sum(), stopword_rows + stopword_lengths.count()
+                token_sum, token_rows = token_sum + chunk["speech_length_tokens"].sum(), token_rows + chunk["speech_length_tokens"].count()
+
+        if writer.rows == 0:
+            print(f"{log_prefix}: [WARNING] No speeches left after filtering, no output file was written.")
+        if generate_contributions_data:
+            save_filtered_contributions(valid_ids)
+
+        # give short overview of overall data loss
+        print(f"{log_prefix}: Avg char length before cleaning:", content_chars / content_rows if content_rows else np.nan)
+        print(f"{log_prefix}: Avg char length after cleaning:", stopword_chars / stopword_rows if stopword_rows else np.nan)
+        print(f"{log_prefix}: Avg token count:", token_sum / token_rows if token_rows else np.nan)
+        save_profile_report()
+        return
 
-    # add speech_length_lemmas column for next step
-    if add_lemma_count: print(f"{log_prefix}: Counting chars ... ", end="", flush= not parallel_processing)
-    df["speech_length_lemmas"] = df["speech_content_lemmatized"].apply(lemma_count)
-    if add_lemma_count: print(f"{log_prefix}: Done.")
+    # filter for relevant rows (deletes all irrelevant rows)
+    with profiler.stage("filter", len(df)):
+        print(f"{log_prefix}: Filter data frame ... ", end="", flush= not parallel_processing)
+        df = initial_data_filter(df)
+        print(f"{log_prefix}: Done.")
 
-    # add speech_length_tokens column for next step
-    if add_token_count: print(f"{log_prefix}: Counting chars ... ", end="", flush= not parallel_processing)
-    df["speech_length_tokens"] = df["speech_content_tokenized"].apply(token_count)
-    if add_token_count: print(f"{log_prefix}: Done.")
+    # reuse the longest prefix of stages another config with the same input and parameters has already computed
+    completed_stages = 0
+    if stage_cache_dir:
+        with profiler.stage("stage_cache", len(df)):
+            stage_cache = StageCache(stage_cache_dir, stage_cache_max_bytes)
+            cache_keys = stage_keys(
+                {
+                    "input": file_hash(input_path),
+                    "position_short": position_short,
+                    "only_valid_faction_id": only_valid_faction_id,
+                    "without_faction": without_faction,
+                    "change_faction": change_faction,
+                },
+                [
+                    {"contributions": contributions.upper(),
+                     "contributions_simplified": file_hash(simplified_path) if contributions.upper() == "INSERT" else None},
+                    {"to_lower": to_lower, "remove_digits": remove_digits, "remove_punctuation": remove_punctuation,
+                     "phrase_patterns": list(phrase_patterns or [])},
+                    {"stopword_mode": stopword_mode.upper(), "stopwords": sorted(all_sw)},
+                    {"lemmatization": lemmatization, "tokenization_method": tokenization_method.upper() == "SPACY",
+                     "spacy": spacy.__version__, "spacy_model": spacy.util.get_package_version("de_core_news_sm")},
+                    {"stemming": stemming, "nltk": nltk.__version__},
+                    {"tokenization_method": tokenization_method.upper(), "nltk": nltk.__version__},
+                ],
+            )
+            for cache_key in cache_keys:
+                cached_columns = stage_cache.load(cache_key, df.index)
+                if cached_columns is None:
+                    break
+                for column in cached_columns.columns:
+                    df[column] = cached_columns[column]
+                completed_stages += 1
+            if completed_stages:
+                print(f"{log_prefix}: [stage cache] Reusing {completed_stages} of {len(PREPROCESSING_STAGES)} stages: {', '.join(PREPROCESSING_STAGES[:completed_stages])}.")
+
+    # build the (speech_id, text_position) -> content index once for the whole run
+    if completed_stages == 0 and contributions.upper() == "INSERT" and not contributions_simplified_df.empty:
+        contribution_index = build_contribution_index(contributions_simplified_df)
+
+    # row-level stages: contributions, cleaning, stopwords, lemmas, stems, tokens and counts
+    df = run_row_stages(df, completed_stages, log_prefix)
+
+    # store the output columns of every newly computed stage
+    if stage_cache_dir:
+        with profiler.stage("stage_cache", len(df)):
+            for stage, cache_key in list(zip(PREPROCESSING_STAGES, cache_keys))[completed_stages:]:
+                stage_cache.store(cache_key, df[stage_output_columns(stage, stopword_mode, tokenization_method)])
+            stage_cache.evict()
 
     # save cleaned data
-    print(f"{log_prefix}: Save cleaned data ... ", end="", flush= not parallel_processing)
-    if output_path_pickle:
-        output_path_pickle.parent.mkdir(parents=True, exist_ok=True)
-        df.to_pickle(output_path_pickle)
-    if output_path_excel:
-        output_path_excel.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            df.to_excel(output_path_excel, index=False)
-        except ModuleNotFoundError as e:
-            print(f"{log_prefix}: [WARNING] Skipping Excel export because of EXCEPTION: {e}")
-    print(f"{log_prefix}: Done.")
+    with profiler.stage("save", len(df)):
+        print(f"{log_prefix}: Save cleaned data ... ", end="", flush= not parallel_processing)
+        if output_path_pickle:
+            output_path_pickle.parent.mkdir(parents=True, exist_ok=True)
+            df.to_pickle(output_path_pickle)
+        if output_path_excel:
+            output_path_excel.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                df.to_excel(output_path_excel, index=False)
+            except ModuleNotFoundError as e:
+                print(f"{log_prefix}: [WARNING] Skipping Excel export because of EXCEPTION: {e}")
+        if output_path_parquet:
+            output_path_parquet.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                save_speech_data(df, output_path_parquet, compression=parquet_compression)
+            except ModuleNotFoundError as e:
+                print(f"{log_prefix}: [WARNING] Skipping Parquet export because of EXCEPTION: {e}")
+        print(f"{log_prefix}: Done.")
 
 
     # give short overview of overall data loss
     print(f"{log_prefix}: Avg char length before cleaning:", df["speech_content"].str.len().mean())
     print(f"{log_prefix}: Avg char length after cleaning:", df["speech_content_stopword"].str.len().mean())
     print(f"{log_prefix}: Avg token count:", df["speech_length_tokens"].mean())
+    save_profile_report()
 
 
 
@@ -0,0 +1,160 @@
+
+# imports
+import os
+import json
+import pickle
+import hashlib
+import tempfile
+import pandas as pd
+from pathlib import Path
+
+
+# bump whenever the output of a preprocessing stage changes for the same parameters
+STAGE_CACHE_VERSION = 1
+
+# (resolved path, mtime, size) -> sha256, so every input file is only hashed once per process
+_file_hashes = {}
+
+
+def file_hash(path) -> str:
+    """
+    Returns the sha256 hex digest of a file's content. The digest is memoized per process and
+    recomputed as soon as the modification time or size of the file changes.
+
+    :param: path (str or Path): Path to the file.
+
+    :return: digest (str): sha256 hex digest of the file content.
+
+    :raises: FileNotFoundError: If the file does not exist.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    memo_key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    if memo_key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        _file_hashes[memo_key] = digest.hexdigest()
+
+    return _file_hashes[memo_key]
+
+
+
+def stage_keys(base_params: dict, stage_params: list[dict]) -> list[str]:
+    """
+    Builds one content-addressed key per stage. Every key hashes the key of the previous stage together with
+    the (JSON-normalized) parameters of its own stage, so two configs share the key of stage n exactly if they
+    share the input and all parameters of the stages 1..n.
+
+    :param: base_params (dict): Parameters every stage depends on (e.g. input file hash and row filters).
+    :param: stage_params (list[dict]): Parameters of every stage, in pipeline order.
+
+    :return: keys (list[str]): One sha256 hex key per stage.
+    """
+    def normalize(params):
+        return json.dumps(params, sort_keys=True, default=str)
+
+    keys = []
+    previous_key = hashlib.sha256(f"{STAGE_CACHE_VERSION}|{normalize(base_params)}".encode("utf-8")).hexdigest()
+    for params in stage_params:
+        previous_key = hashlib.sha256(f"{previous_key}|{normalize(params)}".encode("utf-8")).hexdigest()
+        keys.append(previous_key)
+
+    return keys
+
+
+
+class StageCache:
+    """
+    On-disk cache for the output columns of single preprocessing stages, shared by all dataset configs
+    (and processes) that point to the same cache directory. Entries are pickled DataFrames named after their
+    stage key. Whenever the directory grows beyond `max_bytes`, the least recently used entries are deleted
+    (usage is tracked via the modification time, which is refreshed on every hit).
+    """
+
+    def __init__(self, cache_dir, max_bytes: int = 2 * 1024 ** 3):
+        """
+        :param: cache_dir (str or Path): Directory of the cache (created if necessary).
+        :param: max_bytes (int): Maximum total size of all cache entries in bytes.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+
+    def load(self, key: str, index: pd.Index = None):
+        """
+        Loads a cached stage output.
+
+        :param: key (str): Stage key built by `stage_keys`.
+        :param: index (pd.Index): Expected row index. Entries with a different index are treated as missing.
+
+        :return: frame (pd.DataFrame): The cached columns, or None if there is no (valid) entry.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            frame = pd.read_pickle(entry_path)
+            os.utime(entry_path)  # mark as recently used
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError):
+            # missing, evicted by another process in the meantime, incomplete or corrupt
+            return None
+
+        if index is not None and not frame.index.equals(index):
+            return None
+        return frame
+
+
+    def store(self, key: str, frame: pd.DataFrame) -> None:
+        """
+        Stores a stage output atomically (written to a temporary file first, then renamed). Every call writes
+        its own temporary file, so several threads or processes can store the same key at the same time.
+
+        :param: key (str): Stage key built by `stage_keys`.
+        :param: frame (pd.DataFrame): The output columns of the stage.
+
+        :return: None
+        """
+        entry_path = self._entry_path(key)
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                frame.to_pickle(f)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+    def evict(self) -> int:
+        """
+        Deletes the least recently used entries until the cache is not larger than `max_bytes`.
+
+        :return: removed (int): Number of deleted entries.
+        """
+        entries = []
+        for entry_path in self.cache_dir.glob("*.pkl"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                entry_path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+        return removed
@@ -0,0 +1,200 @@
+
+# imports
+import csv
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+
+# columns of every report (JSON records and CSV rows)
+REPORT_FIELDS = ["dataset", "stage", "calls", "wall_seconds", "rows", "chars", "rows_per_second", "chars_per_second", "process_peak_rss_mb"]
+
+
+def process_peak_rss_mb():
+    """
+    Returns the peak resident set size (high-water mark) of the current process in MB. This is the peak over the
+    whole lifetime of the process (shared by all threads), it never decreases and can not be attributed to a
+    single stage.
+
+    :return: peak (float): Peak RSS in MB, or None if it cannot be determined (e.g. on Windows).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in bytes on macOS and in kilobytes on Linux
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+
+class StageProfiler:
+    """
+    Records wall time, processed rows and characters and the process peak memory of the stages of one
+    preprocessing run. Repeated stages (chunks, shards) are accumulated into one record per stage.
+    `process_peak_rss_mb` of a stage is the peak RSS of the process when the stage ended (including all earlier
+    stages and concurrent dataset threads), not the memory used by the stage itself.
+    """
+
+    def __init__(self, dataset: str = ""):
+        """
+        :param: dataset (str): Name of the dataset config, written into every record.
+        """
+        self.dataset = dataset
+        self.records = {}
+
+
+    def add(self, stage: str, wall_seconds: float, rows: int = 0, chars: int = 0, process_peak_rss: float = None, calls: int = 1) -> None:
+        """
+        Adds a measurement to the record of a stage.
+
+        :param: stage (str): Stage name, e.g. "clean".
+        :param: wall_seconds (float): Wall time of the stage.
+        :param: rows (int): Number of rows processed by the stage.
+        :param: chars (int): Number of input characters processed by the stage.
+        :param: process_peak_rss (float): Peak RSS of the process in MB after the stage (see `process_peak_rss_mb`).
+        :param: calls (int): Number of stage executions the measurement covers.
+
+        :return: None
+        """
+        record = self.records.setdefault(stage, {"calls": 0, "wall_seconds": 0.0, "rows": 0, "chars": 0, "process_peak_rss_mb": None})
+        record["calls"] += calls
+        record["wall_seconds"] += wall_seconds
+        record["rows"] += int(rows)
+        record["chars"] += int(chars)
+        if process_peak_rss is not None:
+            record["process_peak_rss_mb"] = max(record["process_peak_rss_mb"] or 0.0, process_peak_rss)
+
+
+    @contextmanager
+    def stage(self, stage: str, rows: int = 0, chars: int = 0):
+        """
+        Measures the wall time of the enclosed block and adds it to the record of the stage.
+        Rows/chars that are only known at the end of the block can be set on the yielded dict.
+
+        :param: stage (str): Stage name, e.g. "clean".
+        :param: rows (int): Number of rows processed by the stage.
+        :param: chars (int): Number of input characters processed by the stage.
+
+        :return: counts (dict): {"rows": rows, "chars": chars}, can be updated inside the block.
+        """
+        counts = {"rows": rows, "chars": chars}
+        start = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            self.add(stage, time.perf_counter() - start, counts["rows"], counts["chars"], process_peak_rss_mb())
+
+
+    def merge(self, records: list[dict]) -> None:
+        """
+        Adds the records of another profiler (e.g. of a shard processed in a worker process).
+
+        :param: records (list[dict]): Records as returned by `to_records`.
+
+        :return: None
+        """
+        for record in records:
+            self.add(record["stage"], record["wall_seconds"], record["rows"], record["chars"], record["process_peak_rss_mb"], record["calls"])
+
+
+    def to_records(self) -> list[dict]:
+        """
+        :return: records (list[dict]): One record per stage (in execution order) with the fields of `REPORT_FIELDS`.
+        """
+        records = []
+        for stage, record in self.records.items():
+            wall_seconds = record["wall_seconds"]
+            records.append({
+                "dataset": self.dataset,
+                "stage": stage,
+                "calls": record["calls"],
+                "wall_seconds": round(wall_seconds, 6),
+                "rows": record["rows"],
+                "chars": record["chars"],
+                "rows_per_second": round(record["rows"] / wall_seconds, 1) if wall_seconds > 0 else None,
+                "chars_per_second": round(record["chars"] / wall_seconds, 1) if wall_seconds > 0 and record["chars"] else None,
+                "process_peak_rss_mb": record["process_peak_rss_mb"],
+            })
+        return records
+
+
+
+def write_profile_report(records: list[dict], path) -> None:
+    """
+    Writes profiling records as JSON (.json) or CSV (.csv) file, depending on the file suffix.
+
+    :param: records (list[dict]): Records with the fields of `REPORT_FIELDS`.
+    :param: path (str or Path): Path to the .json or .csv file.
+
+    :return: None
+
+    :raises: ValueError: If the file suffix is neither .json nor .csv.
+    """
+    path = Path(path)
+    if path.suffix not in (".json", ".csv"):
+        raise ValueError(f"write_profile_report: [ERROR]: Unsupported file type '{path.suffix}', expected '.json' or '.csv'")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".json":
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+
+
+
+def read_profile_report(path) -> list[dict]:
+    """
+    Reads a report written by `write_profile_report` (the field `peak_rss_mb` of older reports is read as
+    `process_peak_rss_mb`).
+
+    :param: path (str or Path): Path to the .json or .csv file.
+
+    :return: records (list[dict]): The profiling records.
+
+    :raises: ValueError: If the file suffix is neither .json nor .csv.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+        for record in records:
+            if "peak_rss_mb" in record:
+                record["process_peak_rss_mb"] = record.pop("peak_rss_mb")
+        return records
+    if path.suffix == ".csv":
+        with open(path, encoding="utf-8", newline="") as f:
+            records = list(csv.DictReader(f))
+        for record in records:
+            if "peak_rss_mb" in record:
+                record["process_peak_rss_mb"] = record.pop("peak_rss_mb")
+            for field in ("calls", "rows", "chars"):
+                record[field] = int(record[field])
+            for field in ("wall_seconds", "rows_per_second", "chars_per_second", "process_peak_rss_mb"):
+                record[field] = float(record[field]) if record[field] not in ("", None) else None
+        return records
+    raise ValueError(f"read_profile_report: [ERROR]: Unsupported file type '{path.suffix}', expected '.json' or '.csv'")
+
+
+
+def aggregate_profile_records(records: list[dict]) -> list[dict]:
+    """
+    Aggregates the records of several datasets: keeps every per-dataset record and appends one
+    record per stage summed over all datasets (dataset "ALL").
+
+    :param: records (list[dict]): Records of all datasets.
+
+    :return: aggregated (list[dict]): Per-dataset records followed by the per-stage totals.
+    """
+    total = StageProfiler("ALL")
+    total.merge(records)
+    return list(records) + total.to_records()